@@ -1,5 +1,3 @@
-import time
-
 import pytest
 
 from pages.azercell_login_page import AzercellLoginPage
@@ -83,8 +81,9 @@ def test_phone_submit_navigates_forward(login_page, phone_number):
                 "Form submission failed - button may be disabled or phone invalid"
             )
 
-    # Allow extra time for navigation (some sites are slow)
-    time.sleep(4)
+    # Allow extra time for navigation (some sites are slow); returns as
+    # soon as the page moves on
+    login_page.wait_for_url_change(initial_url, timeout=4)
 
     final_url = login_page.driver.current_url
 
@@ -100,6 +99,7 @@ def test_phone_submit_navigates_forward(login_page, phone_number):
     print(f"  URL changed: {url_changed}")
     print(f"  On OTP page: {on_otp}")
     print(f"  On password page: {on_password}")
+    print(f"  Send-OTP request: {login_page.last_submit_request}")
 
     if url_changed or on_otp or on_password:
         # Success - at least one condition met
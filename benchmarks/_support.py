@@ -0,0 +1,109 @@
+"""Shared helpers for the benchmark commands."""
+
+import contextlib
+import functools
+import http.server
+import os
+import pathlib
+import shutil
+import threading
+import time
+from typing import Iterator, Optional
+
+import psutil
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils import readiness
+from utils.process_stats import tree_rss_bytes
+
+FIXTURES_DIR = pathlib.Path(__file__).resolve().parent / "fixtures"
+
+
+def resolve_chromedriver() -> None:
+    """
+    Resolve the chromedriver path once, before anything is timed.
+
+    Without CHROMEDRIVER_PATH or a chromedriver on PATH,
+    ``conftest._create_driver`` asks webdriver_manager on every launch,
+    which adds cache/network I/O to the measured start-up.
+    """
+    if os.getenv("CHROMEDRIVER_PATH") or shutil.which("chromedriver"):
+        return
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    os.environ["CHROMEDRIVER_PATH"] = ChromeDriverManager().install()
+
+
+def load_page(driver: WebDriver, url: str) -> None:
+    """
+    driver.get that also waits for the load event under READINESS_GATE=1,
+    where driver.get itself returns as soon as the navigation starts.
+    """
+    if not readiness.is_gated(driver):
+        driver.get(url)
+        return
+    previous = readiness.document_origin(driver)
+    driver.get(url)
+    readiness.wait_for_load(driver, driver.timeouts.page_load, previous)
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@contextlib.contextmanager
+def serve_directory(directory: pathlib.Path = FIXTURES_DIR) -> Iterator[str]:
+    """
+    Serve a directory over HTTP on a free localhost port.
+
+    Yields the base URL (with trailing slash). A real HTTP origin is used
+    instead of file:// so navigation timing matches the live site more
+    closely.
+    """
+    handler = functools.partial(_QuietHandler, directory=str(directory))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address[:2]
+        yield f"http://{host}:{port}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class PeakRssSampler:
+    """Background sampler recording the peak RSS of a process tree."""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._root: Optional[psutil.Process] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def attach(self, root: Optional[psutil.Process]) -> None:
+        """Start sampling once the root process is known."""
+        self._root = root
+        if root is None or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.sample()
+            time.sleep(self.interval)
+
+    def sample(self) -> None:
+        if self._root is None:
+            return
+        self.peak_bytes = max(self.peak_bytes, tree_rss_bytes(self._root))
+
+    def stop(self) -> int:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+        self.sample()
+        return self.peak_bytes
@@ -0,0 +1,193 @@
+"""
+Driver startup benchmark for the ``chrome_options`` flag set.
+
+Launches Chrome repeatedly through ``conftest._create_driver`` under named
+option profiles and reports, per profile:
+
+- cold start: driver creation with a fresh, empty user-data-dir
+- warm start: driver creation reusing a profile a previous launch created
+- first navigation: ``driver.get`` of a local stand-in login page
+- peak RSS of the chromedriver/Chrome process tree during navigation
+
+Each metric is reported as mean ± 95% confidence interval. chromedriver
+is resolved once up front, so webdriver_manager lookups are not part of
+the measured start-up.
+
+Usage:
+    python -m benchmarks.driver_startup
+    python -m benchmarks.driver_startup --profiles default,eager -n 10
+    python -m benchmarks.driver_startup --json reports/bench/startup.json
+"""
+
+import argparse
+import json
+import logging
+import pathlib
+import shutil
+import tempfile
+import time
+from typing import Callable
+
+from selenium.webdriver.chrome.options import Options
+
+from benchmarks._support import (
+    PeakRssSampler,
+    load_page,
+    resolve_chromedriver,
+    serve_directory,
+)
+from conftest import _build_chrome_options, _create_driver
+from utils.process_stats import driver_process
+from utils.stats import summarize
+
+log = logging.getLogger(__name__)
+
+HEADLESS_NEW = "--headless=new"
+VIZ_FLAG = "--disable-features=VizDisplayCompositor"
+
+
+def _drop_argument(opts: Options, argument: str) -> None:
+    if argument in opts.arguments:
+        opts.arguments.remove(argument)
+
+
+def _no_viz_flag(opts: Options) -> None:
+    _drop_argument(opts, VIZ_FLAG)
+
+
+def _eager(opts: Options) -> None:
+    opts.page_load_strategy = "eager"
+
+
+def _normal(opts: Options) -> None:
+    opts.page_load_strategy = "normal"
+
+
+def _minimal(opts: Options) -> None:
+    keep = {HEADLESS_NEW, "--no-sandbox", "--disable-dev-shm-usage"}
+    opts.arguments[:] = [a for a in opts.arguments if a in keep]
+
+
+# Profile name -> mutation applied on top of the default chrome_options.
+PROFILES: dict[str, Callable[[Options], None]] = {
+    "default": lambda opts: None,
+    "no-viz-flag": _no_viz_flag,
+    "eager": _eager,
+    "normal": _normal,
+    "minimal": _minimal,
+}
+
+
+def build_profile_options(name: str, user_data_dir: str) -> Options:
+    opts = _build_chrome_options()
+    PROFILES[name](opts)
+    opts.add_argument(f"--user-data-dir={user_data_dir}")
+    return opts
+
+
+def _launch_once(name: str, user_data_dir: str, url: str) -> dict[str, float]:
+    started = time.perf_counter()
+    driver = _create_driver(build_profile_options(name, user_data_dir))
+    startup = time.perf_counter() - started
+
+    sampler = PeakRssSampler()
+    try:
+        sampler.attach(driver_process(driver))
+        nav_started = time.perf_counter()
+        load_page(driver, url)
+        navigation = time.perf_counter() - nav_started
+    finally:
+        peak = sampler.stop()
+        driver.quit()
+
+    return {
+        "startup_s": startup,
+        "navigation_s": navigation,
+        "peak_rss_mb": peak / (1024 * 1024),
+    }
+
+
+def run_profile(name: str, iterations: int, url: str) -> dict:
+    """Run ``iterations`` cold+warm launch pairs for one profile."""
+    cold: list[dict[str, float]] = []
+    warm: list[dict[str, float]] = []
+
+    for i in range(iterations):
+        profile_dir = tempfile.mkdtemp(prefix=f"bench-{name}-")
+        try:
+            cold.append(_launch_once(name, profile_dir, url))
+            warm.append(_launch_once(name, profile_dir, url))
+        finally:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+        log.info("%s: iteration %d/%d done", name, i + 1, iterations)
+
+    def _metric(runs: list[dict[str, float]], key: str) -> dict[str, float]:
+        return summarize([r[key] for r in runs])
+
+    return {
+        "cold_start_s": _metric(cold, "startup_s"),
+        "warm_start_s": _metric(warm, "startup_s"),
+        "first_navigation_s": _metric(cold, "navigation_s"),
+        "warm_navigation_s": _metric(warm, "navigation_s"),
+        "peak_rss_mb": _metric(cold + warm, "peak_rss_mb"),
+    }
+
+
+def _format_row(name: str, result: dict) -> str:
+    def cell(key: str, scale: float = 1.0, unit: str = "") -> str:
+        m = result[key]
+        return f"{m['mean'] * scale:8.1f} ± {m['ci95'] * scale:6.1f}{unit}"
+
+    return (
+        f"{name:<14}"
+        f"{cell('cold_start_s', 1000, 'ms')}  "
+        f"{cell('warm_start_s', 1000, 'ms')}  "
+        f"{cell('first_navigation_s', 1000, 'ms')}  "
+        f"{cell('peak_rss_mb', 1, 'MB')}"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--profiles",
+        default=",".join(PROFILES),
+        help=f"Comma-separated profiles (available: {', '.join(PROFILES)}).",
+    )
+    parser.add_argument(
+        "-n", "--iterations", type=int, default=5, help="Launches per profile."
+    )
+    parser.add_argument("--json", dest="json_path", help="Write results as JSON.")
+    args = parser.parse_args(argv)
+
+    names = [p.strip() for p in args.profiles.split(",") if p.strip()]
+    unknown = [n for n in names if n not in PROFILES]
+    if unknown:
+        parser.error(f"Unknown profile(s): {', '.join(unknown)}")
+
+    resolve_chromedriver()
+    results: dict[str, dict] = {}
+    with serve_directory() as base_url:
+        url = base_url + "login.html"
+        for name in names:
+            results[name] = run_profile(name, args.iterations, url)
+
+    print(
+        f"\n{'profile':<14}{'cold start':>19}  {'warm start':>19}  "
+        f"{'first nav':>19}  {'peak RSS':>19}"
+    )
+    for name, result in results.items():
+        print(_format_row(name, result))
+
+    if args.json_path:
+        out = pathlib.Path(args.json_path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"iterations": args.iterations, "profiles": results}
+        out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"\nResults written to: {out}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,266 @@
+"""
+In-browser evaluation cost of the page objects' class-level locators.
+
+Loads each target page and times, inside the browser, how long every
+CSS/XPath locator declared on the page object takes to evaluate
+(``querySelectorAll`` / ``document.evaluate``) and how many nodes it
+matches. Every poll of every wait re-evaluates its locator, so a selector
+that costs 1 ms here costs 1 ms per poll on top of the WebDriver round
+trip. Locators above ``--threshold-us`` are flagged.
+
+Each sample runs the locator ``--reps`` times back to back and divides,
+because ``performance.now()`` is coarsened to ~0.1 ms; the reported
+figure is the median of ``--samples`` such samples.
+
+Usage:
+    python -m benchmarks.locator_cost
+    python -m benchmarks.locator_cost --fixtures login_errors.html
+    python -m benchmarks.locator_cost --url https://kabinetim.azercell.com/login
+    python -m benchmarks.locator_cost --threshold-us 50 --fail-on-slow \\
+        --json reports/bench/locators.json
+"""
+
+import argparse
+import importlib
+import json
+import logging
+import pathlib
+import time
+from typing import Optional
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from benchmarks._support import FIXTURES_DIR, load_page, serve_directory
+from conftest import _build_chrome_options, _create_driver
+from pages.base_page import BasePage, _by_value
+from utils.stats import percentile
+
+log = logging.getLogger(__name__)
+
+DEFAULT_PAGE = "pages.azercell_login_page:AzercellLoginPage"
+
+# How chromedriver itself turns the simple strategies into CSS.
+_AS_CSS = {
+    By.CSS_SELECTOR: "{}",
+    By.ID: '[id="{}"]',
+    By.NAME: '[name="{}"]',
+    By.CLASS_NAME: ".{}",
+    By.TAG_NAME: "{}",
+}
+
+_EVALUATE_JS = """
+const [locators, reps, samples] = arguments;
+const evaluate = {
+  css: (v) => document.querySelectorAll(v).length,
+  xpath: (v) => document.evaluate(
+    v, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+  ).snapshotLength,
+};
+return locators.map(([kind, value]) => {
+  const run = evaluate[kind];
+  let matches;
+  try {
+    matches = run(value);
+  } catch (e) {
+    return {error: String(e)};
+  }
+  const times = [];
+  for (let s = 0; s < samples; s++) {
+    const start = performance.now();
+    for (let i = 0; i < reps; i++) {
+      run(value);
+    }
+    times.push((performance.now() - start) / reps);
+  }
+  return {matches: matches, times: times};
+});
+"""
+
+
+def page_locators(page_cls: type) -> dict[str, tuple[str, str]]:
+    """
+    UPPER_CASE class attributes of ``page_cls`` that are locators.
+
+    Aliases (e.g. READY_WHEN = PHONE_INPUT) are listed once, under the
+    first name in alphabetical order.
+    """
+    locators: dict[str, tuple[str, str]] = {}
+    for name in sorted(dir(page_cls)):
+        if not name.isupper() or name.startswith("_"):
+            continue
+        value = getattr(page_cls, name)
+        if not isinstance(value, tuple):
+            continue
+        try:
+            locator = _by_value(value)
+        except ValueError:
+            continue
+        if locator not in locators.values():
+            locators[name] = locator
+    return locators
+
+
+def _in_page_form(by: str, value: str) -> Optional[tuple[str, str]]:
+    if by == By.XPATH:
+        return "xpath", value
+    if by in _AS_CSS:
+        return "css", _AS_CSS[by].format(value)
+    return None  # link text: evaluated by chromedriver, not the page
+
+
+def measure(
+    driver: WebDriver,
+    locators: dict[str, tuple[str, str]],
+    reps: int,
+    samples: int,
+) -> dict[str, dict]:
+    """Per-locator cost (µs per evaluation) and match count on the current page."""
+    names, forms = [], []
+    results: dict[str, dict] = {}
+    for name, (by, value) in sorted(locators.items()):
+        form = _in_page_form(by, value)
+        if form is None:
+            results[name] = {"by": by, "skipped": "not evaluable in the page"}
+            continue
+        names.append(name)
+        forms.append(list(form))
+
+    raw = driver.execute_script(_EVALUATE_JS, forms, reps, samples)
+    for name, form, data in zip(names, forms, raw):
+        entry: dict = {"by": form[0]}
+        if "error" in data:
+            entry["error"] = data["error"]
+        else:
+            times_us = [t * 1000 for t in data["times"]]
+            entry.update(
+                matches=data["matches"],
+                p50_us=round(percentile(times_us, 50), 2),
+                max_us=round(max(times_us), 2),
+            )
+        results[name] = entry
+    return results
+
+
+def slow_locators(results: dict[str, dict], threshold_us: float) -> list[str]:
+    """Names whose median evaluation cost is above ``threshold_us``."""
+    return [
+        name
+        for name, entry in results.items()
+        if entry.get("p50_us", 0.0) > threshold_us
+    ]
+
+
+def format_table(results: dict[str, dict], threshold_us: float) -> list[str]:
+    lines = [f"{'locator':<28}{'by':>6}{'matches':>9}{'p50 µs':>10}{'max µs':>10}"]
+    ranked = sorted(results.items(), key=lambda kv: -kv[1].get("p50_us", -1.0))
+    for name, entry in ranked:
+        if "p50_us" not in entry:
+            note = entry.get("error") or entry.get("skipped", "")
+            lines.append(f"{name:<28}{entry['by']:>6}  {note}")
+            continue
+        flag = "  SLOW" if entry["p50_us"] > threshold_us else ""
+        lines.append(
+            f"{name:<28}{entry['by']:>6}{entry['matches']:>9}"
+            f"{entry['p50_us']:10.1f}{entry['max_us']:10.1f}{flag}"
+        )
+    return lines
+
+
+def _load_page_class(spec: str) -> type:
+    module_name, _, class_name = spec.partition(":")
+    page_cls = getattr(importlib.import_module(module_name), class_name)
+    if not (isinstance(page_cls, type) and issubclass(page_cls, BasePage)):
+        raise TypeError(f"{spec} is not a BasePage subclass")
+    return page_cls
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--page",
+        default=DEFAULT_PAGE,
+        help=f"Page object as module:Class (default {DEFAULT_PAGE}).",
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="Profile against this live page instead.")
+    target.add_argument(
+        "--fixtures",
+        help="Comma-separated fixture files (default: all in benchmarks/fixtures).",
+    )
+    parser.add_argument("--reps", type=int, default=200, help="Evaluations per sample.")
+    parser.add_argument("--samples", type=int, default=15, help="Samples per locator.")
+    parser.add_argument(
+        "--threshold-us",
+        type=float,
+        default=100.0,
+        help="Flag locators whose median cost is above this (µs).",
+    )
+    parser.add_argument(
+        "--fail-on-slow",
+        action="store_true",
+        help="Exit with status 1 when a locator is flagged.",
+    )
+    parser.add_argument("--json", dest="json_path", help="Write results as JSON.")
+    args = parser.parse_args(argv)
+
+    page_cls = _load_page_class(args.page)
+    locators = page_locators(page_cls)
+    if args.fixtures:
+        fixtures = [f.strip() for f in args.fixtures.split(",") if f.strip()]
+    else:
+        fixtures = sorted(p.name for p in FIXTURES_DIR.glob("*.html"))
+
+    results: dict[str, dict] = {}
+    driver = _create_driver(_build_chrome_options())
+    try:
+        if args.url:
+            load_page(driver, args.url)
+            results[args.url] = measure(driver, locators, args.reps, args.samples)
+        else:
+            with serve_directory() as base_url:
+                for fixture in fixtures:
+                    log.info("Profiling locators on %s", fixture)
+                    load_page(driver, base_url + fixture)
+                    results[fixture] = measure(
+                        driver, locators, args.reps, args.samples
+                    )
+    finally:
+        driver.quit()
+
+    flagged: set[str] = set()
+    for target_name, page_results in results.items():
+        print(f"\n{target_name}")
+        for line in format_table(page_results, args.threshold_us):
+            print(line)
+        flagged.update(slow_locators(page_results, args.threshold_us))
+
+    if flagged:
+        print(
+            f"\nAbove {args.threshold_us:g} µs on at least one page: "
+            + ", ".join(sorted(flagged))
+        )
+
+    if args.json_path:
+        payload = {
+            "meta": {
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "page": args.page,
+                "reps": args.reps,
+                "samples": args.samples,
+                "threshold_us": args.threshold_us,
+            },
+            "locators": {name: list(loc) for name, loc in locators.items()},
+            "results": results,
+            "slow": sorted(flagged),
+        }
+        out = pathlib.Path(args.json_path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"\nResults written to: {out}")
+
+    return 1 if flagged and args.fail_on_slow else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,370 @@
+"""
+Run the phone-number login flow for many numbers concurrently.
+
+Every number gets its own WebDriver and goes through
+``AzercellLoginPage`` (open login page -> enter number -> submit) on a
+bounded thread pool driven by asyncio:
+
+- at most ``concurrency`` browsers are alive at once
+- each flow has its own timeout; on timeout (or when the whole run is
+  cancelled, e.g. Ctrl-C) the flow's driver is quit, which makes the
+  blocked WebDriver call in the worker thread fail fast, and the flow's
+  slot is only handed on once that thread has returned
+- every flow produces one LoginFlowResult (status, OTP reached,
+  validation error text, per-step timings) - errors never abort the run
+
+Usage:
+    python -m benchmarks.login_matrix numbers.txt -c 4
+    python -m benchmarks.login_matrix --phones 501234567,551234567 \\
+        --csv reports/login_matrix.csv --json reports/login_matrix.json
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import os
+import pathlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from typing import Callable, Iterable, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+from benchmarks._support import resolve_chromedriver
+from utils.phone import normalize_phone_number
+
+log = logging.getLogger(__name__)
+
+DriverFactory = Callable[[], WebDriver]
+
+# Final statuses, in the order they are listed in the summary.
+STATUSES = (
+    "otp",
+    "submitted",
+    "validation_error",
+    "not_submitted",
+    "login_page_unavailable",
+    "timeout",
+    "cancelled",
+    "error",
+)
+
+
+@dataclass
+class LoginFlowResult:
+    """Outcome of one number's login flow."""
+
+    phone: str
+    status: str = "error"
+    reached_otp: bool = False
+    validation_error: str = ""
+    final_url: str = ""
+    error: str = ""
+    duration_s: float = 0.0
+    # Seconds per step ("driver", "open", "enter", "submit", "check").
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+Flow = Callable[[WebDriver, LoginFlowResult], None]
+
+
+def _mask(phone: str) -> str:
+    return f"{phone[:2]}***{phone[-2:]}" if len(phone) > 4 else "***"
+
+
+class _Timer:
+    def __init__(self, result: LoginFlowResult, step: str):
+        self.result = result
+        self.step = step
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.result.timings[self.step] = round(time.perf_counter() - self.started, 3)
+
+
+def login_flow(driver: WebDriver, result: LoginFlowResult) -> None:
+    """
+    Default flow: open the login page, enter and submit the number.
+
+    Fills ``result`` in place so partial timings survive a failure.
+    """
+    # Imported here so the orchestration API stays importable (and
+    # testable) without the page objects' configuration.
+    from pages.azercell_login_page import AzercellLoginPage
+
+    timeout = int(os.getenv("WAIT_TIMEOUT", "15"))
+    page = AzercellLoginPage(driver, WebDriverWait(driver, timeout), timeout)
+
+    with _Timer(result, "open"):
+        page.open_login_page_directly()
+    if not page.is_on_login_page():
+        result.status = "login_page_unavailable"
+        return
+
+    with _Timer(result, "enter"):
+        page.enter_phone_number(result.phone)
+
+    with _Timer(result, "submit"):
+        submitted = page.submit_phone_number()
+
+    with _Timer(result, "check"):
+        result.validation_error = page.get_validation_error_text()
+        result.reached_otp = page.is_on_otp_page()
+        result.final_url = driver.current_url
+
+    if result.reached_otp:
+        result.status = "otp"
+    elif result.validation_error:
+        result.status = "validation_error"
+    else:
+        result.status = "submitted" if submitted else "not_submitted"
+
+
+class _FlowRun:
+    """One number's flow on a worker thread, abortable from the loop."""
+
+    def __init__(self, phone: str, driver_factory: DriverFactory, flow: Flow):
+        # The final result; the flow fills a working copy that is only
+        # published here if the flow was not aborted first.
+        self.result = LoginFlowResult(phone)
+        self._working = LoginFlowResult(phone)
+        self._driver_factory = driver_factory
+        self._flow = flow
+        self._driver: Optional[WebDriver] = None
+        self._aborted: Optional[str] = None
+        self._started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def run(self) -> None:
+        result = self._working
+        self._started = time.perf_counter()
+        try:
+            with _Timer(result, "driver"):
+                driver = self._driver_factory()
+            with self._lock:
+                self._driver = driver
+                aborted = self._aborted
+            if aborted:
+                return
+            self._flow(driver, result)
+        except Exception as exc:  # noqa: BLE001
+            result.status = "error"
+            result.error = f"{type(exc).__name__}: {exc}".strip()
+            if not self._aborted:
+                log.warning("Flow for %s failed: %s", _mask(result.phone), exc)
+        finally:
+            with self._lock:
+                driver, self._driver = self._driver, None
+                if not self._aborted:
+                    result.duration_s = self._elapsed()
+                    self.result = result
+            if driver is not None:
+                self._quit(driver)
+
+    def abort(self, status: str) -> None:
+        """Finalize the flow as ``status`` and quit its driver (any thread)."""
+        with self._lock:
+            if self._aborted:
+                return
+            self._aborted = status
+            driver, self._driver = self._driver, None
+            # Whatever the flow still writes from now on is ignored.
+            self.result = replace(
+                self._working,
+                status=status,
+                error="",
+                timings=dict(self._working.timings),
+                duration_s=self._elapsed(),
+            )
+        if driver is not None:
+            self._quit(driver)
+
+    def _elapsed(self) -> float:
+        if self._started is None:
+            return 0.0
+        return round(time.perf_counter() - self._started, 3)
+
+    @staticmethod
+    def _quit(driver: WebDriver) -> None:
+        try:
+            driver.quit()
+        except Exception:  # noqa: BLE001
+            log.debug("driver.quit() failed", exc_info=True)
+
+
+async def _run_one(
+    phone: str,
+    driver_factory: DriverFactory,
+    flow: Flow,
+    executor: ThreadPoolExecutor,
+    slots: asyncio.Semaphore,
+    flow_timeout: float,
+) -> LoginFlowResult:
+    loop = asyncio.get_running_loop()
+    async with slots:
+        run = _FlowRun(phone, driver_factory, flow)
+        # A slot is only released once its thread has returned, so a
+        # thread is free and the flow starts right away.
+        future = loop.run_in_executor(executor, run.run)
+        try:
+            await asyncio.wait_for(asyncio.shield(future), flow_timeout)
+        except asyncio.TimeoutError:
+            log.warning("Flow for %s timed out after %ss", _mask(phone), flow_timeout)
+            await loop.run_in_executor(None, run.abort, "timeout")
+            # Keep the slot until the thread is free again, so no more than
+            # ``concurrency`` browsers ever exist at once.
+            await asyncio.wait({future})
+        except asyncio.CancelledError:
+            run.abort("cancelled")
+            raise
+        return run.result
+
+
+async def run_matrix(
+    phones: Iterable[str],
+    driver_factory: DriverFactory,
+    *,
+    concurrency: int = 4,
+    flow_timeout: float = 120.0,
+    flow: Flow = login_flow,
+) -> list[LoginFlowResult]:
+    """
+    Run ``flow`` for every number, ``concurrency`` browsers at a time.
+
+    Results are returned in input order. Cancelling the returned
+    coroutine quits every live driver.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    slots = asyncio.Semaphore(concurrency)
+    with ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="login-flow"
+    ) as executor:
+        tasks = [
+            asyncio.ensure_future(
+                _run_one(phone, driver_factory, flow, executor, slots, flow_timeout)
+            )
+            for phone in phones
+        ]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+
+def read_phones(path: Optional[str], inline: Optional[str]) -> list[str]:
+    """Numbers from a file (one per line, ``#`` comments) and/or a CSV list."""
+    raw: list[str] = []
+    if path:
+        for line in pathlib.Path(path).read_text(encoding="utf-8").splitlines():
+            line = line.split("#", 1)[0].strip()
+            if line:
+                raw.append(line)
+    if inline:
+        raw.extend(p.strip() for p in inline.split(",") if p.strip())
+
+    phones: list[str] = []
+    for phone in raw:
+        normalized = normalize_phone_number(phone)
+        if normalized and normalized not in phones:
+            phones.append(normalized)
+    return phones
+
+
+def format_table(results: list[LoginFlowResult]) -> list[str]:
+    lines = [
+        f"{'phone':<12}{'status':<24}{'otp':<5}{'total s':>9}{'submit s':>10}"
+        "  validation error"
+    ]
+    for r in results:
+        lines.append(
+            f"{r.phone:<12}{r.status:<24}{'yes' if r.reached_otp else 'no':<5}"
+            f"{r.duration_s:9.1f}{r.timings.get('submit', 0.0):10.1f}"
+            f"  {r.validation_error or r.error}"[:160]
+        )
+    return lines
+
+
+def write_csv(path: pathlib.Path, results: list[LoginFlowResult]) -> None:
+    steps = ("driver", "open", "enter", "submit", "check")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(
+            ["phone", "status", "reached_otp", "validation_error", "final_url"]
+            + ["error", "duration_s"]
+            + [f"{step}_s" for step in steps]
+        )
+        for r in results:
+            writer.writerow(
+                [r.phone, r.status, r.reached_otp, r.validation_error, r.final_url]
+                + [r.error, r.duration_s]
+                + [r.timings.get(step, "") for step in steps]
+            )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("numbers", nargs="?", help="File with one number per line.")
+    parser.add_argument("--phones", help="Comma-separated numbers.")
+    parser.add_argument(
+        "-c", "--concurrency", type=int, default=4, help="Browsers at once."
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=120.0, help="Per-flow timeout (s)."
+    )
+    parser.add_argument("--csv", dest="csv_path", help="Write results as CSV.")
+    parser.add_argument("--json", dest="json_path", help="Write results as JSON.")
+    args = parser.parse_args(argv)
+
+    phones = read_phones(args.numbers, args.phones)
+    if not phones:
+        parser.error("No phone numbers given")
+
+    from conftest import _build_chrome_options, _create_driver
+
+    resolve_chromedriver()
+    started = time.perf_counter()
+    results = asyncio.run(
+        run_matrix(
+            phones,
+            lambda: _create_driver(_build_chrome_options()),
+            concurrency=args.concurrency,
+            flow_timeout=args.timeout,
+        )
+    )
+    elapsed = time.perf_counter() - started
+
+    print()
+    for line in format_table(results):
+        print(line)
+    counts = {s: sum(r.status == s for r in results) for s in STATUSES}
+    summary = ", ".join(f"{s}: {n}" for s, n in counts.items() if n)
+    print(f"\n{len(results)} numbers in {elapsed:.1f}s ({summary})")
+
+    if args.csv_path:
+        write_csv(pathlib.Path(args.csv_path), results)
+        print(f"CSV written to: {args.csv_path}")
+    if args.json_path:
+        out = pathlib.Path(args.json_path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(
+            json.dumps([asdict(r) for r in results], indent=2, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        print(f"JSON written to: {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
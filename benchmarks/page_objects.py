@@ -0,0 +1,273 @@
+"""
+Micro-benchmarks for BasePage / AzercellLoginPage methods.
+
+Each scenario runs one page-object method many times against a static
+local HTML fixture (``benchmarks/fixtures``) that reproduces the DOM shape
+the method cares about: cookie banner present or absent, hundreds of
+error nodes, hundreds of anchors. For every call the wall time and the
+WebDriver commands it issued are recorded.
+
+Results are written as JSON so two runs (e.g. main vs. a PR branch) can
+be compared:
+
+    python -m benchmarks.page_objects --json reports/bench/po-main.json
+    python -m benchmarks.page_objects --json reports/bench/po-pr.json \\
+        --compare reports/bench/po-main.json
+
+Use ``--only`` to run a subset, e.g. ``--only has_validation_error``, and
+``--emulation slow-3g`` to run the fixtures under network/CPU throttling.
+"""
+
+import argparse
+import json
+import logging
+import os
+import pathlib
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+from benchmarks._support import load_page, serve_directory
+from conftest import _build_chrome_options, _create_driver
+from pages.azercell_login_page import AzercellLoginPage
+from utils.emulation import PROFILES, apply_emulation, get_profile
+from utils.stats import summarize
+from utils.webdriver_commands import count_commands
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One benchmarked call: fixture page + the page-object action."""
+
+    name: str
+    fixture: str
+    action: Callable[[AzercellLoginPage], Any]
+    # Re-open the fixture before every iteration (untimed) for actions
+    # that mutate or leave the page.
+    reload: bool = False
+    iterations: Optional[int] = None
+
+
+SCENARIOS: list[Scenario] = [
+    Scenario(
+        "BasePage.open",
+        "login.html",
+        lambda p: p.open(p.LOGIN_URL),
+    ),
+    Scenario(
+        "BasePage.click",
+        "login.html",
+        lambda p: p.click(p.SUBMIT_BUTTON),
+    ),
+    Scenario(
+        "_handle_cookie_banner[present]",
+        "login_banner.html",
+        lambda p: p._handle_cookie_banner(),
+        reload=True,
+    ),
+    Scenario(
+        "_handle_cookie_banner[absent]",
+        "login.html",
+        lambda p: p._handle_cookie_banner(),
+        iterations=3,
+    ),
+    Scenario(
+        "is_on_login_page[present]",
+        "login.html",
+        lambda p: p.is_on_login_page(),
+    ),
+    Scenario(
+        "is_on_login_page[absent]",
+        "home_anchors.html",
+        lambda p: p.is_on_login_page(),
+        iterations=3,
+    ),
+    Scenario(
+        "enter_phone_number",
+        "login.html",
+        lambda p: p.enter_phone_number("501234567"),
+    ),
+    Scenario(
+        "get_phone_input_value",
+        "login.html",
+        lambda p: p.get_phone_input_value(),
+    ),
+    Scenario(
+        "has_validation_error[none]",
+        "login.html",
+        lambda p: p.has_validation_error(),
+    ),
+    Scenario(
+        "has_validation_error[many]",
+        "login_errors.html",
+        lambda p: p.has_validation_error(),
+    ),
+    Scenario(
+        "get_validation_error_text[many]",
+        "login_errors.html",
+        lambda p: p.get_validation_error_text(),
+    ),
+    Scenario(
+        "is_on_otp_page[absent]",
+        "login.html",
+        lambda p: p.is_on_otp_page(),
+    ),
+    Scenario(
+        "_try_click_login_link[many anchors]",
+        "home_anchors.html",
+        lambda p: p._try_click_login_link(),
+        reload=True,
+        iterations=5,
+    ),
+    Scenario(
+        "submit_phone_number",
+        "login.html",
+        lambda p: p.submit_phone_number(),
+        reload=True,
+        iterations=3,
+    ),
+]
+
+
+def run_scenario(
+    driver: WebDriver, base_url: str, scenario: Scenario, iterations: int
+) -> dict:
+    timeout = int(os.getenv("WAIT_TIMEOUT", "15"))
+    page = AzercellLoginPage(driver, WebDriverWait(driver, timeout), timeout)
+    fixture_url = base_url + scenario.fixture
+    # Point the page object's own navigation at the local stand-in.
+    page.LOGIN_URL = fixture_url
+
+    latencies: list[float] = []
+    commands: list[int] = []
+    by_name: Counter[str] = Counter()
+
+    load_page(driver, fixture_url)
+    for _ in range(scenario.iterations or iterations):
+        if scenario.reload:
+            load_page(driver, fixture_url)
+            page.clear_element_cache()
+        with count_commands(driver) as counter:
+            started = time.perf_counter()
+            scenario.action(page)
+            latencies.append(time.perf_counter() - started)
+        commands.append(counter.total)
+        by_name.update(counter.counts)
+
+    runs = len(latencies)
+    return {
+        "fixture": scenario.fixture,
+        "latency_s": summarize(latencies),
+        "commands": {
+            "per_call": summarize([float(c) for c in commands]),
+            "by_name": {k: v / runs for k, v in sorted(by_name.items())},
+        },
+        # BasePage handle cache: hits are find_element round trips saved.
+        "element_cache": dict(page.cache_stats),
+    }
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """Human-readable latency/command deltas against a baseline run."""
+    lines = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            lines.append(f"{name:<38} (new)")
+            continue
+        cur_ms = result["latency_s"]["p50"] * 1000
+        base_ms = base["latency_s"]["p50"] * 1000
+        cur_cmd = result["commands"]["per_call"]["mean"]
+        base_cmd = base["commands"]["per_call"]["mean"]
+        delta = ((cur_ms - base_ms) / base_ms * 100) if base_ms else 0.0
+        lines.append(
+            f"{name:<38} p50 {base_ms:9.1f} -> {cur_ms:9.1f} ms ({delta:+6.1f}%)"
+            f"   cmds {base_cmd:6.1f} -> {cur_cmd:6.1f}"
+        )
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "-n", "--iterations", type=int, default=20, help="Calls per scenario."
+    )
+    parser.add_argument(
+        "--only", help="Comma-separated substrings selecting scenarios."
+    )
+    parser.add_argument("--json", dest="json_path", help="Write results as JSON.")
+    parser.add_argument("--compare", help="Baseline JSON to compare against.")
+    parser.add_argument(
+        "--emulation",
+        default="none",
+        choices=list(PROFILES),
+        help="Network/CPU emulation profile for the benchmark browser.",
+    )
+    args = parser.parse_args(argv)
+
+    scenarios = SCENARIOS
+    if args.only:
+        wanted = [w.strip() for w in args.only.split(",") if w.strip()]
+        scenarios = [s for s in SCENARIOS if any(w in s.name for w in wanted)]
+        if not scenarios:
+            parser.error(f"No scenario matches: {args.only}")
+
+    results: dict[str, dict] = {}
+    driver = _create_driver(_build_chrome_options())
+    try:
+        apply_emulation(driver, get_profile(args.emulation))
+        with serve_directory() as base_url:
+            for scenario in scenarios:
+                log.info("Benchmarking %s", scenario.name)
+                results[scenario.name] = run_scenario(
+                    driver, base_url, scenario, args.iterations
+                )
+    finally:
+        driver.quit()
+
+    payload = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "iterations": args.iterations,
+            "emulation": args.emulation,
+            "implicit_wait": os.getenv("IMPLICIT_WAIT", "3"),
+        },
+        "results": results,
+    }
+
+    print(
+        f"\n{'scenario':<38}{'p50 ms':>10}{'p95 ms':>10}{'cmds/call':>11}"
+        f"{'cache hit/miss':>16}"
+    )
+    for name, result in results.items():
+        lat = result["latency_s"]
+        cache = result["element_cache"]
+        print(
+            f"{name:<38}{lat['p50'] * 1000:10.1f}{lat['p95'] * 1000:10.1f}"
+            f"{result['commands']['per_call']['mean']:11.1f}"
+            f"{cache.get('hits', 0):>9}/{cache.get('misses', 0):<6}"
+        )
+
+    if args.compare:
+        baseline = json.loads(pathlib.Path(args.compare).read_text(encoding="utf-8"))
+        print(f"\nCompared with {args.compare}:")
+        for line in compare(payload, baseline):
+            print(line)
+
+    if args.json_path:
+        out = pathlib.Path(args.json_path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"\nResults written to: {out}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,9 +1,11 @@
+import json
 import logging
 import os
 import pathlib
 import re
-import time
 import shutil
+import subprocess
+import time
 from typing import Any, Generator, Optional
 
 import pytest
@@ -15,6 +17,25 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
+from pages.base_page import BasePage, explicit_lookups
+from utils import (
+    adaptive_timeouts,
+    browser_contexts,
+    circuit_breaker,
+    idle_accounting,
+    impact,
+    log_pipeline,
+    metrics_store,
+    network_log,
+    readiness,
+    virtual_time,
+)
+from utils.downloads import DownloadWatcher
+from utils.emulation import PROFILES, apply_emulation, get_profile
+from utils.page_timings import navigation_timings
+from utils.process_stats import ResourceMonitor
+from utils.screencast import ScreencastBuffer
+
 load_dotenv()
 
 _log_level_name = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -34,6 +55,11 @@ SCREENSHOTS_DIR = REPORTS_DIR / "screenshots"
 SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
 (REPORTS_DIR / "downloads").mkdir(parents=True, exist_ok=True)
 
+_impact_env = os.getenv("IMPACT_MAP")
+IMPACT_MAP = (
+    pathlib.Path(_impact_env) if _impact_env else PROJECT_ROOT / ".impact_map.json"
+)
+
 
 def _is_truthy(val: Optional[str]) -> bool:
     if val is None:
@@ -41,6 +67,11 @@ def _is_truthy(val: Optional[str]) -> bool:
     return str(val).lower() in ("1", "true", "yes", "on")
 
 
+def _safe_node_name(nodeid: str) -> str:
+    """Filesystem-safe form of a test node ID."""
+    return re.sub(r"[^\w\-_\.]", "_", nodeid)[:150]
+
+
 def pytest_addoption(parser) -> None:
     parser.addoption(
         "--phone-number",
@@ -52,6 +83,32 @@ def pytest_addoption(parser) -> None:
         ),
         help="Azercell phone number for live tests.",
     )
+    parser.addoption(
+        "--emulation",
+        dest="emulation",
+        action="store",
+        default=os.getenv("EMULATION_PROFILE", "none"),
+        choices=list(PROFILES),
+        help=(
+            "Network/CPU emulation profile applied to every driver "
+            "(overridden per test by @pytest.mark.emulation)."
+        ),
+    )
+    parser.addoption(
+        "--impact-since",
+        dest="impact_since",
+        action="store",
+        default=os.getenv("IMPACT_SINCE"),
+        metavar="GIT_REF",
+        help="Run only tests affected by changes since GIT_REF (uses the impact map).",
+    )
+    parser.addoption(
+        "--impact-record",
+        dest="impact_record",
+        action="store_true",
+        default=_is_truthy(os.getenv("IMPACT_RECORD", "0")),
+        help="Record which functions each test executes and update the impact map.",
+    )
 
 
 @pytest.fixture(scope="session")
@@ -59,10 +116,12 @@ def phone_number(request) -> str:
     return str(request.config.getoption("phone_number"))
 
 
-@pytest.fixture(scope="session")
-def chrome_options() -> Options:
+def _build_chrome_options() -> Options:
     """
     ChromeOptions optimized for CI stability and speed.
+
+    Kept outside the fixture so tooling (e.g. benchmarks/driver_startup.py)
+    can build the exact same option set without a pytest session.
     """
     opts = Options()
 
@@ -103,8 +162,19 @@ def chrome_options() -> Options:
     }
     opts.add_experimental_option("prefs", prefs)
 
+    if _is_truthy(os.getenv("NETWORK_LOG", "0")):
+        # Network.* events in the "performance" log (utils/network_log.py)
+        opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        opts.add_experimental_option(
+            "perfLoggingPrefs", network_log.PERF_LOGGING_PREFS
+        )
+
     # Only set page_load_strategy if explicitly requested for speed
-    if _is_truthy(os.getenv("FAST_PAGE_LOAD", "0")):
+    if _is_truthy(os.getenv("READINESS_GATE", "0")):
+        # driver.get returns at once; BasePage.open waits for readiness,
+        # other navigations for the load (BasePage.wait_for_page_load).
+        opts.page_load_strategy = "none"  # type: ignore[attr-defined]
+    elif _is_truthy(os.getenv("FAST_PAGE_LOAD", "0")):
         try:
             opts.page_load_strategy = "eager"  # type: ignore[attr-defined]
         except Exception:
@@ -113,6 +183,11 @@ def chrome_options() -> Options:
     return opts
 
 
+@pytest.fixture(scope="session")
+def chrome_options() -> Options:
+    return _build_chrome_options()
+
+
 def _create_driver(chrome_options: Options) -> WebDriver:
     """
     Create a Chrome WebDriver instance.
@@ -155,62 +230,298 @@ def _create_driver(chrome_options: Options) -> WebDriver:
     driver.set_page_load_timeout(page_load_timeout)
 
     # Small implicit wait for element discovery (fallback only;
-    # prefer explicit waits)
-    implicit_wait = float(os.getenv("IMPLICIT_WAIT", "3"))
+    # prefer explicit waits). LOOKUP_POLICY=explicit turns it off so
+    # negative checks in BasePage return immediately.
+    if explicit_lookups():
+        implicit_wait = 0.0
+    else:
+        implicit_wait = float(os.getenv("IMPLICIT_WAIT", "3"))
     driver.implicitly_wait(implicit_wait)
 
     return driver
 
 
+class _SessionBrowser:
+    """
+    Session-scoped driver used with REUSE_BROWSER=1.
+
+    The driver is replaced by a fresh one once it has served
+    BROWSER_MAX_TESTS tests or its process tree / JS heap exceed
+    BROWSER_MAX_RSS_MB / BROWSER_MAX_JS_HEAP_MB (0 = no limit).
+
+    Also holds the per-worker Chrome of BROWSER_MODE=context, which is
+    only recycled when a browser context cannot be disposed.
+    """
+
+    def __init__(self, chrome_options: Options):
+        self._chrome_options = chrome_options
+        self.max_tests = int(os.getenv("BROWSER_MAX_TESTS", "0"))
+        self.max_rss_mb = float(os.getenv("BROWSER_MAX_RSS_MB", "0"))
+        self.max_js_heap_mb = float(os.getenv("BROWSER_MAX_JS_HEAP_MB", "0"))
+        self.driver = _create_driver(chrome_options)
+        self.tests_served = 0
+        self.recycles = 0
+
+    def recycle_reason(self, sample: dict) -> Optional[str]:
+        if virtual_time.is_enabled(self.driver):
+            # The page clock cannot be handed back to real time.
+            return "virtual time was enabled"
+        if self.max_tests and self.tests_served >= self.max_tests:
+            return f"served {self.tests_served} tests"
+        rss = sample.get("rss_mb")
+        if self.max_rss_mb and rss is not None and rss > self.max_rss_mb:
+            return f"RSS {rss} MB > {self.max_rss_mb} MB"
+        heap = sample.get("js_heap_mb")
+        if self.max_js_heap_mb and heap is not None and heap > self.max_js_heap_mb:
+            return f"JS heap {heap} MB > {self.max_js_heap_mb} MB"
+        return None
+
+    def recycle(self, reason: str) -> None:
+        log.info("Recycling session browser (%s)", reason)
+        self.quit()
+        self.driver = _create_driver(self._chrome_options)
+        self.tests_served = 0
+        self.recycles += 1
+
+    def quit(self) -> None:
+        try:
+            self.driver.quit()
+        except Exception:
+            log.debug("Exception while quitting session driver", exc_info=True)
+
+
+BROWSER_MODES = ("fresh", "reuse", "context")
+
+
+def _browser_mode() -> str:
+    """
+    BROWSER_MODE: fresh (Chrome per test), reuse (one shared page) or
+    context (one Chrome per worker, a new browser context per test).
+    Without it, REUSE_BROWSER=1 selects "reuse".
+    """
+    mode = os.getenv("BROWSER_MODE", "").strip().lower()
+    if not mode:
+        return "reuse" if _is_truthy(os.getenv("REUSE_BROWSER", "0")) else "fresh"
+    if mode not in BROWSER_MODES:
+        raise pytest.UsageError(
+            f"BROWSER_MODE={mode!r} (expected one of: {', '.join(BROWSER_MODES)})"
+        )
+    return mode
+
+
 @pytest.fixture(scope="session")
 def _driver_session(
     chrome_options: Options,
-) -> Generator[Optional[WebDriver], None, None]:
+) -> Generator[Optional[_SessionBrowser], None, None]:
     """
     Optional session-scoped driver (enabled via REUSE_BROWSER=1).
     Disabled by default in CI for test isolation.
     """
-    reuse = _is_truthy(os.getenv("REUSE_BROWSER", "0"))
+    reuse = _browser_mode() == "reuse"
     if not reuse:
         yield None
         return
 
-    driver: Optional[WebDriver] = None
+    session: Optional[_SessionBrowser] = None
     try:
         log.info("Creating session-scoped browser (REUSE_BROWSER=1)")
-        driver = _create_driver(chrome_options)
-        yield driver
+        session = _SessionBrowser(chrome_options)
+        yield session
     finally:
-        if driver is not None:
-            try:
-                driver.quit()
-                log.info("Session browser quit")
-            except Exception:
-                log.debug(
-                    "Exception while quitting session driver",
-                    exc_info=True,
-                )
+        if session is not None:
+            session.quit()
+            log.info("Session browser quit (recycled %d times)", session.recycles)
+
+
+@pytest.fixture(scope="session")
+def _context_session(
+    chrome_options: Options,
+) -> Generator[Optional[_SessionBrowser], None, None]:
+    """
+    Per-worker Chrome for BROWSER_MODE=context; tests get their own
+    browser context inside it (see utils/browser_contexts.py).
+    """
+    if _browser_mode() != "context":
+        yield None
+        return
+
+    session: Optional[_SessionBrowser] = None
+    try:
+        log.info("Creating per-worker browser (BROWSER_MODE=context)")
+        session = _SessionBrowser(chrome_options)
+        yield session
+    finally:
+        if session is not None:
+            session.quit()
+
+
+def _prepare_emulation(request, driver: WebDriver) -> None:
+    """Apply the run's (or the test's marker) emulation profile."""
+    marker = request.node.get_closest_marker("emulation")
+    if marker is not None and marker.args:
+        name = marker.args[0]
+    else:
+        name = request.config.getoption("emulation")
+    profile = get_profile(name)
+    apply_emulation(driver, profile)
+    if not profile.is_noop:
+        request.node.user_properties.append(("emulation_profile", profile.name))
+
+
+def _record_emulation(request, driver: WebDriver) -> None:
+    """Attach page timings to reports of tests run under emulation."""
+    props = dict(request.node.user_properties)
+    if "emulation_profile" not in props:
+        return
+    timings = navigation_timings(driver)
+    if timings:
+        request.node.user_properties.append(("page_timings", json.dumps(timings)))
+
+
+def _record_navigations(request, driver: WebDriver) -> None:
+    """Attach readiness-gated navigations (READINESS_GATE=1) to the report."""
+    navs = readiness.drain(driver)
+    if navs:
+        request.node.user_properties.append(
+            ("navigations", json.dumps([nav.as_dict() for nav in navs]))
+        )
+
+
+def _record_backend_requests(request, driver: WebDriver) -> None:
+    """Attach the requests page objects waited for (NETWORK_LOG=1)."""
+    exchanges = network_log.drain_observed(driver)
+    if exchanges:
+        request.node.user_properties.append(
+            ("backend_requests", json.dumps([e.as_dict() for e in exchanges]))
+        )
+
+
+def _record_resources(request, monitor: ResourceMonitor, **extra: Any) -> dict:
+    sample = monitor.sample()
+    request.node.user_properties.append(
+        ("browser_resources", json.dumps({**sample, **extra}))
+    )
+    return sample
+
+
+def _start_screencast(request, driver: WebDriver) -> Optional[ScreencastBuffer]:
+    """Opt-in (SCREENCAST=1) frame buffer; saved by makereport on failure."""
+    if not _is_truthy(os.getenv("SCREENCAST", "0")):
+        return None
+    buffer = ScreencastBuffer(
+        driver,
+        seconds=float(os.getenv("SCREENCAST_SECONDS", "5")),
+        fps=float(os.getenv("SCREENCAST_FPS", "4")),
+    ).start()
+    request.node._screencast = buffer
+    return buffer
+
+
+def _finish_screencast(request, buffer: Optional[ScreencastBuffer]) -> None:
+    if buffer is None:
+        return
+    buffer.stop()
+    buffer.frames.clear()
+    request.node.user_properties.append(
+        ("screencast_overhead", json.dumps(buffer.overhead()))
+    )
 
 
 @pytest.fixture()
 def browser(
-    _driver_session: Optional[WebDriver], chrome_options: Options
+    request,
+    _driver_session: Optional[_SessionBrowser],
+    _context_session: Optional[_SessionBrowser],
+    chrome_options: Options,
 ) -> Generator[WebDriver, None, None]:
     """
     Browser fixture for tests.
-    - If REUSE_BROWSER=1: reuses session driver (faster, less isolated)
+    - If REUSE_BROWSER=1: reuses session driver (faster, less isolated),
+      recycling it when the BROWSER_MAX_* limits are exceeded
+    - If BROWSER_MODE=context: runs the test in a new browser context
+      (own cookies, storage, cache) of the per-worker Chrome
     - Otherwise: creates fresh driver per test (default, more stable)
+    - Applies the selected emulation profile (--emulation / marker)
+    - Attaches CPU/RSS/JS-heap usage to the report when reusing the
+      browser or with BROWSER_MONITOR=1
+    - With SCREENCAST=1 buffers the last few seconds of frames
     """
     if _driver_session is not None:
         log.debug("Reusing session browser")
-        yield _driver_session
+        driver = _driver_session.driver
+        _prepare_emulation(request, driver)
+        monitor = ResourceMonitor(driver)
+        screencast = _start_screencast(request, driver)
+        yield driver
+        _driver_session.tests_served += 1
+        sample: Optional[dict] = None
+        try:
+            _finish_screencast(request, screencast)
+            _record_emulation(request, driver)
+            _record_navigations(request, driver)
+            _record_backend_requests(request, driver)
+            sample = _record_resources(
+                request, monitor, tests_served=_driver_session.tests_served
+            )
+        finally:
+            # Failing to sample usually means the session itself is broken.
+            if sample is None:
+                reason = "teardown sampling failed"
+            else:
+                reason = _driver_session.recycle_reason(sample)
+            if reason:
+                _driver_session.recycle(reason)
+        return
+
+    if _context_session is not None:
+        driver = _context_session.driver
+        context = browser_contexts.open_context(driver)
+        request.node._browser_context = context
+        screencast = None
+        try:
+            _prepare_emulation(request, driver)
+            screencast = _start_screencast(request, driver)
+            yield driver
+            _record_emulation(request, driver)
+            _record_navigations(request, driver)
+            _record_backend_requests(request, driver)
+        finally:
+            _finish_screencast(request, screencast)
+            virtual_time.forget(driver)
+            close_ms: Optional[float] = None
+            try:
+                close_ms = browser_contexts.close_context(driver, context)
+            except Exception:
+                # The next test would inherit the broken session.
+                log.warning("Disposing the browser context failed", exc_info=True)
+                _context_session.recycle("browser context disposal failed")
+            request.node.user_properties.append(
+                (
+                    "browser_context",
+                    json.dumps({"open_ms": context.open_ms, "close_ms": close_ms}),
+                )
+            )
         return
 
     driver: Optional[WebDriver] = None
+    screencast: Optional[ScreencastBuffer] = None
     try:
         driver = _create_driver(chrome_options)
+        _prepare_emulation(request, driver)
+        monitor = (
+            ResourceMonitor(driver)
+            if _is_truthy(os.getenv("BROWSER_MONITOR", "0"))
+            else None
+        )
+        screencast = _start_screencast(request, driver)
         yield driver
+        _record_emulation(request, driver)
+        _record_navigations(request, driver)
+        _record_backend_requests(request, driver)
+        if monitor is not None:
+            _record_resources(request, monitor)
     finally:
+        _finish_screencast(request, screencast)
         if driver is not None:
             try:
                 driver.quit()
@@ -230,6 +541,66 @@ def wait(browser: WebDriver) -> WebDriverWait:
     return WebDriverWait(browser, timeout=timeout)
 
 
+def _set_download_dir(
+    driver: WebDriver,
+    directory: pathlib.Path,
+    context: Optional[browser_contexts.BrowserContext] = None,
+) -> None:
+    """Point the running browser's downloads at ``directory``."""
+    params = {"behavior": "allow", "downloadPath": str(directory)}
+    if context is not None:
+        params["browserContextId"] = context.context_id
+    try:
+        driver.execute_cdp_cmd("Browser.setDownloadBehavior", params)
+    except Exception:
+        # Older Chrome builds only expose the per-page variant.
+        driver.execute_cdp_cmd("Page.setDownloadBehavior", params)
+
+
+@pytest.fixture()
+def downloads(
+    request, browser: WebDriver
+) -> Generator[DownloadWatcher, None, None]:
+    """
+    Per-test download directory with completion waiting.
+
+    Files land in reports/downloads/<xdist worker>/<test>/ so parallel
+    workers and reused browsers never see each other's files. Use
+    ``downloads.wait()`` or ``page.wait_for_download(downloads)``.
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    directory = (
+        REPORTS_DIR / "downloads" / worker / _safe_node_name(request.node.nodeid)
+    )
+    shutil.rmtree(directory, ignore_errors=True)
+    directory.mkdir(parents=True, exist_ok=True)
+    _set_download_dir(
+        browser, directory, getattr(request.node, "_browser_context", None)
+    )
+
+    with DownloadWatcher(directory) as watcher:
+        yield watcher
+
+
+CIRCUIT_DIR = REPORTS_DIR / "circuits"
+
+
+def _short_circuit(rep, call) -> bool:
+    """
+    Turn a CircuitOpenError into a skip (CIRCUIT_OPEN_ACTION=skip, the
+    default) or a plain failure without artifacts (=fail).
+    """
+    if call.excinfo is None or not call.excinfo.errisinstance(
+        circuit_breaker.CircuitOpenError
+    ):
+        return False
+    if os.getenv("CIRCUIT_OPEN_ACTION", "skip").lower() == "skip":
+        path, lineno, _ = rep.location
+        rep.outcome = "skipped"
+        rep.longrepr = (path, lineno + 1, f"Skipped: {call.excinfo.value}")
+    return True
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(
     item, call
@@ -237,6 +608,9 @@ def pytest_runtest_makereport(
     outcome: Any = yield
     rep = outcome.get_result()
 
+    if rep.failed and _short_circuit(rep, call):
+        return
+
     if rep.when != "call" or not getattr(rep, "failed", False):
         return
 
@@ -245,7 +619,7 @@ def pytest_runtest_makereport(
         return
 
     timestamp = time.strftime("%Y%m%d_%H%M%S")
-    safe_node = re.sub(r"[^\w\-_\.]", "_", item.nodeid)[:150]
+    safe_node = _safe_node_name(item.nodeid)
     screenshot_path = SCREENSHOTS_DIR / f"{safe_node}_{timestamp}.png"
 
     try:
@@ -259,20 +633,290 @@ def pytest_runtest_makereport(
     except Exception:
         log.debug("Failed to save artifacts", exc_info=True)
 
+    screencast: Optional[ScreencastBuffer] = getattr(item, "_screencast", None)
+    if screencast is not None:
+        screencast.stop()
+        gif_path = SCREENSHOTS_DIR / f"{safe_node}_{timestamp}.gif"
+        try:
+            if screencast.save_gif(gif_path):
+                log.info("Screencast: %s", gif_path.name)
+        except Exception:
+            log.debug("Failed to save screencast", exc_info=True)
+
 
 def pytest_configure(config) -> None:
     config.addinivalue_line("markers", "smoke: quick smoke tests")
     config.addinivalue_line("markers", "regression: regression tests")
     config.addinivalue_line("markers", "slow: slow-running tests")
     config.addinivalue_line("markers", "testcase: external test case ID")
+    config.addinivalue_line(
+        "markers",
+        "emulation(name): run under a named network/CPU emulation profile",
+    )
     config.addinivalue_line(
         "markers",
         "flaky: tests that are unstable and may be retried",
     )
 
+    if _is_truthy(os.getenv("ADAPTIVE_TIMEOUTS", "0")):
+        timings_env = os.getenv("LOCATOR_TIMINGS_FILE")
+        timings_path = (
+            pathlib.Path(timings_env)
+            if timings_env
+            else REPORTS_DIR / "locator_timings.json"
+        )
+        adaptive_timeouts.configure(
+            adaptive_timeouts.LocatorTimings.from_env(timings_path)
+        )
+
+    xmlpath = config.getoption("xmlpath", None)
+    if xmlpath and not os.getenv("PYTEST_XDIST_WORKER"):
+        # Lets metrics_store attribute the report to the tested commit.
+        metrics_store.record_commit(pathlib.Path(xmlpath).parent)
+
+    if config.getoption("impact_record"):
+        _start_impact_recording()
+
+    if _is_truthy(os.getenv("STRUCTURED_LOGS", "0")):
+        _start_log_pipeline()
+
+    if _is_truthy(os.getenv("CIRCUIT_BREAKER", "0")):
+        if not os.getenv("PYTEST_XDIST_WORKER"):
+            # Controller: circuits never carry over from an earlier run.
+            shutil.rmtree(CIRCUIT_DIR, ignore_errors=True)
+        CIRCUIT_DIR.mkdir(parents=True, exist_ok=True)
+        circuit_breaker.configure(circuit_breaker.HostCircuits.from_env(CIRCUIT_DIR))
+
+    if _is_truthy(os.getenv("IDLE_REPORT", "0")):
+        global _idle_accounting, _idle_summary
+        _idle_accounting = idle_accounting.IdleAccounting(
+            is_page_object=lambda obj: isinstance(obj, BasePage),
+            helper_files=(os.path.join("pages", "base_page.py"),),
+        )
+        _idle_accounting.install()
+        _idle_summary = idle_accounting.RunSummary()
+
+
+# Queue-based structured logging (STRUCTURED_LOGS=1).
+_log_pipeline: Optional[log_pipeline.LogPipeline] = None
+LOGS_DIR = REPORTS_DIR / "logs"
+
+
+def _start_log_pipeline() -> None:
+    global _log_pipeline
+    if not os.getenv("PYTEST_XDIST_WORKER"):
+        # Controller: drop worker files left over from earlier runs.
+        for stale in LOGS_DIR.glob("*.jsonl"):
+            stale.unlink()
+    _log_pipeline = log_pipeline.LogPipeline(LOGS_DIR, _log_level)
+    _log_pipeline.start()
+
+
+def pytest_runtest_logstart(nodeid, location) -> None:
+    if _log_pipeline is not None:
+        log_pipeline.set_current_test(nodeid)
+
+
+def pytest_runtest_logfinish(nodeid, location) -> None:
+    if _log_pipeline is not None:
+        log_pipeline.set_current_test(None)
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    breaker = circuit_breaker.active()
+    tripped = breaker.states() if breaker is not None else {}
+    tripped = {h: st for h, st in tripped.items() if st.get("reason")}
+    if tripped:
+        terminalreporter.write_sep("-", "circuit breaker")
+        for host, state in tripped.items():
+            status = "OPEN" if state.get("open") else "recovered"
+            terminalreporter.write_line(
+                f"{host}: {status} - {state['reason']}"
+                f" ({state.get('short_circuited', 0)} navigations short-circuited)"
+            )
+
+    navigation_lines = readiness.format_summary(_navigations)
+    if navigation_lines:
+        terminalreporter.write_sep("-", "readiness-gated navigation")
+        for line in navigation_lines:
+            terminalreporter.write_line(line)
+
+    if _backend_requests:
+        terminalreporter.write_sep("-", "backend requests")
+        for line in network_log.format_summary(_backend_requests):
+            terminalreporter.write_line(line)
+
+    if _idle_summary is not None and _idle_summary.tests:
+        terminalreporter.write_sep("-", "idle time (s)")
+        top = int(os.getenv("IDLE_REPORT_TOP", "10"))
+        for line in _idle_summary.format(top):
+            terminalreporter.write_line(line)
+
+    merged = LOGS_DIR / log_pipeline.MERGED_NAME
+    if _log_pipeline is None or not merged.exists():
+        return
+    counts = _log_pipeline.level_counts
+    summary = ", ".join(f"{level}: {n}" for level, n in sorted(counts.items()))
+    terminalreporter.write_sep("-", "structured logs")
+    terminalreporter.write_line(f"{merged} ({summary or 'no records'})")
+
+
+# Sleep/wait/command accounting (IDLE_REPORT=1).
+_idle_accounting: Optional[idle_accounting.IdleAccounting] = None
+_idle_summary: Optional[idle_accounting.RunSummary] = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item) -> Generator[None, None, None]:
+    if _idle_accounting is None:
+        yield
+        return
+    with _idle_accounting.test_scope() as bucket:
+        yield
+    # Travels with the call report, so the xdist controller sees it too.
+    item.user_properties.append(("idle_time", json.dumps(bucket.as_dict())))
+
+
+# Readiness-gated navigations (READINESS_GATE=1) and awaited backend
+# requests (NETWORK_LOG=1) of the run.
+_navigations: list[dict] = []
+_backend_requests: list[dict] = []
+
+
+def pytest_runtest_logreport(report) -> None:
+    if report.when == "teardown":
+        props = dict(report.user_properties)
+        if "navigations" in props:
+            _navigations.extend(json.loads(props["navigations"]))
+        if "backend_requests" in props:
+            _backend_requests.extend(json.loads(props["backend_requests"]))
+    if _idle_summary is None:
+        return
+    if report.when == "setup":
+        _idle_summary.add_setup(report.nodeid, report.duration)
+    elif report.when == "call":
+        data = dict(report.user_properties).get("idle_time")
+        if data is not None:
+            _idle_summary.add_call(report.nodeid, report.duration, json.loads(data))
+
+
+# Coverage recorder for --impact-record (one coverage context per test).
+_impact_coverage: Any = None
+_impact_ran: set[str] = set()
+
+
+def _start_impact_recording() -> None:
+    global _impact_coverage
+    import coverage
+
+    _impact_coverage = coverage.Coverage(
+        data_file=None,
+        source=[str(PROJECT_ROOT / d) for d in impact.TRACKED_DIRS],
+    )
+    _impact_coverage.start()
+
+
+def _finish_impact_recording() -> None:
+    """
+    Merge this run's per-test function sets into the impact map.
+
+    Entries for tests that ran are replaced; all others are kept, so the
+    map is updated incrementally. xdist workers write partial maps that
+    the controller merges.
+    """
+    _impact_coverage.stop()
+    recorded = impact.map_from_coverage(_impact_coverage.get_data(), PROJECT_ROOT)
+    ran = {nodeid: recorded.get(nodeid, []) for nodeid in _impact_ran}
+
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker:
+        partial = IMPACT_MAP.with_name(f"{IMPACT_MAP.stem}.{worker}.json")
+        impact.save_map(partial, ran)
+        return
+
+    test_map = impact.load_map(IMPACT_MAP)
+    test_map.update(ran)
+    for partial in IMPACT_MAP.parent.glob(f"{IMPACT_MAP.stem}.gw*.json"):
+        test_map.update(impact.load_map(partial))
+        partial.unlink()
+    impact.save_map(IMPACT_MAP, test_map)
+    log.info("Impact map updated: %s (%d tests)", IMPACT_MAP, len(test_map))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem) -> Generator[None, None, None]:
+    if _impact_coverage is None:
+        yield
+        return
+    _impact_ran.add(item.nodeid)
+    _impact_coverage.switch_context(item.nodeid)
+    yield
+    _impact_coverage.switch_context("")
+
+
+def pytest_collection_modifyitems(config, items) -> None:
+    base_ref = config.getoption("impact_since")
+    if not base_ref:
+        return
+
+    test_map = impact.load_map(IMPACT_MAP)
+    if not test_map:
+        log.warning("No impact map at %s; running all tests", IMPACT_MAP)
+        return
+    try:
+        files, functions = impact.changed_functions(PROJECT_ROOT, base_ref)
+    except (OSError, subprocess.CalledProcessError) as exc:
+        log.warning("Could not diff against %s (%s); running all tests", base_ref, exc)
+        return
+
+    selected = impact.select_tests(
+        test_map, [item.nodeid for item in items], files, functions
+    )
+    if selected is None:
+        log.info("Shared code changed since %s; running all tests", base_ref)
+        return
+
+    deselected = [item for item in items if item.nodeid not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item.nodeid in selected]
+    log.info(
+        "Impact selection since %s: %d selected, %d deselected",
+        base_ref,
+        len(items),
+        len(deselected),
+    )
+
+
+def pytest_sessionfinish(session, exitstatus) -> None:
+    if _impact_coverage is not None:
+        try:
+            _finish_impact_recording()
+        except OSError:
+            log.warning("Could not update impact map", exc_info=True)
+
+    timings = adaptive_timeouts.active()
+    if timings is not None:
+        try:
+            timings.save()
+            log.info("Locator timings saved: %s", timings.path)
+        except OSError:
+            log.warning("Could not save locator timings", exc_info=True)
+
+    if _idle_accounting is not None:
+        _idle_accounting.uninstall()
+
+    if _log_pipeline is not None:
+        # Flush this process's queue; the controller then merges all
+        # worker files (workers have finished by the time it gets here).
+        _log_pipeline.stop()
+        if not os.getenv("PYTEST_XDIST_WORKER"):
+            _, _log_pipeline.level_counts = log_pipeline.merge_worker_logs(LOGS_DIR)
+
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment(
+    request,
     phone_number: str,
 ) -> Generator[None, None, None]:
     env_name = os.getenv("TEST_ENV", "local")
@@ -287,11 +931,22 @@ def setup_test_environment(
     log.info("  Base URL: %s", base_url)
     log.info("  Reports: %s", REPORTS_DIR)
     log.info("  Headless: %s", _is_truthy(os.getenv("HEADLESS", "1")))
-    log.info("  Reuse browser: %s", _is_truthy(os.getenv("REUSE_BROWSER", "0")))
+    log.info("  Browser mode: %s", _browser_mode())
     log.info("  Wait timeout: %ss", os.getenv("WAIT_TIMEOUT", "15"))
+    log.info(
+        "  Adaptive timeouts: %s", adaptive_timeouts.active() is not None
+    )
+    log.info("  Emulation: %s", request.config.getoption("emulation"))
+    log.info(
+        "  Lookup policy: %s", "explicit" if explicit_lookups() else "implicit"
+    )
     log.info(
         "  Page load timeout: %ss", os.getenv("PAGE_LOAD_TIMEOUT", "45")
     )
+    log.info(
+        "  Readiness gate: %s", _is_truthy(os.getenv("READINESS_GATE", "0"))
+    )
+    log.info("  Network log: %s", _is_truthy(os.getenv("NETWORK_LOG", "0")))
     masked = (
         "<hidden>"
         if phone_number and phone_number != "5XXXXXXXXX"
@@ -1,6 +1,8 @@
 import logging
 import os
+import re
 import time
+from typing import Optional
 
 from selenium.common.exceptions import (
     TimeoutException,
@@ -12,11 +14,35 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.base_page import BasePage
+from utils import readiness
+from utils.circuit_breaker import CircuitOpenError
+from utils.network_log import Exchange
 from utils.phone import normalize_phone_number
 
 log = logging.getLogger(__name__)
 
 
+def _any_clickable(locators):
+    """The first of ``locators`` (in order) that is clickable, else False."""
+    return EC.any_of(*(EC.element_to_be_clickable(loc) for loc in locators))
+
+
+def _shown_texts(locator):
+    """Texts of the displayed, non-empty matches of ``locator``."""
+
+    def texts(driver):
+        shown: list[str] = []
+        for el in driver.find_elements(*locator):
+            try:
+                if el.is_displayed() and el.text.strip():
+                    shown.append(el.text.strip())
+            except Exception:  # noqa: BLE001
+                continue
+        return shown
+
+    return texts
+
+
 class AzercellLoginPage(BasePage):
     """
     Page object for Azercell login flows.
@@ -79,43 +105,81 @@ class AzercellLoginPage(BasePage):
         "[class*='error-message'], [class*='validation']",
     )
 
+    # Candidates for one wait each; the first clickable one in order wins.
+    COOKIE_SELECTORS = (
+        (By.CSS_SELECTOR, "button.cookie-accept"),
+        (By.CSS_SELECTOR, "button[id*='cookie']"),
+        (By.CSS_SELECTOR, ".cc-dismiss"),
+        (
+            By.XPATH,
+            "//button[contains(., 'Qəbul') or "
+            "contains(., 'Accept') or contains(., 'Razıyam')]",
+        ),
+    )
+
+    SUBMIT_SELECTORS = (
+        (By.CSS_SELECTOR, "button[type='submit']:not([disabled])"),
+        (By.CSS_SELECTOR, "button.submit-btn:not([disabled])"),
+        (By.CSS_SELECTOR, "button[class*='login']:not([disabled])"),
+        (By.CSS_SELECTOR, "button[class*='continue']:not([disabled])"),
+        (By.CSS_SELECTOR, "button[class*='submit']:not([disabled])"),
+        (By.CSS_SELECTOR, "form button[type='submit']"),
+        (
+            By.XPATH,
+            "//button[contains(translate(., 'DAVAM', 'davam'), 'davam') "
+            "or contains(., 'Continue') or contains(., 'Submit')]",
+        ),
+        (By.XPATH, "//button[@type='submit' and not(@disabled)]"),
+    )
+
+    # Gated open() (READINESS_GATE=1) returns once the phone field is usable.
+    READY_WHEN = PHONE_INPUT
+
+    # The form's send-OTP API call (regex on the URL path, POST).
+    OTP_ENDPOINT = os.getenv(
+        "AZERCELL_OTP_ENDPOINT", r"(?i)/(send-?otp|otp/send|send-?sms-?code)\b"
+    )
+    # What submit_phone_number() waits for when NETWORK_LOG=1: the
+    # endpoint itself unless AZERCELL_OTP_REQUEST widens it.
+    OTP_REQUEST = os.getenv("AZERCELL_OTP_REQUEST", OTP_ENDPOINT)
+
+    # Send-OTP exchange seen by the last submit_phone_number(), if any.
+    last_submit_request: Optional[Exchange] = None
+
     def open_home_page(self) -> None:
         log.info("Opening Azercell home page: %s", self.BASE_URL)
-        self.open(self.BASE_URL)
-        time.sleep(2)
+        # READY_WHEN describes the login page: wait for the full load here.
+        self.open(self.BASE_URL, strict=True)
+        self._settle_after_open()
         self._handle_cookie_banner()
 
     def open_login_page_directly(self) -> None:
         """Direct navigation to login page (faster and more reliable)."""
         log.info("Opening login page directly: %s", self.LOGIN_URL)
         self.open(self.LOGIN_URL)
-        time.sleep(2)
+        self._settle_after_open()
         self._handle_cookie_banner()
 
+    def _settle_after_open(self) -> None:
+        # Gated opens already waited for what the page needs; the fixed
+        # pause is only kept for the ungated path, as before.
+        if not readiness.is_gated(self.driver):
+            time.sleep(2)
+
     def _handle_cookie_banner(self) -> None:
         """Accept cookie banners if present."""
-        cookie_selectors = [
-            (By.CSS_SELECTOR, "button.cookie-accept"),
-            (By.CSS_SELECTOR, "button[id*='cookie']"),
-            (By.CSS_SELECTOR, ".cc-dismiss"),
-            (
-                By.XPATH,
-                "//button[contains(., 'Qəbul') or "
-                "contains(., 'Accept') or contains(., 'Razıyam')]",
-            ),
-        ]
-
-        for selector in cookie_selectors:
-            try:
-                btn = WebDriverWait(self.driver, 2).until(
-                    EC.element_to_be_clickable(selector)
-                )
-                btn.click()
-                log.info("Cookie banner accepted")
-                time.sleep(0.5)
-                return
-            except TimeoutException:
-                continue
+        try:
+            btn = self.wait_until(
+                "COOKIE_SELECTORS",
+                _any_clickable(self.COOKIE_SELECTORS),
+                default=2,
+                probe=True,
+            )
+        except TimeoutException:
+            return
+        btn.click()
+        log.info("Cookie banner accepted")
+        time.sleep(0.5)
 
     def click_login_button(self) -> bool:
         """
@@ -137,17 +201,17 @@ class AzercellLoginPage(BasePage):
         """Try to find and click the web login link (not app store link)."""
         try:
             # Wait for page to be ready
-            WebDriverWait(self.driver, 5).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
+            self.wait_until(
+                "DOCUMENT_READY",
+                lambda d: d.execute_script("return document.readyState") == "complete",
+                default=5,
             )
 
             # Find all links that might be login links
             login_link = None
             try:
                 # Try primary selector first
-                login_link = WebDriverWait(self.driver, 3).until(
-                    EC.presence_of_element_located(self.LOGIN_LINK)
-                )
+                login_link = self.wait_for("LOGIN_LINK", default=3, probe=True)
                 href = login_link.get_attribute("href") or ""
                 log.info("Found login link: %s", href)
 
@@ -161,7 +225,7 @@ class AzercellLoginPage(BasePage):
             # Fallback: find any link with 'kabinetim' that's not an app link
             if not login_link:
                 try:
-                    all_links = self.driver.find_elements(By.TAG_NAME, "a")
+                    all_links = self.find_all((By.TAG_NAME, "a"), timeout=3)
                     for link in all_links:
                         href = link.get_attribute("href") or ""
                         if (
@@ -178,8 +242,12 @@ class AzercellLoginPage(BasePage):
                 log.error("Could not find valid web login link")
                 return False
 
-            # Store window handles before click
+            # The click navigates without open(): honour the breaker here.
+            self.check_circuit(login_link.get_attribute("href") or "")
+
+            # Store window handles and the current document before click
             initial_handles = self.driver.window_handles
+            document = self.document_mark()
 
             # Scroll into view
             self.driver.execute_script(
@@ -201,16 +269,22 @@ class AzercellLoginPage(BasePage):
 
             # Check for new window
             try:
-                WebDriverWait(self.driver, 2).until(
-                    lambda d: len(d.window_handles) > len(initial_handles)
+                self.wait_until(
+                    "NEW_WINDOW",
+                    lambda d: len(d.window_handles) > len(initial_handles),
+                    default=2,
+                    probe=True,
                 )
                 log.info("New window opened, switching")
                 self.switch_to_new_window()
             except TimeoutException:
                 log.debug("No new window")
 
+            self.wait_for_page_load(document)
             return True
 
+        except CircuitOpenError:
+            raise
         except Exception as e:  # noqa: BLE001
             log.exception("Error clicking login link: %s", e)
             return False
@@ -229,9 +303,7 @@ class AzercellLoginPage(BasePage):
 
         # Check for phone input as fallback
         try:
-            WebDriverWait(self.driver, 3).until(
-                EC.presence_of_element_located(self.PHONE_INPUT)
-            )
+            self.wait_for("PHONE_INPUT", default=3, probe=True)
             log.info("Phone input found - on login page")
             return True
         except TimeoutException:
@@ -241,9 +313,7 @@ class AzercellLoginPage(BasePage):
     def is_on_login_page(self) -> bool:
         """Check if currently on the login page."""
         try:
-            WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located(self.PHONE_INPUT)
-            )
+            self.wait_for("PHONE_INPUT", default=5, probe=True)
             log.debug("Phone input found - on login page")
             return True
         except TimeoutException:
@@ -257,11 +327,11 @@ class AzercellLoginPage(BasePage):
         log.info("Entering phone number")
         phone = str(phone)
 
-        el = self.wait.until(EC.visibility_of_element_located(self.PHONE_INPUT))
+        el = self.wait_for("PHONE_INPUT", EC.visibility_of_element_located)
         el.clear()
-        time.sleep(0.3)
+        self.settle(0.3)
         el.send_keys(phone)
-        time.sleep(0.5)
+        self.settle(0.5)  # input debounce
 
         log.info("Phone number entered")
         return phone
@@ -269,8 +339,9 @@ class AzercellLoginPage(BasePage):
     def get_phone_input_value(self) -> str | None:
         """Get current value from phone input."""
         try:
-            el = self.driver.find_element(*self.PHONE_INPUT)
-            return el.get_attribute("value") or ""
+            return self.with_element(
+                self.PHONE_INPUT, lambda el: el.get_attribute("value") or ""
+            )
         except Exception as e:  # noqa: BLE001
             log.warning("Could not get phone input value: %s", e)
             return None
@@ -279,23 +350,21 @@ class AzercellLoginPage(BasePage):
         """Check if form has validation errors."""
         try:
             # Wait a moment for errors to appear
-            time.sleep(0.5)
+            self.settle(0.5)
 
-            errors = self.driver.find_elements(*self.VALIDATION_ERROR)
-            for error in errors:
-                try:
-                    if error.is_displayed():
-                        text = error.text.strip()
-                        if text:
-                            log.warning("Validation error found: %s", text)
-                            return True
-                except Exception:  # noqa: BLE001
-                    continue
+            errors = self._shown_errors()
+            if errors:
+                log.warning("Validation error found: %s", errors[0])
+                return True
 
             # Also check for invalid class on input
             try:
-                phone_input = self.driver.find_element(*self.PHONE_INPUT)
-                classes = phone_input.get_attribute("class") or ""
+                classes = (
+                    self.with_element(
+                        self.PHONE_INPUT, lambda el: el.get_attribute("class")
+                    )
+                    or ""
+                )
                 if "invalid" in classes.lower() or "error" in classes.lower():
                     log.warning("Phone input has invalid/error class: %s", classes)
                     return True
@@ -307,30 +376,30 @@ class AzercellLoginPage(BasePage):
             log.debug("Error checking validation: %s", e)
             return False
 
+    def _shown_errors(self) -> list[str]:
+        """Displayed VALIDATION_ERROR texts; [] once the probe times out."""
+        try:
+            return self.wait_for(
+                "VALIDATION_ERROR", _shown_texts, default=0, probe=True
+            )
+        except TimeoutException:
+            return []
+
     def get_validation_error_text(self) -> str:
         """Get validation error message text."""
         try:
-            time.sleep(0.5)
-            errors = self.driver.find_elements(*self.VALIDATION_ERROR)
-            error_messages: list[str] = []
-
-            for error in errors:
-                try:
-                    if error.is_displayed():
-                        text = error.text.strip()
-                        if text:
-                            error_messages.append(text)
-                except Exception:  # noqa: BLE001
-                    continue
-
+            self.settle(0.5)
+            error_messages = self._shown_errors()
             if error_messages:
                 return " | ".join(error_messages)
 
             # Check input validity state
             try:
-                phone_input = self.driver.find_element(*self.PHONE_INPUT)
-                validity = self.driver.execute_script(
-                    "return arguments[0].validationMessage;", phone_input
+                validity = self.with_element(
+                    self.PHONE_INPUT,
+                    lambda el: self.driver.execute_script(
+                        "return arguments[0].validationMessage;", el
+                    ),
                 )
                 if validity:
                     return f"Input validation: {validity}"
@@ -347,9 +416,10 @@ class AzercellLoginPage(BasePage):
 
         # Store original URL for comparison
         original_url = self.driver.current_url
+        self.last_submit_request = None
 
         # Wait for potential client-side validation
-        time.sleep(1)
+        self.settle(1)
 
         # Check for validation errors first
         if self.has_validation_error():
@@ -357,87 +427,75 @@ class AzercellLoginPage(BasePage):
             log.error("Form has validation error before submit: %s", error_text)
             return False
 
-        # Try multiple submit button selectors
-        submit_selectors = [
-            (By.CSS_SELECTOR, "button[type='submit']:not([disabled])"),
-            (By.CSS_SELECTOR, "button.submit-btn:not([disabled])"),
-            (By.CSS_SELECTOR, "button[class*='login']:not([disabled])"),
-            (By.CSS_SELECTOR, "button[class*='continue']:not([disabled])"),
-            (By.CSS_SELECTOR, "button[class*='submit']:not([disabled])"),
-            (By.CSS_SELECTOR, "form button[type='submit']"),
-            (
-                By.XPATH,
-                "//button[contains(translate(., 'DAVAM', 'davam'), 'davam') "
-                "or contains(., 'Continue') or contains(., 'Submit')]",
-            ),
-            (By.XPATH, "//button[@type='submit' and not(@disabled)]"),
-        ]
-
+        # Try the submit button selectors (first clickable one wins)
         button_clicked = False
-        for selector in submit_selectors:
-            try:
-                btn = WebDriverWait(self.driver, 2).until(
-                    EC.element_to_be_clickable(selector)
-                )
-                log.info(
-                    "Found clickable submit button with selector: %s",
-                    selector,
-                )
-
-                # Scroll into view
-                self.driver.execute_script(
-                    "arguments[0].scrollIntoView({block: 'center'});",
-                    btn,
-                )
-                time.sleep(0.3)
-
-                # Try clicking
-                try:
-                    btn.click()
-                    log.info("Submit button clicked successfully")
-                    button_clicked = True
-                except Exception as e:  # noqa: BLE001
-                    log.warning("Normal click failed (%s), trying JS click", e)
-                    self.driver.execute_script("arguments[0].click();", btn)
-                    log.info("JS click executed")
-                    button_clicked = True
-
-                # Wait longer for response after clicking
-                time.sleep(3)
-
-                # Check for errors that appeared after clicking
-                if self.has_validation_error():
-                    error_text = self.get_validation_error_text()
-                    log.error(
-                        "Validation error appeared after submit: %s",
-                        error_text,
-                    )
-                    return False
+        since = self.network_mark()
+        document = self.document_mark()
+        try:
+            btn = self.wait_until(
+                "SUBMIT_SELECTORS",
+                _any_clickable(self.SUBMIT_SELECTORS),
+                default=2,
+                probe=True,
+            )
+            log.info("Found clickable submit button")
 
-                break
+            # Scroll into view
+            self.driver.execute_script(
+                "arguments[0].scrollIntoView({block: 'center'});",
+                btn,
+            )
+            time.sleep(0.3)
 
-            except (TimeoutException, NoSuchElementException):
-                continue
+            # Try clicking
+            try:
+                btn.click()
+                log.info("Submit button clicked successfully")
+                button_clicked = True
+            except Exception as e:  # noqa: BLE001
+                log.warning("Normal click failed (%s), trying JS click", e)
+                self.driver.execute_script("arguments[0].click();", btn)
+                log.info("JS click executed")
+                button_clicked = True
+
+            # Wait for the backend to answer the submit
+            self._wait_for_submit_response(since, document)
+
+            # Check for errors that appeared after clicking
+            if self.has_validation_error():
+                error_text = self.get_validation_error_text()
+                log.error(
+                    "Validation error appeared after submit: %s",
+                    error_text,
+                )
+                return False
+        except (TimeoutException, NoSuchElementException):
+            pass
 
         # If no button was clicked, try fallback methods
         if not button_clicked:
             log.info("No submit button found, trying Enter key fallback")
             try:
-                input_el = self.driver.find_element(*self.PHONE_INPUT)
-                input_el.send_keys(Keys.RETURN)
+                self.with_element(
+                    self.PHONE_INPUT, lambda el: el.send_keys(Keys.RETURN)
+                )
                 log.info("Enter key pressed")
-                time.sleep(3)
+                self._wait_for_submit_response(since, document)
 
                 # Check if URL changed after Enter
                 if not self._check_url_changed(original_url):
                     log.info(
                         "URL didn't change after Enter, trying Tab + Enter " "fallback"
                     )
-                    input_el.send_keys(Keys.TAB)
+                    self.with_element(
+                        self.PHONE_INPUT, lambda el: el.send_keys(Keys.TAB)
+                    )
                     time.sleep(0.3)
+                    since = self.network_mark()
+                    document = self.document_mark()
                     active_el = self.driver.switch_to.active_element
                     active_el.send_keys(Keys.RETURN)
-                    time.sleep(3)
+                    self._wait_for_submit_response(since, document)
 
                 # Check for errors after Enter key
                 if self.has_validation_error():
@@ -451,6 +509,54 @@ class AzercellLoginPage(BasePage):
 
         return True
 
+    def _wait_for_submit_response(
+        self, since: Optional[int], document: Optional[float]
+    ) -> None:
+        """
+        Wait for the send-OTP request to complete (NETWORK_LOG=1) and
+        record it; without a network log, sleep as before. ``document``
+        is the document_mark() taken before the submit.
+        """
+        if since is None:
+            time.sleep(3)
+        else:
+            try:
+                # No longer than the sleep it replaces when nothing matches.
+                exchange = self.wait_for_request(
+                    self.OTP_REQUEST, method="POST", since=since, timeout=3
+                )
+            except TimeoutException:
+                log.warning("No send-OTP request seen after submit")
+            else:
+                if not re.search(self.OTP_ENDPOINT, exchange.url):
+                    log.warning(
+                        "Submit matched %s, not the send-OTP endpoint (%s)",
+                        exchange.url,
+                        self.OTP_ENDPOINT,
+                    )
+                self.last_submit_request = exchange
+                log.info(
+                    "Send-OTP request %s -> %s (server %s ms, total %s ms)",
+                    exchange.url,
+                    exchange.status or exchange.error,
+                    exchange.server_ms,
+                    exchange.total_ms,
+                )
+                # Let the page render the response (next step or error).
+                self.settle(0.5)
+        # A submit that navigates is not waited for under READINESS_GATE=1.
+        self.wait_for_page_load(document)
+
+    def wait_for_url_change(self, original_url: str, timeout: float) -> bool:
+        """True as soon as the URL differs from ``original_url``."""
+        try:
+            WebDriverWait(self.driver, timeout, 0.2).until(
+                lambda _: self._check_url_changed(original_url)
+            )
+            return True
+        except TimeoutException:
+            return False
+
     def _check_url_changed(self, original_url: str) -> bool:
         """Check if URL has changed from original."""
         current_url = self.driver.current_url
@@ -475,12 +581,12 @@ class AzercellLoginPage(BasePage):
             return True
 
         # Check for OTP input elements
-        otp_elements = self.driver.find_elements(*self.OTP_INDICATOR)
-        if otp_elements:
-            log.info("Detected OTP page by input elements")
-            return True
-
-        return False
+        try:
+            self.wait_for("OTP_INDICATOR", default=0, probe=True)
+        except TimeoutException:
+            return False
+        log.info("Detected OTP page by input elements")
+        return True
 
     def click_password_change_link(self) -> bool:
         """Click password change/forgot password link."""
@@ -1,20 +1,59 @@
 import logging
+import os
+import pathlib
 import time
-from typing import Tuple, Union
+from collections import Counter
+from typing import Any, Callable, Optional, Tuple, TypeVar, Union
 
 from selenium.common.exceptions import (
     ElementClickInterceptedException,
     NoSuchElementException,
     StaleElementReferenceException,
     TimeoutException,
+    WebDriverException,
 )
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from utils import (
+    adaptive_timeouts,
+    circuit_breaker,
+    network_log,
+    readiness,
+    virtual_time,
+)
+from utils.downloads import DownloadWatcher
+
 log = logging.getLogger(__name__)
 Locator = Union[Tuple[str, str], str]
+T = TypeVar("T")
+
+# Poll interval for the explicit presence/absence checks below.
+LOOKUP_POLL = 0.1
+
+
+def explicit_lookups() -> bool:
+    """
+    True when LOOKUP_POLICY=explicit.
+
+    In that mode the driver runs with implicit waits disabled and every
+    presence/absence check goes through the bounded helpers on BasePage,
+    so a "nothing matches" probe returns immediately instead of blocking
+    for IMPLICIT_WAIT.
+    """
+    return os.getenv("LOOKUP_POLICY", "implicit").lower() == "explicit"
+
+
+def _by_value(locator: Locator) -> Tuple[str, str]:
+    """Normalise a locator: plain strings are CSS selectors."""
+    if isinstance(locator, str):
+        return By.CSS_SELECTOR, locator
+    if isinstance(locator, (tuple, list)) and len(locator) == 2:
+        return locator[0], locator[1]
+    raise ValueError(f"Invalid locator: {locator!r}")
 
 
 class BasePage:
@@ -23,15 +62,309 @@ class BasePage:
 
     - Wraps common operations such as open(), click(), window switching.
     - Uses WebDriverWait passed from fixtures for explicit waits.
+    - Caches single-element handles per locator (find / with_element);
+      the cache is dropped on open(), wait_for_page_load(), window
+      switches and stale-element errors.
     """
 
-    def __init__(self, driver: WebDriver, wait: WebDriverWait):
+    # Readiness predicate for gated open(): this element being displayed
+    # and enabled means the page can be used. None: the load event.
+    READY_WHEN: Optional[Locator] = None
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        wait: WebDriverWait,
+        timeout: Optional[float] = None,
+    ):
         self.driver = driver
         self.wait = wait
+        # Default bound for the waits below; same as the ``wait`` fixture.
+        self.timeout = (
+            timeout if timeout is not None else float(os.getenv("WAIT_TIMEOUT", "15"))
+        )
+        self._elements: dict[Tuple[str, str], WebElement] = {}
+        # "hits" = find_element round trips saved.
+        self.cache_stats: Counter[str] = Counter()
+
+    def open(self, url: str, strict: bool = False, stop_loading: bool = False) -> None:
+        """
+        Navigate browser to the given absolute URL.
 
-    def open(self, url: str) -> None:
-        """Navigate browser to the given absolute URL."""
+        With READINESS_GATE=1 (page load strategy "none") this returns as
+        soon as is_ready() holds on the new document rather than at the
+        load event; ``stop_loading=True`` also stops any loading still in
+        progress. ``strict=True`` waits for the full load instead.
+
+        With CIRCUIT_BREAKER=1 the navigation is reported to the per-host
+        breaker, and CircuitOpenError is raised without navigating while
+        the host's circuit is open.
+        """
+        self.clear_element_cache()
+        breaker = circuit_breaker.active()
+        if breaker is None:
+            self._navigate(url, strict, stop_loading)
+            return
+
+        breaker.check(url)
+        started = time.monotonic()
+        try:
+            self._navigate(url, strict, stop_loading)
+        except WebDriverException as exc:
+            # Page load timeouts and network errors count against the
+            # host; other driver errors say nothing about it.
+            if isinstance(exc, TimeoutException) or "net::ERR_" in str(exc.msg):
+                breaker.record(url, time.monotonic() - started, exc)
+            raise
+        breaker.record(url, time.monotonic() - started)
+
+    def check_circuit(self, url: str) -> None:
+        """
+        Raise CircuitOpenError if CIRCUIT_BREAKER=1 and ``url``'s host
+        circuit is open. For navigations that bypass open(), such as
+        clicking a link; page objects must let the error propagate.
+        """
+        breaker = circuit_breaker.active()
+        if breaker is not None:
+            breaker.check(url)
+
+    def _navigate(self, url: str, strict: bool, stop_loading: bool) -> None:
+        if not readiness.is_gated(self.driver):
+            self.driver.get(url)
+            return
+        # The previous document stays current until the new one commits;
+        # nothing it shows may count for this navigation.
+        previous = readiness.document_origin(self.driver)
         self.driver.get(url)
+        # driver.get no longer enforces the page load timeout; the
+        # readiness wait takes over the same budget.
+        timeout = self.driver.timeouts.page_load
+        if strict:
+            readiness.wait_for_load(self.driver, timeout, previous)
+        else:
+            WebDriverWait(
+                self.driver,
+                timeout,
+                readiness.POLL,
+                ignored_exceptions=(StaleElementReferenceException,),
+            ).until(
+                lambda d: readiness.is_new_document(d, previous) and self.is_ready()
+            )
+        readiness.record(self.driver, url, strict, stop_loading)
+
+    def document_mark(self) -> Optional[float]:
+        """
+        Identity of the current document, for wait_for_page_load(). None
+        without READINESS_GATE=1, where the driver waits by itself.
+        """
+        if not readiness.is_gated(self.driver):
+            return None
+        return readiness.document_origin(self.driver)
+
+    def wait_for_page_load(
+        self, since: Optional[float], commit_timeout: float = 2.0
+    ) -> None:
+        """
+        Wait for the page an action navigated to under READINESS_GATE=1.
+
+        The gate's page load strategy "none" applies to the whole session:
+        only open() waits for readiness, so link clicks and form submits
+        that navigate return before the next page has loaded. Take
+        ``since = document_mark()`` before such an action and call this
+        after it: once a new document has committed, this waits for its
+        load event. If none commits within ``commit_timeout`` the action
+        did not navigate and this returns. Without the gate (``since`` is
+        None) it returns at once; the driver already waited.
+        """
+        if since is None:
+            # The driver waited for whatever the action loaded.
+            self.clear_element_cache()
+            return
+        try:
+            readiness.wait_for_new_document(self.driver, since, commit_timeout)
+        except TimeoutException:
+            return
+        self.clear_element_cache()
+        readiness.wait_for_load(self.driver, self.driver.timeouts.page_load, since)
+
+    def is_ready(self) -> bool:
+        """
+        Readiness predicate for gated open(): READY_WHEN is displayed and
+        enabled (without READY_WHEN: the document has loaded). Override
+        for pages that need a different signal.
+        """
+        if self.READY_WHEN is None:
+            return (
+                self.driver.execute_script("return document.readyState;") == "complete"
+            )
+        by, value = _by_value(self.READY_WHEN)
+        elements = self.driver.find_elements(by, value)
+        return (
+            bool(elements) and elements[0].is_displayed() and elements[0].is_enabled()
+        )
+
+    def clear_element_cache(self) -> None:
+        if self._elements:
+            self.cache_stats["clears"] += 1
+        self._elements.clear()
+
+    def find(self, locator: Locator) -> WebElement:
+        """
+        First element matching ``locator``, reusing a cached handle.
+
+        A hit costs no round trip. Methods that navigate (open(),
+        wait_for_page_load(), switch_to_new_window()) drop the cache; a
+        handle may still have gone stale (a re-render, a navigation not
+        followed by wait_for_page_load()), so use with_element() to act
+        on it with a transparent re-lookup.
+
+        Raises NoSuchElementException like driver.find_element.
+        """
+        key = _by_value(locator)
+        element = self._elements.get(key)
+        if element is not None:
+            self.cache_stats["hits"] += 1
+            return element
+        self.cache_stats["misses"] += 1
+        element = self._locate(key)
+        self._elements[key] = element
+        return element
+
+    def _locate(self, key: Tuple[str, str]) -> WebElement:
+        """
+        driver.find_element for lookups that expect a match.
+
+        Under LOOKUP_POLICY=explicit the driver does not poll, so this
+        polls for up to IMPLICIT_WAIT itself, as the implicit wait would.
+        """
+        if not explicit_lookups():
+            return self.driver.find_element(*key)
+        found = self.find_all(key, timeout=float(os.getenv("IMPLICIT_WAIT", "3")))
+        if not found:
+            raise NoSuchElementException(f"No element matches {key}")
+        return found[0]
+
+    def with_element(self, locator: Locator, action: Callable[[WebElement], T]) -> T:
+        """
+        Run ``action`` on the (cached) element for ``locator``.
+
+        On StaleElementReferenceException the cache is cleared and the
+        action is retried once on a freshly located element.
+        """
+        try:
+            return action(self.find(locator))
+        except StaleElementReferenceException:
+            self.cache_stats["stale"] += 1
+            self.clear_element_cache()
+            return action(self.find(locator))
+
+    def wait_until(
+        self,
+        name: str,
+        predicate: Callable[[Any], Any],
+        default: Optional[float] = None,
+        timeout: Optional[float] = None,
+        probe: bool = False,
+    ) -> Any:
+        """
+        WebDriverWait.until(``predicate``) for the wait called ``name``.
+
+        - ``default`` is the usual bound (the shared ``wait`` fixture
+          timeout if omitted). With ADAPTIVE_TIMEOUTS=1 it is replaced by
+          one learned from previous runs of ``<PageClass>.<name>``.
+        - ``timeout`` is a hard cap the learned bound never exceeds.
+        - ``probe=True`` marks a check whose timeout is an answer (the
+          element is absent), not a slow page: such timeouts are not
+          recorded. Any other timed-out wait records its bound, so the
+          learned timeout grows on the next run.
+
+        Raises TimeoutException.
+        """
+        timings = adaptive_timeouts.active()
+        if timings is None:
+            if default is None and timeout is None:
+                return self.wait.until(predicate)
+            bound = self.timeout if default is None else default
+            if timeout is not None:
+                bound = min(bound, timeout)
+            return WebDriverWait(self.driver, bound).until(predicate)
+
+        key = f"{type(self).__name__}.{name}"
+        bound = timings.timeout_for(key, self.timeout if default is None else default)
+        if timeout is not None:
+            bound = min(bound, timeout)
+        started = time.monotonic()
+        try:
+            result = WebDriverWait(self.driver, bound).until(predicate)
+        except TimeoutException:
+            if not probe:
+                timings.record(key, bound)
+            raise
+        timings.record(key, time.monotonic() - started)
+        return result
+
+    def wait_for(
+        self,
+        name: str,
+        condition: Callable[[Any], Any] = EC.presence_of_element_located,
+        default: Optional[float] = None,
+        timeout: Optional[float] = None,
+        probe: bool = False,
+    ) -> Any:
+        """
+        Wait for the class-level locator ``name`` (e.g. "PHONE_INPUT").
+
+        ``condition`` is an expected_conditions factory taking a locator;
+        ``default``, ``timeout`` and ``probe`` are as for wait_until().
+        """
+        locator = getattr(self, name)
+        result = self.wait_until(name, condition(locator), default, timeout, probe)
+        # A located element is a fresh handle: let find() reuse it.
+        if isinstance(result, WebElement):
+            self._elements[_by_value(locator)] = result
+        return result
+
+    def find_all(self, locator: Locator, timeout: float = 0.0) -> list[WebElement]:
+        """
+        Return elements matching ``locator``.
+
+        - ``timeout=0`` checks once ("check now").
+        - ``timeout>0`` polls until at least one element matches or the
+          timeout expires ("wait up to"); returns [] on timeout.
+
+        Under LOOKUP_POLICY=explicit the driver has no implicit wait, so
+        an empty result is returned without blocking.
+        """
+        by, value = _by_value(locator)
+        if timeout <= 0:
+            return self.driver.find_elements(by, value)
+        try:
+            return WebDriverWait(self.driver, timeout, LOOKUP_POLL).until(
+                lambda d: d.find_elements(by, value)
+            )
+        except TimeoutException:
+            return []
+
+    def is_present(self, locator: Locator, timeout: float = 0.0) -> bool:
+        """True if ``locator`` matches now / within ``timeout`` seconds."""
+        return bool(self.find_all(locator, timeout))
+
+    def is_absent(self, locator: Locator, timeout: float = 0.0) -> bool:
+        """
+        True if ``locator`` matches nothing now / within ``timeout`` seconds.
+
+        With a timeout this waits for matching elements to disappear.
+        """
+        by, value = _by_value(locator)
+        if timeout <= 0:
+            return not self.driver.find_elements(by, value)
+        try:
+            WebDriverWait(self.driver, timeout, LOOKUP_POLL).until_not(
+                lambda d: d.find_elements(by, value)
+            )
+            return True
+        except TimeoutException:
+            return False
 
     def click(self, locator: Locator, retries: int = 2, delay: float = 0.3) -> bool:
         """
@@ -41,11 +374,9 @@ class BasePage:
         - Retries a couple of times on common Selenium issues.
         - Falls back to JS click as last resort.
         """
-        if isinstance(locator, str):
-            by, value = By.CSS_SELECTOR, locator
-        elif isinstance(locator, (tuple, list)) and len(locator) == 2:
-            by, value = locator
-        else:
+        try:
+            by, value = _by_value(locator)
+        except ValueError:
             log.error("Invalid locator: %r", locator)
             return False
 
@@ -65,7 +396,7 @@ class BasePage:
 
         # JS fallback
         try:
-            el = self.driver.find_element(by, value)
+            el = self._locate((by, value))
             self.driver.execute_script(
                 "arguments[0].scrollIntoView({block: 'center', behavior: 'instant'}); "
                 "arguments[0].click();",
@@ -76,10 +407,78 @@ class BasePage:
             log.warning("Click failed for %s: %s", (by, value), exc)
             return False
 
+    def wait_for_download(
+        self, downloads: DownloadWatcher, timeout: float = 60.0, pattern: str = "*"
+    ) -> pathlib.Path:
+        """
+        Block until the next download matching ``pattern`` has finished.
+
+        ``downloads`` is the watcher from the ``downloads`` fixture;
+        returns the path of the completed file (never a .crdownload).
+        """
+        return downloads.wait(timeout=timeout, pattern=pattern)
+
+    def network_mark(self) -> Optional[int]:
+        """
+        Cursor for wait_for_request(since=...): only requests issued
+        after this call match. None when the session has no network log
+        (NETWORK_LOG=0).
+        """
+        if not network_log.is_available(self.driver):
+            return None
+        return network_log.for_driver(self.driver).mark()
+
+    def wait_for_request(
+        self,
+        pattern: str,
+        method: Optional[str] = None,
+        since: int = 0,
+        timeout: Optional[float] = None,
+    ) -> network_log.Exchange:
+        """
+        Wait for a browser request whose URL matches the regex ``pattern``
+        to complete and return it (status, server_ms, total_ms).
+
+        - ``method`` restricts the HTTP method (e.g. "POST").
+        - ``timeout`` defaults to the shared ``wait`` fixture timeout.
+
+        Needs NETWORK_LOG=1. Raises TimeoutException like wait_for().
+        """
+        if timeout is None:
+            timeout = self.timeout
+        return network_log.for_driver(self.driver).wait_for(
+            pattern, method, since, timeout
+        )
+
+    def pause_time(self) -> None:
+        """
+        Freeze the page clock (DevTools virtual time).
+
+        Timers, debounces and countdowns only run when advance_time() or
+        settle() grants time. Call it after the page has loaded.
+        """
+        virtual_time.pause(self.driver)
+
+    def advance_time(self, seconds: float, wait_for_network: bool = False) -> None:
+        """Fast-forward the paused page clock by ``seconds`` (virtual time)."""
+        virtual_time.advance(self.driver, seconds, wait_for_network)
+
+    def settle(self, seconds: float) -> None:
+        """
+        Give client-side timers (input debounce, delayed error rendering)
+        ``seconds`` to run: advances virtual time when the page clock is
+        paused, otherwise sleeps.
+        """
+        if virtual_time.is_enabled(self.driver):
+            virtual_time.advance(self.driver, seconds)
+        else:
+            time.sleep(seconds)
+
     def switch_to_new_window(self) -> bool:
         """Switch to the newest window/tab if one was opened."""
         handles = self.driver.window_handles
         if len(handles) > 1:
+            self.clear_element_cache()
             self.driver.switch_to.window(handles[-1])
             return True
         return False
@@ -12,11 +12,22 @@ if ! command -v newman >/dev/null 2>&1; then
   npm install -g newman newman-reporter-html newman-reporter-junitfull
 fi
 
+# The commit this run tests, for utils/metrics_store.py
+git -C "$ROOT_DIR" rev-parse HEAD > "$REPORT_DIR/commit.txt" 2>/dev/null || true
+
+status=0
 newman run "$COLLECTION" \
   -e "$ENV" \
   --reporters cli,junit,html \
   --reporter-junit-export "$REPORT_DIR/newman-results.xml" \
   --reporter-html-export "$REPORT_DIR/newman-results.html" \
-  --timeout-request 60000
+  --timeout-request 60000 || status=$?
 
 echo "Reports written to: $REPORT_DIR"
+
+if [ -f "$REPORT_DIR/newman-results.xml" ] && command -v python3 >/dev/null 2>&1; then
+  (cd "$ROOT_DIR" && python3 -m utils.metrics_store ingest "$REPORT_DIR/newman-results.xml") ||
+    echo "Could not record timings in the metrics history"
+fi
+
+exit "$status"
@@ -0,0 +1,109 @@
+import json
+import time
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from pages.base_page import BasePage
+from utils import adaptive_timeouts
+from utils.adaptive_timeouts import LocatorTimings
+
+
+def _timings(tmp_path, **kwargs):
+    return LocatorTimings(tmp_path / "timings.json", **kwargs)
+
+
+def test_default_used_until_enough_samples(tmp_path):
+    timings = _timings(tmp_path, min_samples=3)
+    timings.record("Page.PHONE_INPUT", 0.2)
+    timings.record("Page.PHONE_INPUT", 0.2)
+    assert timings.timeout_for("Page.PHONE_INPUT", 5) == 5
+
+
+def test_learned_timeout_is_p99_times_margin(tmp_path):
+    timings = _timings(tmp_path, margin=2.0, min_timeout=0.1, min_samples=3)
+    for seconds in (0.4, 0.5, 0.6):
+        timings.record("Page.PHONE_INPUT", seconds)
+    assert timings.timeout_for("Page.PHONE_INPUT", 5) == pytest.approx(1.196)
+
+
+def test_learned_timeout_is_clamped(tmp_path):
+    timings = _timings(tmp_path, min_timeout=1.0, max_timeout=10.0, min_samples=1)
+    timings.record("fast", 0.01)
+    timings.record("slow", 60.0)
+    assert timings.timeout_for("fast", 5) == 1.0
+    assert timings.timeout_for("slow", 5) == 10.0
+
+
+def test_save_merges_with_samples_written_by_other_workers(tmp_path):
+    path = tmp_path / "timings.json"
+    path.write_text(json.dumps({"Page.OTP_INDICATOR": [1.0]}), encoding="utf-8")
+
+    timings = LocatorTimings(path)
+    timings.record("Page.PHONE_INPUT", 0.3)
+    timings.save()
+
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert saved == {"Page.OTP_INDICATOR": [1.0], "Page.PHONE_INPUT": [0.3]}
+
+
+class _Page(BasePage):
+    PHONE_INPUT = ("css selector", "input[type='tel']")
+
+
+def _never(locator):
+    return lambda driver: False
+
+
+def test_default_is_learned_and_timeout_caps_it(tmp_path):
+    timings = _timings(tmp_path, min_timeout=0.01, min_samples=1)
+    timings.record("_Page.PHONE_INPUT", 1.0)  # learned: 1.5 s
+    adaptive_timeouts.configure(timings)
+    page = _Page(object(), wait=None)
+    try:
+        started = time.monotonic()
+        with pytest.raises(TimeoutException):
+            page.wait_for("PHONE_INPUT", _never, default=5, probe=True)
+        assert 1.5 <= time.monotonic() - started < 3
+
+        started = time.monotonic()
+        with pytest.raises(TimeoutException):
+            page.wait_for("PHONE_INPUT", _never, timeout=0.2, probe=True)
+        assert time.monotonic() - started < 1  # one 0.5 s poll
+    finally:
+        adaptive_timeouts.configure(None)
+
+
+def test_probe_timeouts_are_not_recorded(tmp_path):
+    # is_on_login_page() off the login page: absent, not slow
+    timings = _timings(tmp_path, min_timeout=0.01, min_samples=1)
+    timings.record("_Page.PHONE_INPUT", 0.1)
+    adaptive_timeouts.configure(timings)
+    try:
+        with pytest.raises(TimeoutException):
+            _Page(object(), wait=None).wait_for(
+                "PHONE_INPUT", _never, default=5, probe=True
+            )
+    finally:
+        adaptive_timeouts.configure(None)
+    assert timings.history["_Page.PHONE_INPUT"] == [0.1]
+
+
+def test_check_now_probe_is_not_stretched_to_min_timeout(tmp_path):
+    timings = _timings(tmp_path, min_timeout=1.0, min_samples=1)
+    timings.record("Page.OTP_INDICATOR", 0.01)
+    assert timings.timeout_for("Page.OTP_INDICATOR", 0) == pytest.approx(0.015)
+    assert timings.timeout_for("Page.OTP_INDICATOR", 5) == 1.0
+
+
+def test_timed_out_wait_raises_the_next_timeout(tmp_path):
+    timings = _timings(tmp_path, margin=1.5, min_timeout=0.01, min_samples=1)
+    timings.record("_Page.PHONE_INPUT", 0.1)
+    adaptive_timeouts.configure(timings)
+    try:
+        with pytest.raises(TimeoutException):
+            _Page(object(), wait=None, timeout=15).wait_for("PHONE_INPUT", _never)
+    finally:
+        adaptive_timeouts.configure(None)
+    assert timings.history["_Page.PHONE_INPUT"] == [0.1, pytest.approx(0.15)]
+    assert timings.timeout_for("_Page.PHONE_INPUT", 15) > 0.15
@@ -0,0 +1,66 @@
+import time
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+
+
+class _FakeDriver:
+    """Driver stub whose matches appear after ``appear_after`` seconds."""
+
+    def __init__(self, appear_after=None):
+        self._started = time.monotonic()
+        self._appear_after = appear_after
+        self.calls = []
+        self.current_url = "https://example.test/"
+
+    def find_elements(self, by, value):
+        self.calls.append((by, value))
+        if self._appear_after is None:
+            return []
+        if time.monotonic() - self._started >= self._appear_after:
+            return ["element"]
+        return []
+
+
+def test_string_locator_is_treated_as_css():
+    driver = _FakeDriver()
+    BasePage(driver, wait=None).find_all(".error")
+    assert driver.calls == [(By.CSS_SELECTOR, ".error")]
+
+
+def test_absence_check_now_does_not_wait():
+    page = BasePage(_FakeDriver(), wait=None)
+    started = time.monotonic()
+    assert page.is_absent((By.CSS_SELECTOR, ".error"))
+    assert not page.is_present((By.CSS_SELECTOR, ".error"))
+    assert time.monotonic() - started < 0.1
+
+
+def test_wait_up_to_returns_once_element_appears():
+    page = BasePage(_FakeDriver(appear_after=0.2), wait=None)
+    assert page.find_all((By.CSS_SELECTOR, "input"), timeout=2) == ["element"]
+
+
+def test_wait_up_to_gives_up_with_empty_result():
+    page = BasePage(_FakeDriver(), wait=None)
+    started = time.monotonic()
+    assert page.find_all((By.CSS_SELECTOR, "input"), timeout=0.3) == []
+    assert time.monotonic() - started < 1.0
+
+
+def test_explicit_policy_positive_lookup_still_polls(monkeypatch):
+    monkeypatch.setenv("LOOKUP_POLICY", "explicit")
+    monkeypatch.setenv("IMPLICIT_WAIT", "2")
+    page = BasePage(_FakeDriver(appear_after=0.2), wait=None)
+    assert page.find((By.CSS_SELECTOR, "input")) == "element"
+
+
+def test_explicit_policy_positive_lookup_gives_up(monkeypatch):
+    monkeypatch.setenv("LOOKUP_POLICY", "explicit")
+    monkeypatch.setenv("IMPLICIT_WAIT", "0.2")
+    page = BasePage(_FakeDriver(), wait=None)
+    with pytest.raises(NoSuchElementException):
+        page.find((By.CSS_SELECTOR, "input"))
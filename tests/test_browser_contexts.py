@@ -0,0 +1,55 @@
+from utils.browser_contexts import close_context, open_context
+
+
+class _SwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        self._driver.current_window_handle = handle
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.current_window_handle = "HOME"
+        self.window_handles = ["HOME"]
+        self.cdp = []
+        self.switch_to = _SwitchTo(self)
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append((cmd, params))
+        if cmd == "Target.createBrowserContext":
+            return {"browserContextId": "CTX1"}
+        if cmd == "Target.createTarget":
+            self.window_handles.append("TAB1")
+            return {"targetId": "TAB1"}
+        if cmd == "Target.disposeBrowserContext":
+            self.window_handles.remove("TAB1")
+        return {}
+
+
+def test_open_switches_to_a_tab_in_the_new_context():
+    driver = _FakeDriver()
+    context = open_context(driver)
+
+    assert driver.current_window_handle == "TAB1"
+    assert context.context_id == "CTX1"
+    assert context.home_handle == "HOME"
+    assert driver.cdp[1] == (
+        "Target.createTarget",
+        {"url": "about:blank", "browserContextId": "CTX1"},
+    )
+
+
+def test_close_returns_home_and_disposes_the_context():
+    driver = _FakeDriver()
+    context = open_context(driver)
+
+    close_context(driver, context)
+
+    assert driver.current_window_handle == "HOME"
+    assert driver.window_handles == ["HOME"]
+    assert driver.cdp[-1] == (
+        "Target.disposeBrowserContext",
+        {"browserContextId": "CTX1"},
+    )
@@ -0,0 +1,124 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from pages.azercell_login_page import AzercellLoginPage
+from pages.base_page import BasePage
+from utils import circuit_breaker
+from utils.circuit_breaker import CircuitOpenError, HostCircuits
+
+URL = "https://kabinetim.example.test/login"
+
+
+class _Probe:
+    def __init__(self, healthy=False):
+        self.healthy = healthy
+        self.calls = []
+
+    def __call__(self, url, timeout):
+        self.calls.append(url)
+        return self.healthy
+
+
+def _circuits(tmp_path, probe, **kwargs):
+    return HostCircuits(tmp_path, threshold=2, probe=probe, **kwargs)
+
+
+def test_consecutive_failures_open_the_circuit(tmp_path):
+    circuits = _circuits(tmp_path, _Probe(), probe_interval=60)
+    circuits.record(URL, 45.0, TimeoutException())
+    circuits.check(URL)  # one failure: still closed
+    circuits.record(URL, 45.0, TimeoutException())
+
+    with pytest.raises(CircuitOpenError, match="2 consecutive failures"):
+        circuits.check(URL)
+    # Other hosts are unaffected.
+    circuits.check("https://www.example.test/")
+
+
+def test_success_resets_the_failure_count(tmp_path):
+    circuits = _circuits(tmp_path, _Probe())
+    circuits.record(URL, 45.0, TimeoutException())
+    circuits.record(URL, 1.0)
+    circuits.record(URL, 45.0, TimeoutException())
+    circuits.check(URL)
+
+
+def test_slow_navigations_count_as_degraded(tmp_path):
+    circuits = _circuits(tmp_path, _Probe(), slow_seconds=10, probe_interval=60)
+    circuits.record(URL, 12.0)
+    circuits.record(URL, 15.0)
+    with pytest.raises(CircuitOpenError, match="took 15.0s"):
+        circuits.check(URL)
+
+
+def test_due_probe_closes_the_circuit_when_host_answers(tmp_path):
+    probe = _Probe(healthy=False)
+    circuits = _circuits(tmp_path, probe, probe_interval=0)
+    circuits.record(URL, 45.0, TimeoutException())
+    circuits.record(URL, 45.0, TimeoutException())
+
+    with pytest.raises(CircuitOpenError):
+        circuits.check(URL)
+    probe.healthy = True
+    circuits.check(URL)
+
+    assert probe.calls == ["https://kabinetim.example.test/"] * 2
+    state = circuits.states()["kabinetim.example.test"]
+    assert not state["open"]
+    assert state["short_circuited"] == 1
+
+
+class _TimingOutDriver:
+    capabilities = {"pageLoadStrategy": "normal"}
+
+    def __init__(self):
+        self.gets = 0
+
+    def get(self, url):
+        self.gets += 1
+        raise TimeoutException("page load")
+
+
+def test_base_page_open_fails_fast_once_open(tmp_path):
+    circuit_breaker.configure(_circuits(tmp_path, _Probe(), probe_interval=60))
+    driver = _TimingOutDriver()
+    page = BasePage(driver, wait=None)
+    try:
+        for _ in range(2):
+            with pytest.raises(TimeoutException):
+                page.open(URL)
+        with pytest.raises(CircuitOpenError):
+            page.open(URL)
+    finally:
+        circuit_breaker.configure(None)
+    assert driver.gets == 2
+
+
+class _Link:
+    def get_attribute(self, name):
+        return URL if name == "href" else None
+
+
+class _HomePageDriver:
+    current_url = "https://www.example.test/"
+    window_handles = ["main"]
+
+    def execute_script(self, script, *args):
+        return "complete"
+
+    def find_element(self, by, value):
+        return _Link()
+
+
+def test_page_object_flow_surfaces_circuit_open_error(tmp_path):
+    circuits = _circuits(tmp_path, _Probe(), probe_interval=60)
+    for _ in range(2):
+        circuits.record(URL, 45.0, TimeoutException())
+    circuit_breaker.configure(circuits)
+    page = AzercellLoginPage(_HomePageDriver(), wait=None, timeout=1)
+    try:
+        # Not swallowed by the page object's broad error handling.
+        with pytest.raises(CircuitOpenError):
+            page.click_login_button()
+    finally:
+        circuit_breaker.configure(None)
@@ -0,0 +1,50 @@
+import threading
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from utils.downloads import DownloadWatcher
+
+
+def _finish_download_later(directory, name, delay=0.2):
+    def run():
+        partial = directory / f"{name}.crdownload"
+        partial.write_bytes(b"%PDF-1.4 partial")
+        partial.rename(directory / name)
+
+    timer = threading.Timer(delay, run)
+    timer.start()
+    return timer
+
+
+def test_returns_file_once_partial_is_renamed(tmp_path):
+    with DownloadWatcher(tmp_path) as watcher:
+        timer = _finish_download_later(tmp_path, "invoice.pdf")
+        path = watcher.wait(timeout=5)
+        timer.join()
+    assert path == tmp_path / "invoice.pdf"
+
+
+def test_files_present_before_start_are_ignored(tmp_path):
+    (tmp_path / "old.pdf").write_bytes(b"old")
+    with DownloadWatcher(tmp_path) as watcher:
+        with pytest.raises(TimeoutException):
+            watcher.wait(timeout=0.3)
+
+
+def test_pattern_skips_non_matching_downloads(tmp_path):
+    with DownloadWatcher(tmp_path) as watcher:
+        (tmp_path / "readme.txt").write_text("x")
+        timer = _finish_download_later(tmp_path, "statement.csv")
+        path = watcher.wait(timeout=5, pattern="*.csv")
+        timer.join()
+    assert path.name == "statement.csv"
+
+
+def test_downloads_can_be_collected_out_of_order(tmp_path):
+    with DownloadWatcher(tmp_path) as watcher:
+        for name in ("a.csv", "b.pdf"):
+            _finish_download_later(tmp_path, name, delay=0).join()
+        b = watcher.wait(timeout=5, pattern="b.*")
+        a = watcher.wait(timeout=5, pattern="a.*")
+    assert (a.name, b.name) == ("a.csv", "b.pdf")
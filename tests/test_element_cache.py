@@ -0,0 +1,115 @@
+import pytest
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+
+PHONE = (By.CSS_SELECTOR, "input[type='tel']")
+
+
+class _Element:
+    def __init__(self, generation):
+        self.generation = generation
+        self.stale = False
+
+    def get_attribute(self, name):
+        if self.stale:
+            raise StaleElementReferenceException("stale")
+        return f"value-{self.generation}"
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.capabilities = {"pageLoadStrategy": "normal"}
+        self.url = "https://example.test/login"
+        self.url_reads = 0
+        self.find_calls = 0
+        self.present = True
+        self.last = None
+
+    @property
+    def current_url(self):
+        self.url_reads += 1
+        return self.url
+
+    def find_element(self, by, value):
+        if not self.present:
+            raise NoSuchElementException(value)
+        self.find_calls += 1
+        self.last = _Element(self.find_calls)
+        return self.last
+
+    def get(self, url):
+        self.url = url
+        if self.last is not None:
+            self.last.stale = True
+
+
+def test_repeated_lookups_reuse_the_handle():
+    driver = _FakeDriver()
+    page = BasePage(driver, wait=None)
+
+    first = page.find(PHONE)
+    assert page.find(PHONE) is first
+    assert page.find("input[type='tel']") is first
+    assert driver.find_calls == 1
+    assert page.cache_stats["hits"] == 2
+    assert page.cache_stats["misses"] == 1
+    assert driver.url_reads == 0  # a hit costs no round trip at all
+
+
+def test_stale_handle_is_relocated_once():
+    driver = _FakeDriver()
+    page = BasePage(driver, wait=None)
+    page.find(PHONE).stale = True
+
+    value = page.with_element(PHONE, lambda el: el.get_attribute("value"))
+
+    assert value == "value-2"
+    assert page.cache_stats["stale"] == 1
+    assert driver.find_calls == 2
+
+
+def test_navigating_methods_clear_the_cache():
+    driver = _FakeDriver()
+    page = BasePage(driver, wait=None)
+
+    page.find(PHONE)
+    page.open("https://example.test/login")
+    page.find(PHONE)
+    assert driver.find_calls == 2
+
+    # e.g. after a link click or form submit
+    driver.get("https://example.test/otp")
+    page.wait_for_page_load(page.document_mark())
+    page.find(PHONE)
+    assert driver.find_calls == 3
+    assert page.cache_stats["clears"] == 2
+
+
+def test_unnoticed_navigation_is_caught_by_the_stale_retry():
+    driver = _FakeDriver()
+    page = BasePage(driver, wait=None)
+    page.find(PHONE)
+
+    driver.get("https://example.test/otp")
+    value = page.with_element(PHONE, lambda el: el.get_attribute("value"))
+
+    assert value == "value-2"
+    assert page.cache_stats["stale"] == 1
+    assert driver.url_reads == 0
+
+
+def test_missing_element_is_not_cached():
+    driver = _FakeDriver()
+    driver.present = False
+    page = BasePage(driver, wait=None)
+
+    with pytest.raises(NoSuchElementException):
+        page.find(PHONE)
+    driver.present = True
+    page.find(PHONE)
+    assert page.cache_stats["misses"] == 2
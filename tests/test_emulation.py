@@ -0,0 +1,38 @@
+import pytest
+
+from utils.emulation import apply_emulation, get_profile
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.cdp = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append((cmd, params))
+
+
+def test_unknown_profile_lists_available_names():
+    with pytest.raises(ValueError, match="slow-3g"):
+        get_profile("dial-up")
+
+
+def test_throttled_profile_converts_kbps_to_bytes_per_second():
+    driver = _FakeDriver()
+    apply_emulation(driver, get_profile("slow-3g"))
+    conditions = dict(driver.cdp)["Network.emulateNetworkConditions"]
+    assert conditions["latency"] == 2000
+    assert conditions["downloadThroughput"] == 50000
+    assert dict(driver.cdp)["Emulation.setCPUThrottlingRate"] == {"rate": 6}
+
+
+def test_noop_profile_only_resets_previously_throttled_driver():
+    driver = _FakeDriver()
+    apply_emulation(driver, get_profile("none"))
+    assert driver.cdp == []
+
+    apply_emulation(driver, get_profile("cpu-4x"))
+    driver.cdp.clear()
+    apply_emulation(driver, get_profile("none"))
+    conditions = dict(driver.cdp)["Network.emulateNetworkConditions"]
+    assert conditions["downloadThroughput"] == -1
+    assert dict(driver.cdp)["Emulation.setCPUThrottlingRate"] == {"rate": 1.0}
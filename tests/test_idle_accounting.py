@@ -0,0 +1,76 @@
+import os
+import time
+
+import pytest
+from selenium.webdriver.support.ui import WebDriverWait
+
+from pages.base_page import BasePage
+from utils.idle_accounting import IdleAccounting, RunSummary
+
+
+def _accounting():
+    return IdleAccounting(
+        is_page_object=lambda obj: isinstance(obj, BasePage),
+        helper_files=(os.path.join("pages", "base_page.py"),),
+    )
+
+
+class _DemoPage(BasePage):
+    def pause_then_wait(self):
+        time.sleep(0.05)
+        ready_at = time.monotonic() + 0.05
+        # The polling sleeps inside until() count as "wait", not "sleep".
+        WebDriverWait(self.driver, 1, poll_frequency=0.01).until(
+            lambda d: time.monotonic() >= ready_at
+        )
+
+
+def test_sleep_and_wait_are_charged_to_the_page_method():
+    accounting = _accounting()
+    accounting.install()
+    try:
+        with accounting.test_scope() as bucket:
+            _DemoPage(driver=object(), wait=None).pause_then_wait()
+            time.sleep(0.01)
+    finally:
+        accounting.uninstall()
+
+    method = bucket.methods["_DemoPage.pause_then_wait"]
+    assert 0.05 <= method["sleep"] < 0.1
+    assert 0.04 <= method["wait"] < 0.5
+    assert bucket.methods["(test body)"]["sleep"] >= 0.01
+    assert bucket.totals["sleep"] == pytest.approx(
+        method["sleep"] + bucket.methods["(test body)"]["sleep"]
+    )
+
+
+def test_nothing_is_recorded_outside_a_test_scope():
+    accounting = _accounting()
+    accounting.install()
+    try:
+        time.sleep(0.01)
+        with accounting.test_scope() as bucket:
+            pass
+    finally:
+        accounting.uninstall()
+    assert not bucket.totals
+
+
+def test_summary_ranks_tests_and_methods_by_idle_time():
+    summary = RunSummary()
+    summary.add_setup("t.py::fast", 0.1)
+    summary.add_call("t.py::fast", 1.0, {"totals": {"command": 0.8}, "methods": {}})
+    summary.add_call(
+        "t.py::slow",
+        9.0,
+        {
+            "totals": {"sleep": 6.0, "wait": 1.0},
+            "methods": {"LoginPage.submit": {"sleep": 6.0, "wait": 1.0}},
+        },
+    )
+
+    lines = summary.format(top=5)
+
+    assert lines[1].startswith("t.py::slow")
+    assert any(line.startswith("LoginPage.submit") for line in lines)
+    assert lines[-1] == "idle (sleep + wait) 7.0s of 10.0s test time"
@@ -0,0 +1,94 @@
+from utils.impact import function_at, function_spans, parse_diff, select_tests
+
+SOURCE = """\
+import os
+
+
+class Page:
+    LOCATOR = ("css", "input")
+
+    def open(self):
+        return 1
+
+    def submit(self):
+        def inner():
+            return 2
+        return inner()
+
+
+def helper():
+    return 3
+"""
+
+DIFF = """\
+diff --git a/pages/page.py b/pages/page.py
+--- a/pages/page.py
++++ b/pages/page.py
+@@ -8 +8 @@ class Page:
+-        return 1
++        return 10
+@@ -13,0 +14,1 @@ class Page:
++        # comment
+diff --git a/utils/new.py b/utils/new.py
+--- /dev/null
++++ b/utils/new.py
+@@ -0,0 +1,2 @@
++def fresh():
++    pass
+"""
+
+
+def test_function_spans_use_qualified_names():
+    spans = function_spans(SOURCE)
+    assert function_at(spans, 8) == "Page.open"
+    assert function_at(spans, 12) == "Page.submit.inner"
+    assert function_at(spans, 13) == "Page.submit"
+    assert function_at(spans, 17) == "helper"
+    assert function_at(spans, 5) == "<module>"
+
+
+def test_parse_diff_collects_old_and_new_lines():
+    changes = parse_diff(DIFF)
+    assert changes["pages/page.py"] == ({8, 13}, {8, 14})
+    assert changes["utils/new.py"] == ({1}, {1, 2})
+
+
+MAP = {
+    "autotests/test_a.py::test_open": ["pages/page.py::Page.open"],
+    "autotests/test_a.py::test_submit": ["pages/page.py::Page.submit"],
+    "autotests/test_b.py::test_phone": ["utils/phone.py::normalize_phone_number"],
+}
+NODEIDS = [*MAP, "autotests/test_b.py::test_new"]
+
+
+def test_select_only_tests_touching_changed_functions():
+    selected = select_tests(
+        MAP, NODEIDS, {"pages/page.py"}, {"pages/page.py::Page.submit"}
+    )
+    assert selected == {
+        "autotests/test_a.py::test_submit",
+        # Unknown to the map, so it always runs.
+        "autotests/test_b.py::test_new",
+    }
+
+
+def test_module_level_change_selects_every_test_using_the_file():
+    selected = select_tests(
+        MAP, NODEIDS, {"pages/page.py"}, {"pages/page.py::<module>"}
+    )
+    assert "autotests/test_a.py::test_open" in selected
+    assert "autotests/test_a.py::test_submit" in selected
+    assert "autotests/test_b.py::test_phone" not in selected
+
+
+def test_changed_test_file_selects_its_tests():
+    selected = select_tests(MAP, NODEIDS, {"autotests/test_b.py"}, set())
+    assert selected == {
+        "autotests/test_b.py::test_phone",
+        "autotests/test_b.py::test_new",
+    }
+
+
+def test_shared_code_change_runs_everything():
+    assert select_tests(MAP, NODEIDS, {"conftest.py"}, set()) is None
+    assert select_tests(MAP, NODEIDS, {"pages/base_page.py"}, set()) is None
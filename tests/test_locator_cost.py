@@ -0,0 +1,61 @@
+from selenium.webdriver.common.by import By
+
+from benchmarks.locator_cost import (
+    _in_page_form,
+    format_table,
+    page_locators,
+    slow_locators,
+)
+from pages.base_page import BasePage
+
+
+class _Page(BasePage):
+    PHONE_INPUT = (By.CSS_SELECTOR, "input[type='tel']")
+    READY_WHEN = PHONE_INPUT
+    SUBMIT = (By.XPATH, "//button[@type='submit']")
+    HELP_LINK = (By.LINK_TEXT, "Help")
+    TIMEOUT = 15
+    Lowercase = (By.ID, "ignored")
+
+
+def test_page_locators_lists_aliases_once():
+    locators = page_locators(_Page)
+
+    assert locators == {
+        "HELP_LINK": (By.LINK_TEXT, "Help"),
+        "PHONE_INPUT": (By.CSS_SELECTOR, "input[type='tel']"),
+        "SUBMIT": (By.XPATH, "//button[@type='submit']"),
+    }
+
+
+def test_simple_strategies_are_evaluated_as_css():
+    assert _in_page_form(By.ID, "phone") == ("css", '[id="phone"]')
+    assert _in_page_form(By.NAME, "msisdn") == ("css", '[name="msisdn"]')
+    assert _in_page_form(By.CLASS_NAME, "error") == ("css", ".error")
+    assert _in_page_form(By.TAG_NAME, "a") == ("css", "a")
+    assert _in_page_form(By.CSS_SELECTOR, "a.login") == ("css", "a.login")
+    assert _in_page_form(By.XPATH, "//a") == ("xpath", "//a")
+    assert _in_page_form(By.LINK_TEXT, "Help") is None
+
+
+RESULTS = {
+    "PHONE_INPUT": {"by": "css", "matches": 1, "p50_us": 12.0, "max_us": 20.0},
+    "SUBMIT": {"by": "xpath", "matches": 2, "p50_us": 180.0, "max_us": 250.0},
+    "BROKEN": {"by": "css", "error": "SyntaxError: bad selector"},
+    "HELP_LINK": {"by": By.LINK_TEXT, "skipped": "not evaluable in the page"},
+}
+
+
+def test_slow_locators_uses_the_median():
+    assert slow_locators(RESULTS, threshold_us=100.0) == ["SUBMIT"]
+    assert slow_locators(RESULTS, threshold_us=500.0) == []
+
+
+def test_format_table_ranks_by_cost_and_flags_slow_ones():
+    lines = format_table(RESULTS, threshold_us=100.0)
+
+    assert lines[0].startswith("locator")
+    assert lines[1].startswith("SUBMIT") and lines[1].endswith("SLOW")
+    assert lines[2].startswith("PHONE_INPUT") and "SLOW" not in lines[2]
+    assert "SyntaxError: bad selector" in "\n".join(lines[3:])
+    assert "not evaluable in the page" in "\n".join(lines[3:])
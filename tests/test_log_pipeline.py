@@ -0,0 +1,68 @@
+import json
+import logging
+
+from utils import log_pipeline
+from utils.log_pipeline import JsonFormatter, merge_worker_logs
+
+
+def _record(msg, level=logging.INFO, **extra):
+    record = logging.LogRecord("pages.demo", level, __file__, 1, msg, None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_includes_test_context():
+    record = _record("hello", worker="gw0", nodeid="t.py::test_a")
+    payload = json.loads(JsonFormatter().format(record))
+    assert payload["msg"] == "hello"
+    assert payload["worker"] == "gw0"
+    assert payload["nodeid"] == "t.py::test_a"
+    assert payload["level"] == "INFO"
+
+
+def test_merge_orders_records_from_all_workers_by_time(tmp_path):
+    (tmp_path / "gw0.jsonl").write_text(
+        '{"ts": 1.0, "level": "INFO", "msg": "a"}\n'
+        '{"ts": 3.0, "level": "WARNING", "msg": "c"}\n'
+    )
+    (tmp_path / "gw1.jsonl").write_text('{"ts": 2.0, "level": "INFO", "msg": "b"}\n')
+
+    merged, counts = merge_worker_logs(tmp_path)
+
+    lines = merged.read_text().splitlines()
+    assert [json.loads(line)["msg"] for line in lines] == ["a", "b", "c"]
+    assert counts == {"INFO": 2, "WARNING": 1}
+
+
+def test_pipeline_writes_records_from_the_listener_thread(tmp_path):
+    pipeline = log_pipeline.LogPipeline(tmp_path, logging.WARNING)
+    pipeline.start()
+    try:
+        log_pipeline.set_current_test("t.py::test_b")
+        logging.getLogger("pages.demo").warning("queued")
+    finally:
+        log_pipeline.set_current_test(None)
+        pipeline.stop()
+
+    records = [json.loads(line) for line in pipeline.json_path.read_text().splitlines()]
+    assert any(r["msg"] == "queued" and r["nodeid"] == "t.py::test_b" for r in records)
+
+
+def test_exceptions_reach_the_json_file_unformatted(tmp_path):
+    pipeline = log_pipeline.LogPipeline(tmp_path, logging.CRITICAL)
+    pipeline.start()
+    try:
+        try:
+            raise ValueError("bad phone")
+        except ValueError:
+            logging.getLogger("pages.demo").exception("submit failed for %s", "x")
+    finally:
+        pipeline.stop()
+
+    (record,) = [
+        r
+        for r in map(json.loads, pipeline.json_path.read_text().splitlines())
+        if r["logger"] == "pages.demo"
+    ]
+    assert record["msg"] == "submit failed for x"
+    assert "ValueError: bad phone" in record["exc"]
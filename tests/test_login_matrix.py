@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from benchmarks.login_matrix import read_phones, run_matrix
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_event = threading.Event()
+
+    def quit(self):
+        self.quit_event.set()
+
+
+def test_results_keep_input_order_and_concurrency_is_bounded():
+    live = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def flow(driver, result):
+        nonlocal live, peak
+        with lock:
+            live += 1
+            peak = max(peak, live)
+        time.sleep(0.05)
+        with lock:
+            live -= 1
+        result.status = "otp" if result.phone.endswith("1") else "submitted"
+
+    phones = [f"5012345{i:02d}" for i in range(8)]
+    results = asyncio.run(run_matrix(phones, FakeDriver, concurrency=3, flow=flow))
+
+    assert [r.phone for r in results] == phones
+    assert peak == 3
+    assert results[1].status == "otp"
+    assert "driver" in results[0].timings
+
+
+def test_timeout_quits_the_driver_and_marks_the_flow():
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    def hanging_flow(driver, result):
+        if not driver.quit_event.wait(5):
+            result.status = "otp"
+        else:
+            raise RuntimeError("session deleted")
+
+    results = asyncio.run(
+        run_matrix(["501234567"], factory, flow_timeout=0.2, flow=hanging_flow)
+    )
+
+    assert results[0].status == "timeout"
+    assert results[0].error == ""
+    assert drivers[0].quit_event.is_set()
+
+
+def test_timed_out_flow_keeps_its_slot_and_late_results_are_ignored():
+    live = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def stubborn_flow(driver, result):
+        # Ignores the quit and finishes late with a "success".
+        nonlocal live, peak
+        with lock:
+            live += 1
+            peak = max(peak, live)
+        time.sleep(0.4 if result.phone.endswith("7") else 0.0)
+        result.status = "otp"
+        with lock:
+            live -= 1
+
+    results = asyncio.run(
+        run_matrix(
+            ["501234567", "551234568"],
+            FakeDriver,
+            concurrency=1,
+            flow_timeout=0.1,
+            flow=stubborn_flow,
+        )
+    )
+
+    assert [r.status for r in results] == ["timeout", "otp"]
+    assert peak == 1
+    assert 0.05 < results[0].duration_s < 0.4
+
+
+def test_flow_errors_are_recorded_not_raised():
+    def failing_flow(driver, result):
+        raise ValueError("boom")
+
+    results = asyncio.run(run_matrix(["501234567"], FakeDriver, flow=failing_flow))
+
+    assert results[0].status == "error"
+    assert "boom" in results[0].error
+
+
+def test_invalid_concurrency_is_rejected():
+    with pytest.raises(ValueError):
+        asyncio.run(run_matrix([], FakeDriver, concurrency=0))
+
+
+def test_read_phones_normalizes_and_deduplicates(tmp_path):
+    numbers = tmp_path / "numbers.txt"
+    numbers.write_text("# batch 1\n050 123 45 67\n+994501234567\n\n551234567\n")
+
+    assert read_phones(str(numbers), "0701234567") == [
+        "501234567",
+        "551234567",
+        "701234567",
+    ]
@@ -0,0 +1,145 @@
+import json
+
+from utils import metrics_store
+
+UI_JUNIT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" timestamp="{ts}" tests="3">
+<testcase classname="autotests.test_smoke" name="test_home" time="{home}"/>
+<testcase classname="autotests.test_smoke" name="test_login" time="9.0">
+  <failure message="boom"/>
+</testcase>
+<testcase classname="autotests.test_smoke" name="test_otp" time="0.0">
+  <skipped/>
+</testcase>
+</testsuite></testsuites>
+"""
+
+NEWMAN_JUNIT = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuites name="Restful Booker">
+<testsuite name="Get booking ids" timestamp="2026-01-01T10:00:00.000Z" time="0.250">
+  <testcase name="Status code is 200" time="0.250"/>
+</testsuite>
+<testsuite name="Create booking" time="0.400">
+  <testcase name="Status code is 200" time="0.400"><failure/></testcase>
+</testsuite>
+</testsuites>
+"""
+
+
+def _ui_report(tmp_path, day, home_seconds):
+    path = tmp_path / "reports" / "ui" / f"ui-junit-{day}.xml"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        UI_JUNIT.format(ts=f"2026-01-{day:02d}T08:00:00", home=home_seconds)
+    )
+    return path
+
+
+def test_ui_junit_ingest_is_idempotent(tmp_path):
+    path = _ui_report(tmp_path, 1, 1.5)
+    with metrics_store.connect(tmp_path / "m.sqlite") as conn:
+        assert metrics_store.ingest(conn, path) is not None
+        assert metrics_store.ingest(conn, path) is None
+        rows = conn.execute("SELECT name, value, outcome FROM samples").fetchall()
+
+    assert ("autotests.test_smoke::test_home", 1500.0, "passed") in rows
+    assert ("autotests.test_smoke::test_login", 9000.0, "failed") in rows
+
+
+def test_run_commit_comes_from_the_run_not_the_ingest(tmp_path, monkeypatch):
+    first = _ui_report(tmp_path, 1, 1.5)
+    monkeypatch.setenv("GITHUB_SHA", "a" * 40)
+    metrics_store.record_commit(first.parent)
+    monkeypatch.setenv("GITHUB_SHA", "b" * 40)
+    other = tmp_path / "elsewhere" / "ui-junit.xml"
+    other.parent.mkdir()
+    other.write_text(UI_JUNIT.format(ts="2026-01-02T08:00:00", home=2.0))
+
+    with metrics_store.connect(tmp_path / "m.sqlite") as conn:
+        metrics_store.ingest(conn, first)
+        metrics_store.ingest(conn, other)
+        shas = conn.execute("SELECT commit_sha FROM runs ORDER BY id").fetchall()
+
+    assert shas == [("a" * 40,), (None,)]
+
+
+def test_newman_junit_records_one_sample_per_request(tmp_path):
+    path = tmp_path / "postman" / "reports" / "20260101_100000" / "newman.xml"
+    path.parent.mkdir(parents=True)
+    path.write_text(NEWMAN_JUNIT)
+
+    started, samples = metrics_store.parse_junit(path, "api")
+
+    assert metrics_store.detect_source(path) == "api"
+    assert started == "2026-01-01T10:00:00.000Z"
+    assert samples == [
+        ("Get booking ids", "duration_ms", 250.0, "passed"),
+        ("Create booking", "duration_ms", 400.0, "failed"),
+    ]
+
+
+def test_k6_summary_both_layouts(tmp_path):
+    exported = tmp_path / "export.json"
+    exported.write_text(
+        json.dumps(
+            {
+                "metrics": {
+                    "http_req_duration{name:GET /booking}": {
+                        "avg": 120.0,
+                        "med": 100.0,
+                        "p(95)": 300.0,
+                    },
+                    "http_reqs": {"count": 10, "rate": 1.0},
+                }
+            }
+        )
+    )
+    handled = tmp_path / "handled.json"
+    handled.write_text(
+        json.dumps(
+            {
+                "metrics": {
+                    "iteration_duration": {
+                        "type": "trend",
+                        "values": {"avg": 900.0, "p(90)": 1200.0},
+                    },
+                    "checks": {"type": "rate", "values": {"rate": 1.0}},
+                }
+            }
+        )
+    )
+
+    assert metrics_store.parse_k6_summary(exported) == [
+        ("http_req_duration{name:GET /booking}", "avg_ms", 120.0, None),
+        ("http_req_duration{name:GET /booking}", "p50_ms", 100.0, None),
+        ("http_req_duration{name:GET /booking}", "p95_ms", 300.0, None),
+    ]
+    assert metrics_store.parse_k6_summary(handled) == [
+        ("iteration_duration", "avg_ms", 900.0, None),
+        ("iteration_duration", "p90_ms", 1200.0, None),
+    ]
+
+
+def test_report_flags_regression_against_rolling_baseline(tmp_path):
+    with metrics_store.connect(tmp_path / "m.sqlite") as conn:
+        for day, seconds in enumerate([1.0, 1.1, 0.9, 1.0, 2.0], start=1):
+            metrics_store.ingest(conn, _ui_report(tmp_path, day, seconds))
+        reports = metrics_store.build_report(conn, baseline_runs=3)
+
+    # Failed and skipped tests are excluded from the series.
+    assert [r.name for r in reports] == ["autotests.test_smoke::test_home"]
+    home = reports[0]
+    assert home.values == [1000.0, 1100.0, 900.0, 1000.0, 2000.0]
+    assert home.baseline == 1000.0
+    assert home.regressed
+
+
+def test_export_csv(tmp_path):
+    out = tmp_path / "out" / "metrics.csv"
+    with metrics_store.connect(tmp_path / "m.sqlite") as conn:
+        metrics_store.ingest(conn, _ui_report(tmp_path, 1, 1.0))
+        count = metrics_store.export_csv(conn, out)
+
+    lines = out.read_text().splitlines()
+    assert count == 3
+    assert lines[0].startswith("source,started,commit,name,metric,value")
@@ -0,0 +1,157 @@
+import json
+
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from pages.azercell_login_page import AzercellLoginPage
+from pages.base_page import BasePage
+from utils import network_log
+
+OTP = r"/api/otp/send"
+
+
+def _entry(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+def _request(request_id, url, t, method="POST", **extra):
+    return _entry(
+        "Network.requestWillBeSent",
+        requestId=request_id,
+        request={"url": url, "method": method},
+        type="XHR",
+        timestamp=t,
+        **extra,
+    )
+
+
+def _response(request_id, status, send_end=2.0, headers_end=182.0):
+    return _entry(
+        "Network.responseReceived",
+        requestId=request_id,
+        response={
+            "status": status,
+            "timing": {"sendEnd": send_end, "receiveHeadersEnd": headers_end},
+        },
+    )
+
+
+def _finished(request_id, t):
+    return _entry("Network.loadingFinished", requestId=request_id, timestamp=t)
+
+
+class _Driver:
+    """Serves queued performance-log batches, one per get_log call."""
+
+    capabilities = {"pageLoadStrategy": "normal"}
+
+    def __init__(self, *batches):
+        self.batches = list(batches)
+
+    def get_log(self, log_type):
+        assert log_type == "performance"
+        return self.batches.pop(0) if self.batches else []
+
+
+def test_events_fold_into_exchanges_with_backend_timing():
+    driver = _Driver(
+        [
+            _request("1", "https://x.test/api/otp/send?lang=az", 10.0),
+            _response("1", 200),
+            _finished("1", 10.25),
+        ]
+    )
+    page = BasePage(driver, wait=None)
+
+    exchange = page.wait_for_request(OTP, method="post", timeout=1)
+
+    assert exchange.status == 200
+    assert exchange.server_ms == 180.0
+    assert exchange.total_ms == 250.0
+    assert network_log.drain_observed(driver) == [exchange]
+
+
+def test_only_completed_requests_after_the_mark_match():
+    driver = _Driver(
+        [
+            _request("old", "https://x.test/api/otp/send", 1.0),
+            _finished("old", 1.1),
+        ],
+        [],
+        [_request("new", "https://x.test/api/otp/send", 5.0)],
+        [_response("new", 429), _finished("new", 5.4)],
+    )
+    page = BasePage(driver, wait=None)
+    since = page.network_mark()
+
+    exchange = page.wait_for_request(OTP, since=since, timeout=1)
+
+    assert exchange.request_id == "new"
+    assert exchange.status == 429
+
+
+def test_redirects_follow_the_same_request():
+    network = network_log.NetworkLog(
+        _Driver(
+            [
+                _request("1", "https://x.test/login", 1.0),
+                _request("1", "https://x.test/api/otp/send", 1.1, redirectResponse={}),
+                _finished("1", 1.3),
+            ]
+        )
+    )
+    assert network.wait_for(OTP, timeout=1).url == "https://x.test/api/otp/send"
+
+
+def test_wait_times_out_without_a_match():
+    page = BasePage(_Driver(), wait=None)
+    with pytest.raises(TimeoutException):
+        page.wait_for_request(OTP, timeout=0.2)
+
+
+def test_wait_defaults_to_the_page_timeout():
+    page = BasePage(_Driver(), wait=None, timeout=0.2)
+    with pytest.raises(TimeoutException, match="within 0.2s"):
+        page.wait_for_request(OTP)
+
+
+def test_submit_warns_when_the_match_is_not_the_otp_endpoint(caplog):
+    class _WidenedPage(AzercellLoginPage):
+        OTP_REQUEST = r"(?i)(otp|login)"
+
+    driver = _Driver(
+        [
+            _request("1", "https://x.test/api/login/track", 1.0),
+            _finished("1", 1.1),
+        ]
+    )
+    page = _WidenedPage(driver, wait=None, timeout=1)
+
+    page._wait_for_submit_response(since=0, document=None)
+
+    assert page.last_submit_request.url == "https://x.test/api/login/track"
+    assert "not the send-OTP endpoint" in caplog.text
+
+
+def test_network_mark_is_none_without_performance_log():
+    class _NoLogDriver:
+        def get_log(self, log_type):
+            raise WebDriverException("log type 'performance' not found")
+
+    assert BasePage(_NoLogDriver(), wait=None).network_mark() is None
+
+
+def test_summary_groups_by_endpoint():
+    exchanges = [
+        {
+            "method": "POST",
+            "url": f"https://x.test/api/otp/send?n={i}",
+            "status": 200,
+            "error": None,
+            "server_ms": ms,
+        }
+        for i, ms in enumerate([100.0, 200.0, 300.0])
+    ]
+    (line,) = network_log.format_summary(exchanges)
+    assert line.startswith("POST https://x.test/api/otp/send: n=3 status 200")
+    assert "server p50 200ms" in line
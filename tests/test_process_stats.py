@@ -0,0 +1,20 @@
+from utils.process_stats import cpu_seconds_since
+
+
+def test_cpu_delta_is_per_process():
+    before = {1: 10.0, 2: 5.0}
+    after = {1: 12.0, 2: 6.5}
+    assert cpu_seconds_since(before, after) == 3.5
+
+
+def test_exited_child_does_not_make_cpu_negative():
+    # Renderer 3 used 40 s before the test and exited during it.
+    before = {1: 10.0, 3: 40.0}
+    after = {1: 11.0}
+    assert cpu_seconds_since(before, after) == 1.0
+
+
+def test_new_child_counts_in_full_and_reused_pid_is_clamped():
+    before = {1: 10.0, 4: 30.0}
+    after = {1: 10.0, 4: 0.5, 5: 2.0}
+    assert cpu_seconds_since(before, after) == 2.0
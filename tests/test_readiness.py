@@ -0,0 +1,196 @@
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+from utils import readiness
+
+URL = "https://example.test/login"
+
+
+class _Element:
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+
+class _LoadingDriver:
+    """Page load strategy "none": the phone field shows up after 3 polls,
+    the load event at 1500 ms of page time (if loading is not stopped).
+
+    A navigation commits ``commit_after`` commands after get(); until
+    then the previous document (origin, field, readyState) is current.
+    """
+
+    def __init__(self, strategy="none", commit_after=0):
+        self.capabilities = {"pageLoadStrategy": strategy}
+        self.timeouts = SimpleNamespace(page_load=2)
+        self.commit_after = commit_after
+        self.pending = None
+        self.origin = 1.0
+        self.polls = 0
+        self.now = 0.0
+        self.state = "loading"
+        self.stopped = False
+
+    def get(self, url):
+        # also stands in for a click or submit that navigates
+        self.pending = self.commit_after
+        self._command()
+
+    def _command(self):
+        if self.pending is None:
+            return
+        if self.pending > 0:
+            self.pending -= 1
+            return
+        self.pending = None
+        self.origin += 1
+        self.polls = 0
+        self.now = 0.0
+        self.state = "loading"
+        self.stopped = False
+
+    def _tick(self):
+        self.polls += 1
+        self.now += 100.0
+        if self.now >= 1500 and not self.stopped:
+            self.state = "complete"
+
+    def find_elements(self, by, value):
+        self._command()
+        self._tick()
+        return [_Element()] if self.polls >= 3 else []
+
+    def execute_script(self, script, *args):
+        self._command()
+        if "window.stop" in script:
+            self.stopped = True
+            self.state = "interactive"
+            return None
+        if script == readiness._ORIGIN_JS:
+            return self.origin
+        if script == readiness._LOAD_STATE_JS:
+            self._tick()
+            return [self.origin, self.state]
+        if script.strip() == "return document.readyState;":
+            self._tick()
+            return self.state
+        return {
+            "state": self.state,
+            "origin": self.origin,
+            "now": self.now,
+            "load": 1500.0 if self.state == "complete" else 0,
+        }
+
+
+class _LoginPage(BasePage):
+    READY_WHEN = (By.CSS_SELECTOR, "input[type='tel']")
+
+
+@pytest.fixture(autouse=True)
+def _no_baseline():
+    readiness._full_load_ms.clear()
+    yield
+    readiness._full_load_ms.clear()
+
+
+def test_gated_open_returns_at_readiness_and_stops_loading():
+    driver = _LoadingDriver()
+    _LoginPage(driver, wait=None).open(URL, stop_loading=True)
+
+    assert driver.stopped
+    (nav,) = readiness.drain(driver)
+    assert nav.ready_ms == 300.0
+    assert nav.stopped and nav.load_ms is None  # no full load seen yet
+
+
+def test_saved_time_uses_last_strict_load_of_the_url():
+    driver = _LoadingDriver()
+    page = _LoginPage(driver, wait=None)
+    page.open(URL, strict=True)
+    page.open(URL, stop_loading=True)
+
+    strict, gated = readiness.drain(driver)
+    assert strict.strict and strict.load_ms == 1500.0
+    assert gated.load_ms == 1500.0
+    assert gated.saved_ms == 1200.0
+
+    lines = readiness.format_summary([strict.as_dict(), gated.as_dict()])
+    assert lines[0] == "1 gated navigations (1 stopped early), 1 strict"
+    assert "1200ms per navigation" in lines[1]
+
+
+def test_pending_navigation_is_resolved_when_the_load_finished():
+    driver = _LoadingDriver()
+    _LoginPage(driver, wait=None).open(URL)
+    while driver.state != "complete":
+        driver._tick()
+
+    (nav,) = readiness.drain(driver)
+    assert not nav.stopped
+    assert nav.saved_ms == 1200.0
+
+
+def test_readiness_wait_is_bounded_by_the_page_load_timeout():
+    class _NeverReady(_LoginPage):
+        def is_ready(self):
+            return False
+
+    driver = _LoadingDriver()
+    driver.timeouts.page_load = 0.1
+    with pytest.raises(TimeoutException):
+        _NeverReady(driver, wait=None).open(URL)
+
+
+def test_other_load_strategies_are_left_to_the_driver():
+    driver = _LoadingDriver(strategy="normal")
+    _LoginPage(driver, wait=None).open(URL)
+
+    assert driver.polls == 0
+    assert readiness.drain(driver) == []
+
+
+def test_reopening_waits_for_the_new_document():
+    # A reused browser still shows the loaded login page (field present,
+    # readyState "complete") for a few commands after driver.get.
+    driver = _LoadingDriver(commit_after=3)
+    page = _LoginPage(driver, wait=None)
+    page.open(URL, strict=True)
+    page.open(URL, stop_loading=True)
+
+    strict, gated = readiness.drain(driver)
+    assert gated.origin == strict.origin + 1
+    assert gated.ready_ms == 300.0
+    assert driver.stopped  # the new document, not the old one
+
+    page.open(URL, strict=True)
+    (again,) = readiness.drain(driver)
+    assert again.origin == gated.origin + 1 and again.load_ms == 1500.0
+
+
+def test_wait_for_page_load_covers_navigations_outside_open():
+    # e.g. the page a link click or form submit led to
+    driver = _LoadingDriver(commit_after=3)
+    page = _LoginPage(driver, wait=None)
+    page.open(URL, strict=True)
+    mark = page.document_mark()
+    driver.get(URL)  # the click
+    page.wait_for_page_load(mark)
+    assert driver.origin == mark + 1 and driver.state == "complete"
+
+    ungated = _LoadingDriver(strategy="normal")
+    _LoginPage(ungated, wait=None).wait_for_page_load(None)
+    assert ungated.polls == 0
+
+
+def test_wait_for_page_load_returns_when_nothing_navigated():
+    driver = _LoadingDriver()
+    page = _LoginPage(driver, wait=None)
+    mark = page.document_mark()
+    page.wait_for_page_load(mark, commit_timeout=0.1)
+    assert driver.origin == mark and driver.state == "loading"
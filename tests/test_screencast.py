@@ -0,0 +1,50 @@
+import base64
+import io
+import time
+
+from PIL import Image
+
+from utils.screencast import ScreencastBuffer
+
+
+def _jpeg(color):
+    out = io.BytesIO()
+    Image.new("RGB", (48, 27), color).save(out, format="JPEG")
+    return base64.b64encode(out.getvalue()).decode()
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.frames = 0
+        self.clips = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == "Page.getLayoutMetrics":
+            return {"cssVisualViewport": {"clientWidth": 1920, "clientHeight": 1080}}
+        self.frames += 1
+        self.clips.append(params["clip"])
+        return {"data": _jpeg((self.frames * 20 % 256, 0, 0))}
+
+
+def test_buffer_keeps_only_the_last_frames_and_encodes_gif(tmp_path):
+    driver = _FakeDriver()
+    buffer = ScreencastBuffer(driver, seconds=0.2, fps=50).start()
+    time.sleep(0.5)
+    buffer.stop()
+
+    assert driver.frames > len(buffer.frames) == 10
+    assert driver.clips[0]["scale"] == 0.25  # 480 / 1920
+
+    path = buffer.save_gif(tmp_path / "fail.gif")
+    with Image.open(path) as gif:
+        assert gif.n_frames == 10
+
+    overhead = buffer.overhead()
+    assert overhead["frames"] == driver.frames
+    assert overhead["peak_buffer_kb"] > 0
+
+
+def test_empty_buffer_writes_nothing(tmp_path):
+    buffer = ScreencastBuffer(_FakeDriver())
+    assert buffer.save_gif(tmp_path / "none.gif") is None
+    assert not (tmp_path / "none.gif").exists()
@@ -0,0 +1,28 @@
+import pytest
+
+from utils.stats import mean_ci, percentile, summarize
+
+
+def test_percentile_interpolates_between_samples():
+    samples = [1.0, 2.0, 3.0, 4.0]
+    assert percentile(samples, 0) == 1.0
+    assert percentile(samples, 100) == 4.0
+    assert percentile(samples, 50) == pytest.approx(2.5)
+
+
+def test_percentile_of_empty_sequence_is_zero():
+    assert percentile([], 99) == 0.0
+
+
+def test_mean_ci_uses_t_distribution_for_small_samples():
+    mean, half = mean_ci([10.0, 12.0, 14.0])
+    assert mean == pytest.approx(12.0)
+    # stdev=2, stderr=2/sqrt(3), t(2)=4.303
+    assert half == pytest.approx(4.303 * 2 / 3**0.5, rel=1e-3)
+
+
+def test_summarize_single_sample_has_zero_interval():
+    summary = summarize([5.0])
+    assert summary["n"] == 1
+    assert summary["mean"] == 5.0
+    assert summary["ci95"] == 0.0
@@ -0,0 +1,59 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from pages.base_page import BasePage
+from utils import virtual_time
+
+
+class _FakeDriver:
+    """Page clock that jumps to the end of each granted budget."""
+
+    def __init__(self, stuck=False):
+        self.now_ms = 1000.0
+        self.stuck = stuck
+        self.commands = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((cmd, params))
+        if "budget" in params and not self.stuck:
+            self.now_ms += params["budget"]
+        return {}
+
+    def execute_script(self, script):
+        assert script == "return performance.now();"
+        return self.now_ms
+
+
+def test_pause_then_advance_in_bursts():
+    driver = _FakeDriver()
+    page = BasePage(driver, wait=None)
+
+    page.pause_time()
+    page.advance_time(60)
+    page.advance_time(0.5, wait_for_network=True)
+
+    assert virtual_time.is_enabled(driver)
+    assert driver.now_ms == 1000.0 + 60_500
+    assert [params for _, params in driver.commands] == [
+        {"policy": "pause"},
+        {"policy": "advance", "budget": 60_000},
+        {"policy": "pauseIfNetworkFetchesPending", "budget": 500},
+    ]
+
+
+def test_settle_uses_virtual_time_only_when_enabled():
+    real = _FakeDriver()
+    BasePage(real, wait=None).settle(0.01)
+    assert real.commands == []
+
+    paused = _FakeDriver()
+    page = BasePage(paused, wait=None)
+    page.pause_time()
+    page.settle(0.5)
+    assert paused.commands[-1][1] == {"policy": "advance", "budget": 500}
+
+
+def test_advance_times_out_when_clock_does_not_move():
+    driver = _FakeDriver(stuck=True)
+    with pytest.raises(TimeoutException):
+        virtual_time.advance(driver, 1, timeout=0.1)
@@ -0,0 +1,28 @@
+from utils.webdriver_commands import count_commands
+
+
+class _FakeDriver:
+    def execute(self, driver_command, params=None):
+        return {"value": driver_command}
+
+
+def test_count_commands_counts_and_restores_execute():
+    driver = _FakeDriver()
+    with count_commands(driver) as counter:
+        driver.execute("findElements", {})
+        driver.execute("findElements", {})
+        driver.execute("getCurrentUrl")
+    assert counter.counts == {"findElements": 2, "getCurrentUrl": 1}
+    assert counter.total == 3
+    assert "execute" not in vars(driver)
+
+
+def test_nested_counters_both_see_commands():
+    driver = _FakeDriver()
+    with count_commands(driver) as outer:
+        with count_commands(driver) as inner:
+            driver.execute("clickElement")
+        driver.execute("getTitle")
+    assert inner.total == 1
+    assert outer.total == 2
+    assert "execute" not in vars(driver)
@@ -0,0 +1,128 @@
+"""
+Per-locator timeouts learned from observed element latencies.
+
+Opt-in via ``ADAPTIVE_TIMEOUTS=1``. While enabled, every named locator
+wait in ``BasePage.wait_for`` records how long the element took to
+appear. The history is persisted as JSON between runs and used to derive
+a timeout per ``<PageClass>.<LOCATOR>``:
+
+    timeout = clamp(p99(samples) * margin, min(min_timeout, default), max_timeout)
+
+Until a locator has ``min_samples`` observations the caller's ``default``
+bound is used unchanged; a ``timeout`` passed to ``wait_for`` caps the
+learned one. A wait that times out is recorded with its bound, so a
+locator that got slower gets a longer timeout on the next run instead of
+failing again. Probes (``probe=True``: is the element there?) record
+only the times an element did appear: their timeouts mean "absent".
+"""
+
+import json
+import logging
+import os
+import pathlib
+from typing import Optional
+
+from utils.file_lock import locked
+from utils.stats import percentile
+
+log = logging.getLogger(__name__)
+
+
+class LocatorTimings:
+    """Observed appearance latencies and the timeouts derived from them."""
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        margin: float = 1.5,
+        min_timeout: float = 1.0,
+        max_timeout: float = 30.0,
+        min_samples: int = 5,
+        max_samples: int = 200,
+    ):
+        self.path = path
+        self.margin = margin
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.history: dict[str, list[float]] = {}
+        # Samples recorded in this process and not yet persisted.
+        self._pending: dict[str, list[float]] = {}
+
+    @classmethod
+    def from_env(cls, path: pathlib.Path) -> "LocatorTimings":
+        timings = cls(
+            path,
+            margin=float(os.getenv("ADAPTIVE_TIMEOUT_MARGIN", "1.5")),
+            min_timeout=float(os.getenv("ADAPTIVE_TIMEOUT_MIN", "1")),
+            max_timeout=float(os.getenv("ADAPTIVE_TIMEOUT_MAX", "30")),
+            min_samples=int(os.getenv("ADAPTIVE_TIMEOUT_MIN_SAMPLES", "5")),
+        )
+        timings.history = timings._read()
+        return timings
+
+    def _read(self) -> dict[str, list[float]]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            log.warning("Ignoring unreadable locator timings: %s", self.path)
+            return {}
+        return {k: [float(v) for v in vals] for k, vals in data.items()}
+
+    def record(self, key: str, seconds: float) -> None:
+        """
+        Record a wait for ``key`` that took ``seconds``.
+
+        A wait that timed out is recorded with its bound: the element took
+        at least that long, so p99 x margin moves above it next time.
+        """
+        self.history.setdefault(key, []).append(seconds)
+        self._pending.setdefault(key, []).append(seconds)
+
+    def timeout_for(self, key: str, default: float) -> float:
+        """
+        Learned timeout for ``key``, or ``default`` until there are enough
+        samples. Not below min_timeout unless ``default`` is lower (a
+        check-now probe is not made to wait a full second).
+        """
+        samples = self.history.get(key, [])
+        if len(samples) < self.min_samples:
+            return default
+        learned = percentile(samples, 99) * self.margin
+        return min(max(learned, min(self.min_timeout, default)), self.max_timeout)
+
+    def save(self) -> None:
+        """
+        Merge this process's samples into the history file.
+
+        The file is re-read under a lock so concurrent xdist workers do
+        not overwrite each other's observations.
+        """
+        if not self._pending:
+            return
+        with locked(self.path):
+            merged = self._read()
+            for key, samples in self._pending.items():
+                merged[key] = (merged.get(key, []) + samples)[-self.max_samples :]
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(json.dumps(merged, indent=2, sort_keys=True), "utf-8")
+            os.replace(tmp, self.path)
+        self.history = merged
+        self._pending = {}
+
+
+_active: Optional[LocatorTimings] = None
+
+
+def configure(timings: Optional[LocatorTimings]) -> None:
+    """Install (or with ``None`` remove) the process-wide timing store."""
+    global _active
+    _active = timings
+
+
+def active() -> Optional[LocatorTimings]:
+    """The process-wide timing store, or None when the mode is off."""
+    return _active
@@ -0,0 +1,64 @@
+"""
+Per-test DevTools browser contexts inside one long-lived Chrome.
+
+A browser context is Chrome's incognito-style profile partition: its own
+cookies, storage and HTTP cache, created and disposed over DevTools
+without starting a process. ``open_context`` creates one with a single
+tab and switches the driver to it (chromedriver window handles are
+DevTools target IDs); ``close_context`` switches back and disposes the
+context together with every tab the test opened in it.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class BrowserContext:
+    context_id: str
+    target_id: str
+    # Tab to return to before disposing (lives in the default context).
+    home_handle: str
+    open_ms: float = 0.0
+
+
+def open_context(
+    driver: WebDriver, url: str = "about:blank", timeout: float = 5.0
+) -> BrowserContext:
+    started = time.perf_counter()
+    home_handle = driver.current_window_handle
+    context_id = driver.execute_cdp_cmd("Target.createBrowserContext", {})[
+        "browserContextId"
+    ]
+    target_id = driver.execute_cdp_cmd(
+        "Target.createTarget", {"url": url, "browserContextId": context_id}
+    )["targetId"]
+    # chromedriver picks up new targets asynchronously.
+    WebDriverWait(driver, timeout, 0.05).until(lambda d: target_id in d.window_handles)
+    driver.switch_to.window(target_id)
+    return BrowserContext(
+        context_id,
+        target_id,
+        home_handle,
+        round((time.perf_counter() - started) * 1000, 1),
+    )
+
+
+def close_context(driver: WebDriver, context: BrowserContext) -> float:
+    """Dispose ``context`` and its tabs; returns the time taken in ms."""
+    started = time.perf_counter()
+    try:
+        driver.switch_to.window(context.home_handle)
+    except WebDriverException:
+        log.debug("Could not switch back to the home tab", exc_info=True)
+    driver.execute_cdp_cmd(
+        "Target.disposeBrowserContext", {"browserContextId": context.context_id}
+    )
+    return round((time.perf_counter() - started) * 1000, 1)
@@ -0,0 +1,179 @@
+"""
+Per-host circuit breaker for page navigations.
+
+Opt-in via ``CIRCUIT_BREAKER=1``. ``BasePage.open`` reports every
+navigation: a failure (page load timeout, connection error) or, with
+``slow_seconds`` set, a navigation slower than that counts against the
+host; a normal one resets the count. After ``threshold`` consecutive bad
+navigations the circuit for the host opens and further ``open()`` calls
+raise CircuitOpenError immediately instead of waiting out
+PAGE_LOAD_TIMEOUT.
+
+While open, at most one caller every ``probe_interval`` seconds sends a
+plain HTTP request to the host; a response below 500 closes the circuit.
+
+State lives in one JSON file per host under ``state_dir`` and is updated
+under a file lock, so all xdist workers share it.
+"""
+
+import json
+import logging
+import os
+import pathlib
+import re
+import time
+import urllib.error
+import urllib.request
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+from utils.file_lock import locked
+
+log = logging.getLogger(__name__)
+
+
+class CircuitOpenError(RuntimeError):
+    """Navigation refused because the host's circuit is open."""
+
+    def __init__(self, host: str, reason: str):
+        super().__init__(f"Circuit open for {host}: {reason}")
+        self.host = host
+        self.reason = reason
+
+
+def probe_url(url: str, timeout: float) -> bool:
+    """True if ``url`` answers with a status below 500 within ``timeout``."""
+    request = urllib.request.Request(url, method="HEAD")
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status < 500
+    except urllib.error.HTTPError as exc:
+        return exc.code < 500
+    except (OSError, ValueError):
+        return False
+
+
+class HostCircuits:
+    def __init__(
+        self,
+        state_dir: pathlib.Path,
+        threshold: int = 3,
+        probe_interval: float = 30.0,
+        probe_timeout: float = 5.0,
+        slow_seconds: float = 0.0,
+        probe: Callable[[str, float], bool] = probe_url,
+    ):
+        self.state_dir = state_dir
+        self.threshold = threshold
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.slow_seconds = slow_seconds
+        self._probe = probe
+
+    @classmethod
+    def from_env(cls, state_dir: pathlib.Path) -> "HostCircuits":
+        return cls(
+            state_dir,
+            threshold=int(os.getenv("CIRCUIT_THRESHOLD", "3")),
+            probe_interval=float(os.getenv("CIRCUIT_PROBE_INTERVAL", "30")),
+            probe_timeout=float(os.getenv("CIRCUIT_PROBE_TIMEOUT", "5")),
+            slow_seconds=float(os.getenv("CIRCUIT_SLOW_SECONDS", "0")),
+        )
+
+    def _path(self, host: str) -> pathlib.Path:
+        return self.state_dir / (re.sub(r"[^\w.-]", "_", host) + ".json")
+
+    def _read(self, path: pathlib.Path) -> dict:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, path: pathlib.Path, state: dict) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(state, indent=1), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def check(self, url: str) -> None:
+        """Raise CircuitOpenError if ``url``'s host is open (may probe)."""
+        host = urlsplit(url).netloc
+        if not host:
+            return
+        path = self._path(host)
+        with locked(path):
+            state = self._read(path)
+            if not state.get("open"):
+                return
+            due = time.time() - state.get("last_probe", 0) >= self.probe_interval
+            if not due:
+                state["short_circuited"] = state.get("short_circuited", 0) + 1
+                self._write(path, state)
+                raise CircuitOpenError(host, state.get("reason", "unavailable"))
+            # Claim the probe so other workers keep failing fast meanwhile.
+            state["last_probe"] = time.time()
+            self._write(path, state)
+
+        healthy = self._probe(f"{urlsplit(url).scheme}://{host}/", self.probe_timeout)
+        with locked(path):
+            state = self._read(path)
+            if healthy:
+                log.warning("Circuit for %s closed (probe succeeded)", host)
+                state.update(open=False, failures=0)
+                self._write(path, state)
+                return
+            state["short_circuited"] = state.get("short_circuited", 0) + 1
+            self._write(path, state)
+        raise CircuitOpenError(host, state.get("reason", "unavailable"))
+
+    def record(
+        self, url: str, seconds: float, error: Optional[BaseException] = None
+    ) -> None:
+        """Record one navigation to ``url`` that took ``seconds``."""
+        host = urlsplit(url).netloc
+        if not host:
+            return
+        if error is not None:
+            problem = f"{type(error).__name__} after {seconds:.0f}s"
+        elif self.slow_seconds and seconds > self.slow_seconds:
+            problem = f"navigation took {seconds:.1f}s (> {self.slow_seconds:g}s)"
+        else:
+            problem = None
+
+        path = self._path(host)
+        with locked(path):
+            state = self._read(path)
+            state.setdefault("navigations", 0)
+            state["navigations"] += 1
+            state["last_seconds"] = round(seconds, 3)
+            if problem is None:
+                state["failures"] = 0
+            else:
+                state["failures"] = state.get("failures", 0) + 1
+                if state["failures"] >= self.threshold and not state.get("open"):
+                    reason = (
+                        f"{state['failures']} consecutive failures, last: {problem}"
+                    )
+                    log.error("Opening circuit for %s: %s", host, reason)
+                    state.update(open=True, reason=reason, last_probe=time.time())
+            self._write(path, state)
+
+    def states(self) -> dict[str, dict]:
+        """{host file stem: state} for the end-of-run summary."""
+        return {
+            path.stem: self._read(path)
+            for path in sorted(self.state_dir.glob("*.json"))
+        }
+
+
+_active: Optional[HostCircuits] = None
+
+
+def configure(circuits: Optional[HostCircuits]) -> None:
+    """Install (or with ``None`` remove) the process-wide breaker."""
+    global _active
+    _active = circuits
+
+
+def active() -> Optional[HostCircuits]:
+    """The process-wide breaker, or None when the mode is off."""
+    return _active
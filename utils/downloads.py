@@ -0,0 +1,110 @@
+"""Event-driven waiting for browser downloads."""
+
+import fnmatch
+import logging
+import pathlib
+import threading
+import time
+from typing import Optional
+
+from selenium.common.exceptions import TimeoutException
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
+log = logging.getLogger(__name__)
+
+# In-progress files written by Chrome (and other browsers) before the
+# final rename.
+PARTIAL_SUFFIXES = (".crdownload", ".part", ".tmp")
+
+
+def is_partial(path: pathlib.Path) -> bool:
+    return path.suffix in PARTIAL_SUFFIXES or path.name.startswith(".")
+
+
+class _Handler(FileSystemEventHandler):
+    def __init__(self, watcher: "DownloadWatcher"):
+        self._watcher = watcher
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        if not event.is_directory:
+            self._watcher._scan()
+
+
+class DownloadWatcher:
+    """
+    Watch one download directory and report finished files.
+
+    Filesystem notifications (watchdog) trigger a rescan of the
+    directory; a file counts as finished once it has a final name and no
+    partial (``.crdownload``) file is left in the directory. Files that
+    existed before ``start()`` are ignored.
+    """
+
+    def __init__(self, directory: pathlib.Path):
+        self.directory = directory
+        self._seen: set[pathlib.Path] = set()
+        # Finished downloads not yet returned by wait(), oldest first.
+        self._completed: list[pathlib.Path] = []
+        self._observer: Optional[Observer] = None
+        self._changed = threading.Condition()
+
+    def start(self) -> "DownloadWatcher":
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._seen = set(self.directory.iterdir())
+        self._observer = Observer()
+        self._observer.schedule(_Handler(self), str(self.directory))
+        self._observer.start()
+        return self
+
+    def stop(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=2)
+            self._observer = None
+
+    def __enter__(self) -> "DownloadWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _scan(self) -> None:
+        try:
+            entries = [p for p in self.directory.iterdir() if p.is_file()]
+        except OSError:
+            return
+        if any(is_partial(p) for p in entries):
+            return
+        with self._changed:
+            new = [p for p in sorted(entries) if p not in self._seen]
+            if new:
+                self._seen.update(new)
+                self._completed.extend(new)
+                self._changed.notify_all()
+
+    def wait(self, timeout: float = 60.0, pattern: str = "*") -> pathlib.Path:
+        """
+        Return the next finished download whose name matches ``pattern``.
+
+        Finished files that do not match stay available to later calls,
+        so downloads can be collected in any order.
+
+        Raises TimeoutException if none finishes within ``timeout``.
+        """
+        deadline = time.monotonic() + timeout
+        self._scan()  # catch anything finished before the first event
+        with self._changed:
+            while True:
+                for path in self._completed:
+                    if fnmatch.fnmatch(path.name, pattern):
+                        self._completed.remove(path)
+                        log.info("Download finished: %s", path.name)
+                        return path
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutException(
+                        f"No download matching {pattern!r} finished in "
+                        f"{self.directory} within {timeout}s"
+                    )
+                self._changed.wait(remaining)
@@ -0,0 +1,102 @@
+"""Named network/CPU emulation profiles applied through DevTools."""
+
+import weakref
+from dataclasses import dataclass
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+@dataclass(frozen=True)
+class EmulationProfile:
+    """
+    Network conditions and CPU slowdown for one run.
+
+    Throughputs are in kilobits per second; ``None`` means unthrottled.
+    """
+
+    name: str
+    latency_ms: float = 0.0
+    download_kbps: float | None = None
+    upload_kbps: float | None = None
+    offline: bool = False
+    cpu_slowdown: float = 1.0
+
+    @property
+    def is_noop(self) -> bool:
+        return self == EmulationProfile(self.name)
+
+
+# Presets follow Chrome DevTools / Lighthouse throttling values.
+PROFILES: dict[str, EmulationProfile] = {
+    p.name: p
+    for p in (
+        EmulationProfile("none"),
+        EmulationProfile(
+            "4g", latency_ms=150, download_kbps=1638.4, upload_kbps=750, cpu_slowdown=4
+        ),
+        EmulationProfile(
+            "fast-3g",
+            latency_ms=562.5,
+            download_kbps=1474.56,
+            upload_kbps=675,
+            cpu_slowdown=4,
+        ),
+        EmulationProfile(
+            "slow-3g",
+            latency_ms=2000,
+            download_kbps=400,
+            upload_kbps=400,
+            cpu_slowdown=6,
+        ),
+        EmulationProfile("offline", offline=True),
+        EmulationProfile("cpu-4x", cpu_slowdown=4),
+    )
+}
+
+# Drivers that currently carry non-default conditions (matters when a
+# browser is reused across tests with different profiles).
+_throttled: "weakref.WeakSet[WebDriver]" = weakref.WeakSet()
+
+
+def get_profile(name: str) -> EmulationProfile:
+    try:
+        return PROFILES[name]
+    except KeyError:
+        available = ", ".join(PROFILES)
+        raise ValueError(
+            f"Unknown emulation profile {name!r} (available: {available})"
+        ) from None
+
+
+def _bytes_per_second(kbps: float | None) -> float:
+    return -1 if kbps is None else kbps * 1000 / 8
+
+
+def apply_emulation(driver: WebDriver, profile: EmulationProfile) -> None:
+    """
+    Apply ``profile`` to the driver's current target.
+
+    A no-op profile only sends commands when a previous profile has to
+    be cleared from the same driver.
+    """
+    if profile.is_noop and driver not in _throttled:
+        return
+
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd(
+        "Network.emulateNetworkConditions",
+        {
+            "offline": profile.offline,
+            "latency": profile.latency_ms,
+            "downloadThroughput": _bytes_per_second(profile.download_kbps),
+            "uploadThroughput": _bytes_per_second(profile.upload_kbps),
+        },
+    )
+    driver.execute_cdp_cmd(
+        "Emulation.setCPUThrottlingRate", {"rate": profile.cpu_slowdown}
+    )
+
+    if profile.is_noop:
+        _throttled.discard(driver)
+    else:
+        _throttled.add(driver)
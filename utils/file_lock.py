@@ -0,0 +1,31 @@
+"""Cross-process file locking for state shared between xdist workers."""
+
+import contextlib
+import pathlib
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+@contextlib.contextmanager
+def locked(path: pathlib.Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on ``<path>.lock`` for the duration of the block.
+
+    On platforms without ``fcntl`` the block runs unlocked; concurrent
+    writers are then last-writer-wins, which is acceptable for the
+    best-effort state files that use this.
+    """
+    lock_path = path.with_name(path.name + ".lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a+") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,230 @@
+"""
+Where a test's wall time goes: fixed sleeps, explicit-wait polling,
+WebDriver commands, fixture setup.
+
+``install()`` wraps ``time.sleep``, ``WebDriverWait.until``/``until_not``
+and ``WebDriver.execute`` for the thread that runs the tests. Each
+interval lands in exactly one bucket:
+
+- ``sleep``   - time.sleep outside an explicit wait
+- ``wait``    - inside WebDriverWait.until/until_not (its polling sleeps
+  and the commands it issues included)
+- ``command`` - WebDriver commands outside an explicit wait
+
+and is also charged to the page-object method that caused it (the
+innermost caller on an AzercellLoginPage-style page object, skipping the
+generic BasePage helpers). ``sleep`` and ``wait`` are idle time: the
+test is not doing anything but waiting, so that is what can be
+reclaimed by replacing sleeps with conditions or tightening waits.
+
+What counts as a page object is passed in by conftest, so this module
+does not depend on ``pages``.
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+CATEGORIES = ("sleep", "wait", "command")
+IDLE = ("sleep", "wait")
+NO_PAGE_OBJECT = "(test body)"
+
+
+class CallBucket:
+    """Seconds per category, and per page-object method and category."""
+
+    def __init__(self) -> None:
+        self.totals: Counter[str] = Counter()
+        self.methods: dict[str, Counter[str]] = {}
+
+    def add(self, category: str, method: str, seconds: float) -> None:
+        self.totals[category] += seconds
+        self.methods.setdefault(method, Counter())[category] += seconds
+
+    def as_dict(self) -> dict:
+        return {
+            "totals": {k: round(v, 4) for k, v in self.totals.items()},
+            "methods": {
+                method: {k: round(v, 4) for k, v in counts.items()}
+                for method, counts in self.methods.items()
+            },
+        }
+
+
+def _page_method(
+    frame: Any, is_page_object: Callable[[Any], bool], helper_files: tuple[str, ...]
+) -> str:
+    """
+    Qualified name of the innermost page-object method on the stack.
+
+    Methods defined in ``helper_files`` (BasePage's settle, find_all,
+    click...) are passed over in favour of the page-object method that
+    called them.
+    """
+    fallback = None
+    while frame is not None:
+        owner = frame.f_locals.get("self")
+        if owner is not None and is_page_object(owner):
+            name = f"{type(owner).__name__}.{frame.f_code.co_name}"
+            if not frame.f_code.co_filename.endswith(helper_files):
+                return name
+            fallback = fallback or name
+        frame = frame.f_back
+    return fallback or NO_PAGE_OBJECT
+
+
+class IdleAccounting:
+    """
+    ``is_page_object(obj)`` tells page objects apart from other callers;
+    ``helper_files`` are path suffixes of the shared page-object helpers.
+    """
+
+    def __init__(
+        self,
+        is_page_object: Callable[[Any], bool],
+        helper_files: tuple[str, ...] = (),
+    ) -> None:
+        self._is_page_object = is_page_object
+        self._helper_files = helper_files
+        self._thread_id: Optional[int] = None
+        self._wait_depth = 0
+        self._bucket: Optional[CallBucket] = None
+        self._originals: dict[str, Any] = {}
+
+    def install(self) -> None:
+        if self._originals:
+            return
+        self._thread_id = threading.get_ident()
+        self._originals = {
+            "sleep": time.sleep,
+            "until": WebDriverWait.until,
+            "until_not": WebDriverWait.until_not,
+            "execute": WebDriver.execute,
+        }
+        accounting = self
+        original_sleep = self._originals["sleep"]
+        original_execute = self._originals["execute"]
+
+        def sleep(seconds: float) -> None:
+            with accounting._timed("sleep", sys._getframe(1)):
+                original_sleep(seconds)
+
+        def execute(driver, *args, **kwargs):
+            with accounting._timed("command", sys._getframe(1)):
+                return original_execute(driver, *args, **kwargs)
+
+        def wrap_wait(original):
+            def wrapper(wait, *args, **kwargs):
+                with accounting._timed("wait", sys._getframe(1)):
+                    accounting._wait_depth += 1
+                    try:
+                        return original(wait, *args, **kwargs)
+                    finally:
+                        accounting._wait_depth -= 1
+
+            return wrapper
+
+        time.sleep = sleep
+        WebDriverWait.until = wrap_wait(self._originals["until"])
+        WebDriverWait.until_not = wrap_wait(self._originals["until_not"])
+        WebDriver.execute = execute
+
+    def uninstall(self) -> None:
+        if not self._originals:
+            return
+        time.sleep = self._originals["sleep"]
+        WebDriverWait.until = self._originals["until"]
+        WebDriverWait.until_not = self._originals["until_not"]
+        WebDriver.execute = self._originals["execute"]
+        self._originals = {}
+
+    @contextmanager
+    def _timed(self, category: str, frame: Any) -> Iterator[None]:
+        bucket = self._bucket
+        if (
+            bucket is None
+            or self._wait_depth
+            or threading.get_ident() != self._thread_id
+        ):
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            method = _page_method(frame, self._is_page_object, self._helper_files)
+            bucket.add(category, method, time.perf_counter() - started)
+
+    @contextmanager
+    def test_scope(self) -> Iterator[CallBucket]:
+        """Collect into a fresh bucket for the duration of one test call."""
+        self._bucket = CallBucket()
+        self._wait_depth = 0
+        try:
+            yield self._bucket
+        finally:
+            self._bucket = None
+
+
+class RunSummary:
+    """Run-wide totals built from per-test reports (works across xdist)."""
+
+    def __init__(self) -> None:
+        self.tests: dict[str, dict[str, float]] = {}
+        self.methods: dict[str, Counter[str]] = {}
+
+    def add_setup(self, nodeid: str, seconds: float) -> None:
+        self.tests.setdefault(nodeid, {})["setup"] = seconds
+
+    def add_call(self, nodeid: str, duration: float, data: dict) -> None:
+        entry = self.tests.setdefault(nodeid, {})
+        entry["call"] = duration
+        entry.update(data.get("totals", {}))
+        for method, counts in data.get("methods", {}).items():
+            self.methods.setdefault(method, Counter()).update(counts)
+
+    @staticmethod
+    def idle(counts: dict[str, float]) -> float:
+        return sum(counts.get(k, 0.0) for k in IDLE)
+
+    def format(self, top: int = 10) -> list[str]:
+        lines = [
+            f"{'test':<60} {'setup':>7} {'call':>7} {'sleep':>7} {'wait':>7}"
+            f" {'cmds':>7} {'other':>7}"
+        ]
+        ranked = sorted(self.tests.items(), key=lambda kv: -self.idle(kv[1]))
+        for nodeid, t in ranked[:top]:
+            call = t.get("call", 0.0)
+            other = call - sum(t.get(k, 0.0) for k in CATEGORIES)
+            name = nodeid if len(nodeid) <= 60 else "…" + nodeid[-59:]
+            lines.append(
+                f"{name:<60} {t.get('setup', 0.0):7.1f} {call:7.1f}"
+                f" {t.get('sleep', 0.0):7.1f} {t.get('wait', 0.0):7.1f}"
+                f" {t.get('command', 0.0):7.1f} {max(other, 0.0):7.1f}"
+            )
+
+        lines.append("")
+        lines.append(
+            f"{'page-object method':<60} {'idle':>7} {'sleep':>7} {'wait':>7}"
+            f" {'cmds':>7}"
+        )
+        methods = sorted(self.methods.items(), key=lambda kv: -self.idle(kv[1]))
+        for method, c in methods[:top]:
+            lines.append(
+                f"{method:<60} {self.idle(c):7.1f} {c.get('sleep', 0.0):7.1f}"
+                f" {c.get('wait', 0.0):7.1f} {c.get('command', 0.0):7.1f}"
+            )
+
+        total_call = sum(t.get("call", 0.0) for t in self.tests.values())
+        total_idle = sum(self.idle(t) for t in self.tests.values())
+        lines.append("")
+        lines.append(
+            f"idle (sleep + wait) {total_idle:.1f}s of {total_call:.1f}s test time"
+        )
+        return lines
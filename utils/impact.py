@@ -0,0 +1,221 @@
+"""
+Change-impact test selection.
+
+A map from each test node ID to the page-object/utility functions it
+executed ("pages/base_page.py::BasePage.click") is built from a coverage
+run with one coverage context per test. Given a git diff, only tests
+whose recorded functions were touched (plus tests in changed test files
+and tests missing from the map) are selected.
+
+Changes to files in RUN_ALL_FILES (shared fixtures, BasePage,
+configuration) select everything, because their effect is not limited to
+the functions a test happened to execute.
+"""
+
+import ast
+import json
+import logging
+import os
+import pathlib
+import re
+import subprocess
+from typing import Iterable, Optional
+
+log = logging.getLogger(__name__)
+
+MAP_VERSION = 1
+
+# Source trees whose functions are tracked in the map.
+TRACKED_DIRS = ("pages", "utils")
+
+RUN_ALL_FILES = frozenset(
+    {
+        "conftest.py",
+        "pages/base_page.py",
+        "pytest.ini",
+        "requirements.txt",
+    }
+)
+
+MODULE_SCOPE = "<module>"
+
+_HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def function_spans(source: str) -> list[tuple[int, int, str]]:
+    """(first_line, last_line, qualified_name) for every def in ``source``."""
+    spans: list[tuple[int, int, str]] = []
+
+    def visit(node: ast.AST, prefix: str) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                name = f"{prefix}{child.name}"
+                first = min([child.lineno] + [d.lineno for d in child.decorator_list])
+                spans.append((first, child.end_lineno or child.lineno, name))
+                visit(child, f"{name}.")
+            elif isinstance(child, ast.ClassDef):
+                visit(child, f"{prefix}{child.name}.")
+
+    visit(ast.parse(source), "")
+    return spans
+
+
+def function_at(spans: list[tuple[int, int, str]], lineno: int) -> str:
+    """Innermost function containing ``lineno`` (or MODULE_SCOPE)."""
+    best: Optional[tuple[int, int, str]] = None
+    for span in spans:
+        first, last, _ = span
+        if first <= lineno <= last and (best is None or first >= best[0]):
+            best = span
+    return best[2] if best else MODULE_SCOPE
+
+
+def functions_for_lines(source: str, lines: Iterable[int]) -> set[str]:
+    spans = function_spans(source)
+    return {function_at(spans, n) for n in lines}
+
+
+def parse_diff(diff_text: str) -> dict[str, tuple[set[int], set[int]]]:
+    """
+    Parse ``git diff -U0`` output.
+
+    Returns {path: (old_lines, new_lines)} where old_lines are lines
+    removed/modified in the base version and new_lines lines added in
+    the new version. Pure insertions record the old-side anchor line so
+    code inserted into a function body is attributed to that function.
+    """
+    changes: dict[str, tuple[set[int], set[int]]] = {}
+    old_path: Optional[str] = None
+    path: Optional[str] = None
+    for line in diff_text.splitlines():
+        if line.startswith("--- "):
+            old_path = line[6:] if line.startswith("--- a/") else None
+        elif line.startswith("+++ "):
+            path = line[6:] if line.startswith("+++ b/") else old_path
+            if path is not None:
+                changes.setdefault(path, (set(), set()))
+        elif path is not None:
+            match = _HUNK_RE.match(line)
+            if not match:
+                continue
+            old_start, old_len, new_start, new_len = (
+                int(match.group(1)),
+                int(match.group(2) or 1),
+                int(match.group(3)),
+                int(match.group(4) or 1),
+            )
+            old_lines, new_lines = changes[path]
+            if old_len:
+                old_lines.update(range(old_start, old_start + old_len))
+            else:
+                old_lines.add(max(old_start, 1))
+            new_lines.update(range(new_start, new_start + new_len))
+    return changes
+
+
+def _git(root: pathlib.Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=root, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def changed_functions(root: pathlib.Path, base_ref: str) -> tuple[set[str], set[str]]:
+    """
+    Diff the working tree against ``base_ref``.
+
+    Returns (changed_files, changed_functions) where functions are
+    "path::Qualified.name" for Python files under TRACKED_DIRS.
+    """
+    diff = _git(root, "diff", "-U0", "--no-color", base_ref, "--")
+    files: set[str] = set()
+    functions: set[str] = set()
+    for path, (old_lines, new_lines) in parse_diff(diff).items():
+        files.add(path)
+        if not path.endswith(".py") or not path.startswith(TRACKED_DIRS):
+            continue
+        sides = []
+        if old_lines:
+            try:
+                sides.append((_git(root, "show", f"{base_ref}:{path}"), old_lines))
+            except subprocess.CalledProcessError:
+                pass  # file is new in this diff
+        if new_lines and (root / path).exists():
+            sides.append(((root / path).read_text(encoding="utf-8"), new_lines))
+        for source, lines in sides:
+            try:
+                names = functions_for_lines(source, lines)
+            except SyntaxError:
+                names = {MODULE_SCOPE}
+            functions.update(f"{path}::{name}" for name in names)
+    return files, functions
+
+
+def select_tests(
+    test_map: dict[str, list[str]],
+    nodeids: Iterable[str],
+    changed_files: set[str],
+    changed: set[str],
+) -> Optional[set[str]]:
+    """
+    Node IDs affected by the change, or None when everything must run.
+    """
+    if changed_files & RUN_ALL_FILES:
+        return None
+    # Module-level edits (imports, class attributes such as locators)
+    # can affect any function in the file: treat them as file-wide.
+    file_wide = {c.split("::")[0] for c in changed if c.endswith(MODULE_SCOPE)}
+    selected: set[str] = set()
+    for nodeid in nodeids:
+        test_file = nodeid.split("::")[0]
+        recorded = test_map.get(nodeid)
+        if recorded is None or test_file in changed_files:
+            selected.add(nodeid)
+        elif changed.intersection(recorded):
+            selected.add(nodeid)
+        elif any(r.split("::")[0] in file_wide for r in recorded):
+            selected.add(nodeid)
+    return selected
+
+
+def load_map(path: pathlib.Path) -> dict[str, list[str]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        log.warning("Ignoring unreadable impact map: %s", path)
+        return {}
+    if data.get("version") != MAP_VERSION:
+        return {}
+    return data.get("tests", {})
+
+
+def save_map(path: pathlib.Path, tests: dict[str, list[str]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    payload = {"version": MAP_VERSION, "tests": dict(sorted(tests.items()))}
+    tmp.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def map_from_coverage(data, root: pathlib.Path) -> dict[str, list[str]]:
+    """
+    Build {nodeid: [path::function, ...]} from coverage data recorded
+    with one context per test node ID.
+    """
+    tests: dict[str, set[str]] = {}
+    for filename in data.measured_files():
+        try:
+            rel = pathlib.Path(filename).resolve().relative_to(root).as_posix()
+        except ValueError:
+            continue
+        try:
+            spans = function_spans(pathlib.Path(filename).read_text("utf-8"))
+        except (OSError, SyntaxError):
+            continue
+        for lineno, contexts in data.contexts_by_lineno(filename).items():
+            function = f"{rel}::{function_at(spans, lineno)}"
+            for context in contexts:
+                if context:
+                    tests.setdefault(context, set()).add(function)
+    return {nodeid: sorted(funcs) for nodeid, funcs in tests.items()}
@@ -0,0 +1,177 @@
+"""
+Non-blocking structured logging for (xdist) test runs.
+
+Opt-in via ``STRUCTURED_LOGS=1``. The root logger's handlers are replaced
+by a single queue handler, so the calling thread only enqueues the record;
+a QueueListener thread does formatting (message and traceback) and I/O:
+
+- the usual human-readable line to stderr
+- one JSON object per line to ``<logs dir>/<worker>.jsonl`` with the
+  current test node ID and timing fields
+
+Per-worker files are merged into ``run.jsonl`` (sorted by time) when the
+session ends.
+"""
+
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import pathlib
+import queue
+import time
+from collections import Counter
+from typing import Optional
+
+CONSOLE_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+MERGED_NAME = "run.jsonl"
+
+_current_test: Optional[str] = None
+_current_test_started = 0.0
+
+
+def set_current_test(nodeid: Optional[str]) -> None:
+    """Tag subsequent records with ``nodeid`` (None clears it)."""
+    global _current_test, _current_test_started
+    _current_test = nodeid
+    _current_test_started = time.monotonic()
+
+
+def worker_id() -> str:
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+class _TestContextFilter(logging.Filter):
+    """Adds test context on the emitting thread, before the queue."""
+
+    def __init__(self, worker: str):
+        super().__init__()
+        self.worker = worker
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.worker = self.worker
+        record.nodeid = _current_test
+        record.test_elapsed_ms = (
+            round((time.monotonic() - _current_test_started) * 1000, 1)
+            if _current_test
+            else None
+        )
+        return True
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves all formatting to the listener.
+
+    The stock prepare() merges the message and traceback into ``msg`` on
+    the calling thread and drops ``args`` / ``exc_info``, so JsonFormatter
+    never saw an exception. Records are enqueued as a shallow copy
+    instead: message arguments are rendered when the listener handles
+    the record, not when it was logged.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return copy.copy(record)
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "worker": getattr(record, "worker", None),
+            "nodeid": getattr(record, "nodeid", None),
+            "test_elapsed_ms": getattr(record, "test_elapsed_ms", None),
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class LogPipeline:
+    """Owns the queue, the listener thread and the per-worker JSON file."""
+
+    def __init__(self, logs_dir: pathlib.Path, level: int):
+        self.logs_dir = logs_dir
+        self.level = level  # applied to the console handler
+        self.worker = worker_id()
+        self.json_path = logs_dir / f"{self.worker}.jsonl"
+        self._queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._file_handler: Optional[logging.FileHandler] = None
+        self._queue_handler: Optional[_DeferredQueueHandler] = None
+        self._saved_handlers: list[logging.Handler] = []
+        # Filled by the controller after merging worker files.
+        self.level_counts: Counter = Counter()
+
+    def start(self) -> None:
+        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        console = logging.StreamHandler()
+        console.setLevel(self.level)
+        console.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+        self._file_handler = logging.FileHandler(
+            self.json_path, mode="w", encoding="utf-8"
+        )
+        self._file_handler.setFormatter(JsonFormatter())
+
+        queue_handler = _DeferredQueueHandler(self._queue)
+        queue_handler.addFilter(_TestContextFilter(self.worker))
+
+        root = logging.getLogger()
+        self._saved_handlers = [
+            h for h in root.handlers if type(h) is logging.StreamHandler
+        ]
+        for handler in self._saved_handlers:
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+        self._queue_handler = queue_handler
+
+        self._listener = logging.handlers.QueueListener(
+            self._queue, console, self._file_handler, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def stop(self) -> None:
+        """Flush the queue and restore the previous handlers."""
+        if self._listener is None:
+            return
+        root = logging.getLogger()
+        root.removeHandler(self._queue_handler)
+        self._listener.stop()
+        self._listener = None
+        if self._file_handler is not None:
+            self._file_handler.close()
+        for handler in self._saved_handlers:
+            root.addHandler(handler)
+
+
+def merge_worker_logs(logs_dir: pathlib.Path) -> tuple[pathlib.Path, Counter]:
+    """
+    Merge ``<worker>.jsonl`` files into ``run.jsonl`` ordered by time.
+
+    Returns the merged path and record counts per level.
+    """
+    records = []
+    for path in sorted(logs_dir.glob("*.jsonl")):
+        if path.name == MERGED_NAME:
+            continue
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    records.sort(key=lambda r: r.get("ts", 0))
+
+    merged = logs_dir / MERGED_NAME
+    with open(merged, "w", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return merged, Counter(r.get("level") for r in records)
@@ -0,0 +1,469 @@
+"""
+Local SQLite history of UI, API and k6 timings.
+
+CI artifacts are kept for 7 days; this store keeps the numbers. Each
+ingested report file becomes one run (identified by its content hash, so
+ingesting the same file twice is a no-op) with one sample per test,
+request or k6 metric:
+
+- UI JUnit XML (pytest ``--junitxml``): one ``duration_ms`` per test case
+- Newman JUnit XML: one ``duration_ms`` per request (test suite)
+- k6 summary JSON (``--summary-export`` or ``handleSummary``): avg/p50/
+  p90/p95/max for every trend metric, including tagged sub-metrics such
+  as ``http_req_duration{name:GET /booking}``
+
+The commit a run was built from is read from a ``commit.txt`` written
+next to the report when the run happened (``record_commit``; pytest
+does it for ``--junitxml``, the CI jobs and the Newman script for their
+reports), never from the checkout doing the ingest. Without one the
+run's commit is left empty.
+
+``report`` compares the latest value of every series with a rolling
+baseline (median of the previous runs) and flags regressions.
+
+Usage:
+    python -m utils.metrics_store ingest                # default locations
+    python -m utils.metrics_store ingest reports/ui/ui-junit.xml
+    python -m utils.metrics_store report --baseline-runs 10 --threshold 0.2
+    python -m utils.metrics_store query booking
+    python -m utils.metrics_store export metrics.csv --source api
+"""
+
+import argparse
+import contextlib
+import csv
+import datetime
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import sqlite3
+import statistics
+import subprocess
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from utils.stats import percentile
+
+log = logging.getLogger(__name__)
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parent.parent
+DEFAULT_DB = pathlib.Path(os.getenv("METRICS_DB", PROJECT_ROOT / ".metrics.sqlite"))
+
+# Where CI and the local scripts leave their reports.
+DEFAULT_INPUTS = (
+    "reports/ui/*.xml",
+    "reports/api/*.xml",
+    "postman/reports/*/*.xml",
+    "reports/perf/*.json",
+)
+
+SOURCES = ("ui", "api", "k6")
+
+# Written next to a report at run time: the commit the run was built from.
+COMMIT_FILE = "commit.txt"
+
+# k6 trend statistics -> stored metric names (values are milliseconds).
+K6_STATS = {
+    "avg": "avg_ms",
+    "med": "p50_ms",
+    "p(90)": "p90_ms",
+    "p(95)": "p95_ms",
+    "max": "max_ms",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    started TEXT NOT NULL,
+    commit_sha TEXT,
+    file TEXT NOT NULL,
+    digest TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    outcome TEXT
+);
+CREATE INDEX IF NOT EXISTS samples_series ON samples(name, metric);
+"""
+
+Sample = tuple[str, str, float, Optional[str]]  # name, metric, value, outcome
+
+
+@contextlib.contextmanager
+def connect(path: pathlib.Path = DEFAULT_DB) -> Iterator[sqlite3.Connection]:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.executescript(SCHEMA)
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def detect_source(path: pathlib.Path) -> str:
+    if path.suffix == ".json":
+        return "k6"
+    lowered = path.as_posix().lower()
+    if any(hint in lowered for hint in ("postman", "newman", "/api/")):
+        return "api"
+    return "ui"
+
+
+def _outcome(case: ET.Element) -> str:
+    for tag in ("failure", "error", "skipped"):
+        if case.find(tag) is not None:
+            return "failed" if tag == "failure" else tag
+    return "passed"
+
+
+def _suites(root: ET.Element) -> list[ET.Element]:
+    return [root] if root.tag == "testsuite" else root.findall("testsuite")
+
+
+def parse_junit(path: pathlib.Path, source: str) -> tuple[Optional[str], list[Sample]]:
+    """
+    (suite timestamp, samples) from a JUnit XML report.
+
+    UI reports yield one sample per test case; Newman reports one per
+    request, which Newman writes as a test suite of assertions.
+    """
+    root = ET.parse(path).getroot()
+    suites = _suites(root)
+    started = next((s.get("timestamp") for s in suites if s.get("timestamp")), None)
+    samples: list[Sample] = []
+    for suite in suites:
+        if source == "api":
+            cases = suite.findall("testcase")
+            failed = any(_outcome(c) != "passed" for c in cases)
+            samples.append(
+                (
+                    suite.get("name", "?"),
+                    "duration_ms",
+                    float(suite.get("time") or 0) * 1000,
+                    "failed" if failed else "passed",
+                )
+            )
+            continue
+        for case in suite.iter("testcase"):
+            classname = case.get("classname", "")
+            name = f"{classname}::{case.get('name')}" if classname else case.get("name")
+            samples.append(
+                (
+                    name or "?",
+                    "duration_ms",
+                    float(case.get("time") or 0) * 1000,
+                    _outcome(case),
+                )
+            )
+    return started, samples
+
+
+def parse_k6_summary(path: pathlib.Path) -> list[Sample]:
+    """
+    Samples from a k6 summary. Supports both the ``--summary-export``
+    layout (stats directly under each metric) and the ``handleSummary``
+    layout (stats under ``values``).
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    samples: list[Sample] = []
+    for name, metric in sorted(data.get("metrics", {}).items()):
+        stats = metric.get("values", metric)
+        if metric.get("type", "trend") != "trend" or "avg" not in stats:
+            continue
+        for stat, stored in K6_STATS.items():
+            if stat in stats:
+                samples.append((name, stored, float(stats[stat]), None))
+    return samples
+
+
+def current_commit() -> Optional[str]:
+    """The commit being tested: GITHUB_SHA in CI, else the checkout's HEAD."""
+    if os.getenv("GITHUB_SHA"):
+        return os.getenv("GITHUB_SHA")
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=PROJECT_ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def record_commit(directory: pathlib.Path) -> None:
+    """Note the current commit next to the reports a run writes to ``directory``."""
+    sha = current_commit()
+    if sha:
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / COMMIT_FILE).write_text(sha + "\n", encoding="utf-8")
+
+
+def _run_commit(path: pathlib.Path) -> Optional[str]:
+    try:
+        return (path.parent / COMMIT_FILE).read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+
+def _mtime_iso(path: pathlib.Path) -> str:
+    mtime = datetime.datetime.fromtimestamp(path.stat().st_mtime)
+    return mtime.isoformat(timespec="seconds")
+
+
+def ingest(
+    conn: sqlite3.Connection, path: pathlib.Path, source: Optional[str] = None
+) -> Optional[int]:
+    """Store one report file; returns the run id, or None if already stored."""
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    if conn.execute("SELECT 1 FROM runs WHERE digest = ?", (digest,)).fetchone():
+        return None
+
+    source = source or detect_source(path)
+    if source == "k6":
+        started, samples = None, parse_k6_summary(path)
+    else:
+        started, samples = parse_junit(path, source)
+    started = (started or _mtime_iso(path))[:19]
+
+    run_id = conn.execute(
+        "INSERT INTO runs (source, started, commit_sha, file, digest)"
+        " VALUES (?, ?, ?, ?, ?)",
+        (source, started, _run_commit(path), str(path), digest),
+    ).lastrowid
+    conn.executemany(
+        "INSERT INTO samples (run_id, name, metric, value, outcome)"
+        " VALUES (?, ?, ?, ?, ?)",
+        [(run_id, *sample) for sample in samples],
+    )
+    log.info("Ingested %s (%s, %d samples)", path, source, len(samples))
+    return run_id
+
+
+@dataclass
+class SeriesReport:
+    source: str
+    name: str
+    metric: str
+    values: list[float]  # oldest first
+    baseline: Optional[float]
+    regressed: bool
+
+    @property
+    def latest(self) -> float:
+        return self.values[-1]
+
+    @property
+    def change(self) -> Optional[float]:
+        if not self.baseline:
+            return None
+        return (self.latest - self.baseline) / self.baseline
+
+
+def series(
+    conn: sqlite3.Connection,
+    source: Optional[str] = None,
+    name_like: Optional[str] = None,
+) -> dict[tuple[str, str, str], list[tuple[str, Optional[str], float]]]:
+    """
+    {(source, name, metric): [(started, commit, value), ...]} oldest first.
+
+    Failed and skipped tests are left out: their durations measure the
+    failure (often a timeout), not the test.
+    """
+    query = (
+        "SELECT r.source, s.name, s.metric, r.started, r.commit_sha, s.value"
+        " FROM samples s JOIN runs r ON r.id = s.run_id"
+        " WHERE (s.outcome IS NULL OR s.outcome = 'passed')"
+    )
+    params: list[str] = []
+    if source:
+        query += " AND r.source = ?"
+        params.append(source)
+    if name_like:
+        query += " AND s.name LIKE ?"
+        params.append(f"%{name_like}%")
+    query += " ORDER BY r.started, r.id"
+
+    result: dict[tuple[str, str, str], list[tuple[str, Optional[str], float]]] = {}
+    for src, name, metric, started, sha, value in conn.execute(query, params):
+        result.setdefault((src, name, metric), []).append((started, sha, value))
+    return result
+
+
+def build_report(
+    conn: sqlite3.Connection,
+    source: Optional[str] = None,
+    baseline_runs: int = 10,
+    min_history: int = 3,
+    threshold: float = 0.2,
+    min_delta_ms: float = 50.0,
+) -> list[SeriesReport]:
+    """
+    Latest value of every series against the median of up to
+    ``baseline_runs`` previous values.
+
+    A series regressed when it is more than ``threshold`` (relative) and
+    ``min_delta_ms`` (absolute) above its baseline and has at least
+    ``min_history`` earlier values.
+    """
+    reports = []
+    for (src, name, metric), rows in series(conn, source).items():
+        values = [value for _, _, value in rows]
+        previous = values[:-1][-baseline_runs:]
+        baseline = statistics.median(previous) if previous else None
+        regressed = (
+            baseline is not None
+            and len(previous) >= min_history
+            and values[-1] > baseline * (1 + threshold)
+            and values[-1] - baseline >= min_delta_ms
+        )
+        reports.append(SeriesReport(src, name, metric, values, baseline, regressed))
+    return reports
+
+
+_SPARKS = "▁▂▃▄▅▆▇█"
+
+
+def sparkline(values: list[float]) -> str:
+    low, high = min(values), max(values)
+    if high == low:
+        return _SPARKS[0] * len(values)
+    scale = (len(_SPARKS) - 1) / (high - low)
+    return "".join(_SPARKS[round((v - low) * scale)] for v in values)
+
+
+def format_report(reports: list[SeriesReport], trend_points: int = 12) -> list[str]:
+    lines = [
+        f"{'':2}{'source':<6} {'series':<58} {'runs':>4} {'p50':>9} {'p95':>9}"
+        f" {'baseline':>9} {'latest':>9} {'change':>7}  trend"
+    ]
+    ordered = sorted(
+        reports, key=lambda r: (not r.regressed, -(r.change or 0.0), r.name)
+    )
+    for r in ordered:
+        series_name = f"{r.name} [{r.metric}]"
+        if len(series_name) > 58:
+            series_name = "…" + series_name[-57:]
+        baseline = f"{r.baseline:9.0f}" if r.baseline is not None else f"{'-':>9}"
+        change = f"{r.change * 100:+6.0f}%" if r.change is not None else f"{'-':>7}"
+        lines.append(
+            f"{'!!' if r.regressed else '':2}{r.source:<6} {series_name:<58}"
+            f" {len(r.values):>4} {percentile(r.values, 50):9.0f}"
+            f" {percentile(r.values, 95):9.0f} {baseline} {r.latest:9.0f}"
+            f" {change}  {sparkline(r.values[-trend_points:])}"
+        )
+    return lines
+
+
+def export_csv(
+    conn: sqlite3.Connection, out: pathlib.Path, source: Optional[str] = None
+) -> int:
+    query = (
+        "SELECT r.source, r.started, r.commit_sha, s.name, s.metric, s.value,"
+        " s.outcome FROM samples s JOIN runs r ON r.id = s.run_id"
+    )
+    params: tuple[str, ...] = ()
+    if source:
+        query += " WHERE r.source = ?"
+        params = (source,)
+    rows = conn.execute(query + " ORDER BY r.started, r.id, s.name", params)
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with open(out, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(
+            ["source", "started", "commit", "name", "metric", "value", "outcome"]
+        )
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", type=pathlib.Path, default=DEFAULT_DB)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p_ingest = commands.add_parser("ingest", help="Store report files.")
+    p_ingest.add_argument("paths", nargs="*", type=pathlib.Path)
+    p_ingest.add_argument("--source", choices=SOURCES, help="Override detection.")
+
+    p_report = commands.add_parser("report", help="Trends and regressions.")
+    p_report.add_argument("--source", choices=SOURCES)
+    p_report.add_argument("--baseline-runs", type=int, default=10)
+    p_report.add_argument("--threshold", type=float, default=0.2)
+    p_report.add_argument("--min-delta-ms", type=float, default=50.0)
+    p_report.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 when any series regressed.",
+    )
+
+    p_query = commands.add_parser("query", help="History of matching series.")
+    p_query.add_argument("name", help="Substring of the test/request/metric name.")
+    p_query.add_argument("--source", choices=SOURCES)
+
+    p_export = commands.add_parser("export", help="Write all samples as CSV.")
+    p_export.add_argument("out", type=pathlib.Path)
+    p_export.add_argument("--source", choices=SOURCES)
+
+    args = parser.parse_args(argv)
+
+    with connect(args.db) as conn:
+        if args.command == "ingest":
+            paths = args.paths or sorted(
+                p for pattern in DEFAULT_INPUTS for p in PROJECT_ROOT.glob(pattern)
+            )
+            stored = 0
+            for path in paths:
+                try:
+                    stored += ingest(conn, path, args.source) is not None
+                except (OSError, ValueError, ET.ParseError) as exc:
+                    log.warning("Skipping %s: %s", path, exc)
+            print(f"{stored} new run(s) from {len(paths)} file(s) in {args.db}")
+
+        elif args.command == "report":
+            reports = build_report(
+                conn,
+                args.source,
+                baseline_runs=args.baseline_runs,
+                threshold=args.threshold,
+                min_delta_ms=args.min_delta_ms,
+            )
+            for line in format_report(reports):
+                print(line)
+            regressed = [r for r in reports if r.regressed]
+            print(f"\n{len(reports)} series, {len(regressed)} regressed (ms)")
+            if regressed and args.fail_on_regression:
+                return 1
+
+        elif args.command == "query":
+            for (src, name, metric), rows in series(
+                conn, args.source, args.name
+            ).items():
+                print(f"\n{src} {name} [{metric}]")
+                for started, sha, value in rows:
+                    print(f"  {started}  {(sha or '')[:8]:<8} {value:10.1f}")
+
+        elif args.command == "export":
+            count = export_csv(conn, args.out, args.source)
+            print(f"{count} samples written to: {args.out}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,213 @@
+"""
+Backend requests seen by the browser, from Chrome's performance log.
+
+With ``NETWORK_LOG=1`` chromedriver records DevTools ``Network.*`` events
+into the ``performance`` log (``goog:loggingPrefs``). ``NetworkLog``
+drains that log on demand and folds the events into one ``Exchange`` per
+request: URL, method, status, and timings taken from the browser's own
+clock:
+
+- ``server_ms`` - request sent to response headers received (waiting on
+  the backend, the "TTFB" of the request)
+- ``total_ms``  - request issued to body fully received (or failure)
+
+Page objects wait for a specific request with ``BasePage.wait_for_request``
+instead of sleeping and looking at the URL; the exchanges they waited
+for are attached to the test report.
+"""
+
+import json
+import re
+import time
+import weakref
+from dataclasses import asdict, dataclass
+from typing import Optional, Pattern, Union
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.stats import percentile
+
+POLL = 0.1
+
+# perfLoggingPrefs for chromedriver: network events only.
+PERF_LOGGING_PREFS = {"enableNetwork": True, "enablePage": False}
+
+
+@dataclass
+class Exchange:
+    request_id: str
+    url: str
+    method: str
+    resource_type: str
+    # Position in the log; a "since" cursor selects later requests.
+    seq: int
+    started: float
+    status: Optional[int] = None
+    server_ms: Optional[float] = None
+    total_ms: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        return self.total_ms is not None
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        del data["request_id"], data["seq"], data["started"]
+        return data
+
+
+class NetworkLog:
+    """Exchanges of one driver, built from its performance log."""
+
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self.exchanges: dict[str, Exchange] = {}
+        # Exchanges a page object waited for, in order (for the report).
+        self.observed: list[Exchange] = []
+        self._seq = 0
+
+    def poll(self) -> None:
+        """Drain the performance log into ``exchanges``."""
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            self._apply(message.get("method", ""), message.get("params", {}))
+
+    def _apply(self, method: str, params: dict) -> None:
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            request = params["request"]
+            if request_id in self.exchanges and params.get("redirectResponse"):
+                # Same requestId for every hop: follow it to the new URL.
+                self.exchanges[request_id].url = request["url"]
+                return
+            self._seq += 1
+            self.exchanges[request_id] = Exchange(
+                request_id,
+                request["url"],
+                request.get("method", "GET"),
+                params.get("type", ""),
+                self._seq,
+                params["timestamp"],
+            )
+            return
+
+        exchange = self.exchanges.get(request_id)
+        if exchange is None:
+            return
+        if method == "Network.responseReceived":
+            response = params["response"]
+            exchange.status = response.get("status")
+            timing = response.get("timing") or {}
+            if "receiveHeadersEnd" in timing:
+                exchange.server_ms = round(
+                    timing["receiveHeadersEnd"] - timing.get("sendEnd", 0.0), 1
+                )
+        elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+            exchange.total_ms = round(
+                (params["timestamp"] - exchange.started) * 1000, 1
+            )
+            exchange.error = params.get("errorText")
+
+    def mark(self) -> int:
+        """Cursor for ``wait_for``: only requests issued after this call."""
+        self.poll()
+        return self._seq
+
+    def find(
+        self,
+        pattern: Pattern[str],
+        method: Optional[str] = None,
+        since: int = 0,
+    ) -> Optional[Exchange]:
+        """First completed exchange after ``since`` whose URL matches."""
+        for exchange in self.exchanges.values():
+            if (
+                exchange.seq > since
+                and exchange.done
+                and pattern.search(exchange.url)
+                and (method is None or exchange.method == method.upper())
+            ):
+                return exchange
+        return None
+
+    def wait_for(
+        self,
+        pattern: Union[str, Pattern[str]],
+        method: Optional[str] = None,
+        since: int = 0,
+        timeout: float = 15.0,
+    ) -> Exchange:
+        """
+        Block until a request matching ``pattern`` (regex searched in the
+        URL) has completed; raises TimeoutException otherwise.
+        """
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+        deadline = time.monotonic() + timeout
+        while True:
+            self.poll()
+            exchange = self.find(regex, method, since)
+            if exchange is not None:
+                self.observed.append(exchange)
+                return exchange
+            if time.monotonic() > deadline:
+                raise TimeoutException(
+                    f"No {method or ''} request matching {regex.pattern!r}"
+                    f" completed within {timeout}s"
+                )
+            time.sleep(POLL)
+
+
+_logs: "weakref.WeakKeyDictionary[WebDriver, NetworkLog]" = weakref.WeakKeyDictionary()
+_available: "weakref.WeakKeyDictionary[WebDriver, bool]" = weakref.WeakKeyDictionary()
+
+
+def for_driver(driver: WebDriver) -> NetworkLog:
+    network = _logs.get(driver)
+    if network is None:
+        network = _logs[driver] = NetworkLog(driver)
+    return network
+
+
+def is_available(driver: WebDriver) -> bool:
+    """True when the session was started with performance logging."""
+    available = _available.get(driver)
+    if available is None:
+        try:
+            for_driver(driver).poll()
+            available = True
+        except WebDriverException:
+            available = False
+        _available[driver] = available
+    return available
+
+
+def drain_observed(driver: WebDriver) -> list[Exchange]:
+    """Return and forget the exchanges waited for on ``driver``."""
+    network = _logs.get(driver)
+    if network is None:
+        return []
+    observed, network.observed = network.observed, []
+    # Nothing else refers to the older exchanges; keep memory bounded.
+    network.exchanges.clear()
+    return observed
+
+
+def format_summary(exchanges: list[dict]) -> list[str]:
+    """Per-endpoint status and backend latency lines for a run."""
+    by_endpoint: dict[str, list[dict]] = {}
+    for exchange in exchanges:
+        endpoint = f"{exchange['method']} {exchange['url'].split('?')[0]}"
+        by_endpoint.setdefault(endpoint, []).append(exchange)
+
+    lines = []
+    for endpoint, items in sorted(by_endpoint.items()):
+        server = [e["server_ms"] for e in items if e["server_ms"] is not None]
+        statuses = sorted({str(e["status"] or e["error"]) for e in items})
+        lines.append(
+            f"{endpoint}: n={len(items)} status {'/'.join(statuses)}"
+            f" server p50 {percentile(server, 50):.0f}ms"
+            f" p95 {percentile(server, 95):.0f}ms"
+        )
+    return lines
@@ -0,0 +1,39 @@
+"""Navigation Timing figures read from the browser."""
+
+import logging
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+log = logging.getLogger(__name__)
+
+# Milliseconds relative to navigation start, rounded for compact reports.
+_NAVIGATION_TIMINGS_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+if (!nav) { return null; }
+const paint = performance.getEntriesByName('first-contentful-paint')[0];
+const r = (v) => Math.round(v);
+return {
+  url: nav.name,
+  ttfb_ms: r(nav.responseStart - nav.requestStart),
+  response_end_ms: r(nav.responseEnd),
+  dom_content_loaded_ms: r(nav.domContentLoadedEventEnd),
+  load_ms: r(nav.loadEventEnd),
+  first_contentful_paint_ms: paint ? r(paint.startTime) : null,
+  transfer_bytes: nav.transferSize,
+};
+"""
+
+
+def navigation_timings(driver: WebDriver) -> dict | None:
+    """
+    Timings of the document currently loaded in ``driver``.
+
+    Returns None when the page exposes no navigation entry (e.g.
+    about:blank) or the browser is no longer reachable.
+    """
+    try:
+        return driver.execute_script(_NAVIGATION_TIMINGS_JS)
+    except WebDriverException:
+        log.debug("Could not read navigation timings", exc_info=True)
+        return None
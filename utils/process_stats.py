@@ -0,0 +1,105 @@
+"""Resource usage of the chromedriver/Chrome process tree."""
+
+import time
+from typing import Optional
+
+import psutil
+from selenium.webdriver.remote.webdriver import WebDriver
+
+MB = 1024 * 1024
+
+
+def driver_process(driver: WebDriver) -> Optional[psutil.Process]:
+    """
+    Return the chromedriver process that owns the browser, if local.
+
+    Chrome and its renderers are children of chromedriver, so the tree
+    rooted here covers the whole browser.
+    """
+    service = getattr(driver, "service", None)
+    proc = getattr(service, "process", None)
+    pid = getattr(proc, "pid", None)
+    if pid is None:
+        return None
+    try:
+        return psutil.Process(pid)
+    except psutil.Error:
+        return None
+
+
+def process_tree(root: psutil.Process) -> list[psutil.Process]:
+    try:
+        return [root, *root.children(recursive=True)]
+    except psutil.Error:
+        return [root]
+
+
+def tree_rss_bytes(root: psutil.Process) -> int:
+    """Sum of resident set sizes over the process tree."""
+    total = 0
+    for proc in process_tree(root):
+        try:
+            total += proc.memory_info().rss
+        except psutil.Error:
+            continue
+    return total
+
+
+def tree_cpu_seconds(root: psutil.Process) -> dict[int, float]:
+    """User + system CPU time consumed so far, per PID of the tree."""
+    per_pid = {}
+    for proc in process_tree(root):
+        try:
+            times = proc.cpu_times()
+        except psutil.Error:
+            continue
+        per_pid[proc.pid] = times.user + times.system
+    return per_pid
+
+
+def cpu_seconds_since(before: dict[int, float], after: dict[int, float]) -> float:
+    """
+    CPU time the tree used between two ``tree_cpu_seconds`` snapshots.
+
+    Compared per PID: a renderer that exited in between drops out instead
+    of making the total go negative, and one started in between counts
+    in full. A reused PID with a lower total counts as 0.
+    """
+    return sum(max(0.0, cpu - before.get(pid, 0.0)) for pid, cpu in after.items())
+
+
+def js_heap_bytes(driver: WebDriver) -> Optional[int]:
+    """Used JS heap of the current page (DevTools Runtime.getHeapUsage)."""
+    try:
+        return int(driver.execute_cdp_cmd("Runtime.getHeapUsage", {})["usedSize"])
+    except Exception:  # noqa: BLE001
+        return None
+
+
+class ResourceMonitor:
+    """
+    Per-test resource usage of one browser.
+
+    Created when a test starts; ``sample()`` at the end reports current
+    RSS and JS heap plus the tree's average CPU% over the test.
+    """
+
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self.root = driver_process(driver)
+        self._started = time.monotonic()
+        self._cpu_started = tree_cpu_seconds(self.root) if self.root else {}
+
+    def sample(self) -> dict[str, Optional[float]]:
+        elapsed = max(time.monotonic() - self._started, 1e-6)
+        rss_mb = cpu_percent = None
+        if self.root is not None:
+            rss_mb = round(tree_rss_bytes(self.root) / MB, 1)
+            cpu = cpu_seconds_since(self._cpu_started, tree_cpu_seconds(self.root))
+            cpu_percent = round(cpu / elapsed * 100, 1)
+        heap = js_heap_bytes(self.driver)
+        return {
+            "rss_mb": rss_mb,
+            "cpu_percent": cpu_percent,
+            "js_heap_mb": round(heap / MB, 1) if heap is not None else None,
+        }
@@ -0,0 +1,196 @@
+"""
+Readiness-gated navigation with an early load cutoff.
+
+With ``READINESS_GATE=1`` Chrome runs with page load strategy "none", so
+``driver.get`` returns as soon as the navigation is under way.
+``BasePage.open`` then waits for the page object's readiness predicate
+(``READY_WHEN`` / ``is_ready()``) instead of the load event and, once it
+holds and when asked to (``stop_loading=True``), stops whatever is still
+loading (trackers, chat widgets, below-the-fold images) with
+``window.stop()``. The cutoff is off by default: a late script may be
+the one that wires up the form.
+
+Until the new document commits, the browser still shows the previous
+one, which may well satisfy the predicate (reopening the login page)
+or report readyState "complete". Every wait therefore first waits for
+``performance.timeOrigin`` to differ from the value read before the
+navigating action (``document_origin``).
+
+The strategy is a session capability, so it applies to every
+navigation, not just ``open()``: a link click, a form submit or a plain
+``driver.get`` also returns before the next page has loaded. Page
+objects take ``BasePage.document_mark()`` before actions that may
+navigate and call ``BasePage.wait_for_page_load(mark)`` after them;
+benchmarks load pages with ``benchmarks._support.load_page``.
+(Chromedriver blocks commands while a navigation is pending under the
+"normal" and "eager" strategies, so the early cutoff cannot be limited
+to ``open()``.)
+
+Every gated navigation is recorded against the page's own clock:
+
+- ``ready_ms`` - navigation start to the predicate holding
+- ``load_ms``  - navigation start to the load event
+- ``saved_ms`` - ``load_ms - ready_ms``
+
+When loading was stopped the load event never comes; ``load_ms`` is then
+the last full load of the same URL seen in this process (strict opens,
+or gated ones left to finish) and stays None until there is one.
+"""
+
+import weakref
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+POLL = 0.05
+
+_ORIGIN_JS = "return performance.timeOrigin;"
+_LOAD_STATE_JS = "return [performance.timeOrigin, document.readyState];"
+
+_DOCUMENT_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+return {
+  state: document.readyState,
+  origin: performance.timeOrigin,
+  now: performance.now(),
+  load: nav ? nav.loadEventEnd : 0,
+};
+"""
+
+
+@dataclass
+class Navigation:
+    url: str
+    strict: bool
+    ready_ms: float
+    load_ms: Optional[float] = None
+    stopped: bool = False
+    # performance.timeOrigin: identifies the document the record is about.
+    origin: float = 0.0
+
+    @property
+    def saved_ms(self) -> Optional[float]:
+        if self.load_ms is None:
+            return None
+        return round(max(0.0, self.load_ms - self.ready_ms), 1)
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        del data["origin"]
+        data["saved_ms"] = self.saved_ms
+        return data
+
+
+_records: "weakref.WeakKeyDictionary[WebDriver, list[Navigation]]" = (
+    weakref.WeakKeyDictionary()
+)
+# URL -> most recent full page load (ms from navigation start).
+_full_load_ms: dict[str, float] = {}
+
+
+def is_gated(driver: WebDriver) -> bool:
+    """True when the session uses page load strategy "none"."""
+    return driver.capabilities.get("pageLoadStrategy") == "none"
+
+
+def _document(driver: WebDriver) -> dict:
+    return driver.execute_script(_DOCUMENT_JS)
+
+
+def document_origin(driver: WebDriver) -> float:
+    """performance.timeOrigin of the current document (identifies it)."""
+    return driver.execute_script(_ORIGIN_JS)
+
+
+def is_new_document(driver: WebDriver, previous_origin: Optional[float]) -> bool:
+    """True once the document is no longer the one ``previous_origin`` names."""
+    return previous_origin is None or document_origin(driver) != previous_origin
+
+
+def wait_for_new_document(
+    driver: WebDriver, previous_origin: float, timeout: float
+) -> None:
+    """Block until a new document has committed (TimeoutException)."""
+    WebDriverWait(driver, timeout, POLL).until(
+        lambda d: is_new_document(d, previous_origin)
+    )
+
+
+def wait_for_load(
+    driver: WebDriver, timeout: float, previous_origin: Optional[float] = None
+) -> None:
+    """
+    Block until document.readyState is "complete" (TimeoutException).
+
+    With ``previous_origin``, the old document's "complete" does not
+    count: the new one must have committed and loaded.
+    """
+
+    def loaded(d: WebDriver) -> bool:
+        origin, state = d.execute_script(_LOAD_STATE_JS)
+        return origin != previous_origin and state == "complete"
+
+    WebDriverWait(driver, timeout, POLL).until(loaded)
+
+
+def record(
+    driver: WebDriver, url: str, strict: bool, stop_loading: bool = False
+) -> Navigation:
+    """
+    Record the navigation ``driver`` just finished waiting for.
+
+    Called once the readiness predicate (or, for strict opens, the load
+    event) holds; stops the remaining loading when asked to.
+    """
+    doc = _document(driver)
+    nav = Navigation(url, strict, round(doc["now"], 1), origin=doc["origin"])
+    if doc["state"] == "complete" and doc["load"]:
+        nav.load_ms = round(doc["load"], 1)
+        _full_load_ms[url] = nav.load_ms
+    elif stop_loading:
+        driver.execute_script("window.stop();")
+        nav.stopped = True
+        nav.load_ms = _full_load_ms.get(url)
+    _records.setdefault(driver, []).append(nav)
+    return nav
+
+
+def drain(driver: WebDriver) -> list[Navigation]:
+    """
+    Return and forget the navigations recorded for ``driver``.
+
+    A gated navigation that was left loading is resolved first if its
+    document has since fired the load event.
+    """
+    navs = _records.pop(driver, [])
+    pending = [n for n in navs if n.load_ms is None and not n.stopped]
+    if pending:
+        doc = _document(driver)
+        last = pending[-1]
+        if doc["origin"] == last.origin and doc["load"]:
+            last.load_ms = round(doc["load"], 1)
+            _full_load_ms[last.url] = last.load_ms
+    return navs
+
+
+def format_summary(navs: list[dict]) -> list[str]:
+    """Terminal summary lines for the navigation dicts of a run."""
+    gated = [n for n in navs if not n["strict"]]
+    if not gated:
+        return []
+    stopped = sum(1 for n in gated if n["stopped"])
+    known = [n["saved_ms"] for n in gated if n["saved_ms"] is not None]
+    lines = [
+        f"{len(gated)} gated navigations ({stopped} stopped early),"
+        f" {len(navs) - len(gated)} strict"
+    ]
+    if known:
+        lines.append(
+            f"saved {sum(known) / 1000:.1f}s in total, {sum(known) / len(known):.0f}ms"
+            f" per navigation ({len(known)} with a known full load time)"
+        )
+    else:
+        lines.append("time saved unknown: no full load seen for the gated URLs")
+    return lines
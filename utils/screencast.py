@@ -0,0 +1,166 @@
+"""
+Low-resolution screencast kept in a bounded in-memory ring buffer.
+
+A background thread captures small JPEG frames through DevTools
+(``Page.captureScreenshot`` with a scaled clip) at a fixed rate and keeps
+only the last ``seconds`` worth. Nothing touches the disk unless
+``save_gif`` is called, so passing tests only pay for the capture.
+
+The DevTools screencast itself (``Page.startScreencast``) delivers frames
+as events, which ``execute_cdp_cmd`` cannot receive; polling gives the
+same result at a predictable frame rate.
+"""
+
+import base64
+import io
+import logging
+import pathlib
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+log = logging.getLogger(__name__)
+
+# Refresh the viewport size (for the capture clip) every N frames.
+_METRICS_EVERY = 10
+
+
+class ScreencastBuffer:
+    """
+    Ring buffer of the most recent frames of one driver.
+
+    - ``seconds`` x ``fps`` frames are kept; older ones are dropped.
+    - Frames are scaled to at most ``max_width`` CSS pixels wide.
+    """
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        seconds: float = 5.0,
+        fps: float = 4.0,
+        max_width: int = 480,
+        quality: int = 40,
+    ):
+        self.driver = driver
+        self.fps = fps
+        self.max_width = max_width
+        self.quality = quality
+        self.frames: "deque[tuple[float, bytes]]" = deque(
+            maxlen=max(1, round(seconds * fps))
+        )
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._clip: Optional[dict] = None
+        self.captured = 0
+        self.capture_seconds = 0.0
+        self.thread_cpu_seconds = 0.0
+        self.peak_buffer_bytes = 0
+        self.encode_seconds = 0.0
+
+    def start(self) -> "ScreencastBuffer":
+        self._thread = threading.Thread(
+            target=self._run, name="screencast", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _refresh_clip(self) -> None:
+        metrics = self.driver.execute_cdp_cmd("Page.getLayoutMetrics", {})
+        viewport = metrics.get("cssVisualViewport") or metrics["visualViewport"]
+        width = viewport["clientWidth"]
+        self._clip = {
+            "x": viewport.get("pageX", 0),
+            "y": viewport.get("pageY", 0),
+            "width": width,
+            "height": viewport["clientHeight"],
+            "scale": min(1.0, self.max_width / width) if width else 1.0,
+        }
+
+    def _capture(self) -> None:
+        if self._clip is None or self.captured % _METRICS_EVERY == 0:
+            self._refresh_clip()
+        result = self.driver.execute_cdp_cmd(
+            "Page.captureScreenshot",
+            {
+                "format": "jpeg",
+                "quality": self.quality,
+                "clip": self._clip,
+                "optimizeForSpeed": True,
+            },
+        )
+        self.frames.append((time.monotonic(), base64.b64decode(result["data"])))
+        self.captured += 1
+        size = sum(len(frame) for _, frame in self.frames)
+        self.peak_buffer_bytes = max(self.peak_buffer_bytes, size)
+
+    def _run(self) -> None:
+        interval = 1.0 / self.fps
+        cpu_started = time.thread_time()
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self._capture()
+            except Exception:  # noqa: BLE001
+                # Page navigating or driver gone; try again next tick.
+                log.debug("Screencast frame failed", exc_info=True)
+            elapsed = time.monotonic() - started
+            self.capture_seconds += elapsed
+            self._stop.wait(max(0.0, interval - elapsed))
+        self.thread_cpu_seconds = time.thread_time() - cpu_started
+
+    def overhead(self) -> dict:
+        """Capture cost for the report (times in ms, sizes in KB)."""
+        return {
+            "frames": self.captured,
+            "capture_ms_total": round(self.capture_seconds * 1000, 1),
+            "capture_ms_mean": (
+                round(self.capture_seconds * 1000 / self.captured, 1)
+                if self.captured
+                else 0.0
+            ),
+            "thread_cpu_ms": round(self.thread_cpu_seconds * 1000, 1),
+            "peak_buffer_kb": round(self.peak_buffer_bytes / 1024, 1),
+            "encode_ms": round(self.encode_seconds * 1000, 1),
+        }
+
+    def save_gif(self, path: pathlib.Path) -> Optional[pathlib.Path]:
+        """
+        Encode the buffered frames as an animated GIF at ``path``.
+
+        Frame durations follow the capture timestamps. Returns None when
+        the buffer is empty.
+        """
+        frames = list(self.frames)
+        if not frames:
+            return None
+        from PIL import Image  # only needed when a test failed
+
+        started = time.perf_counter()
+        images = [
+            Image.open(io.BytesIO(data)).convert("P", palette=Image.Palette.ADAPTIVE)
+            for _, data in frames
+        ]
+        stamps = [stamp for stamp, _ in frames]
+        durations = [
+            max(20, round((b - a) * 1000)) for a, b in zip(stamps, stamps[1:])
+        ] + [round(1000 / self.fps)]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        images[0].save(
+            path,
+            save_all=True,
+            append_images=images[1:],
+            duration=durations,
+            loop=0,
+            optimize=True,
+        )
+        self.encode_seconds = time.perf_counter() - started
+        return path
@@ -0,0 +1,82 @@
+"""Small statistics helpers for benchmark and timing reports."""
+
+import math
+import statistics
+from typing import Sequence
+
+# Two-sided 95% Student t critical values by degrees of freedom.
+# Above 30 degrees of freedom the normal approximation (1.96) is used.
+_T_95 = {
+    1: 12.706,
+    2: 4.303,
+    3: 3.182,
+    4: 2.776,
+    5: 2.571,
+    6: 2.447,
+    7: 2.365,
+    8: 2.306,
+    9: 2.262,
+    10: 2.228,
+    12: 2.179,
+    15: 2.131,
+    20: 2.086,
+    25: 2.060,
+    30: 2.042,
+}
+
+
+def _t_critical(dof: int) -> float:
+    if dof > 30:
+        return 1.96
+    # Use the closest tabulated value at or below dof (conservative).
+    key = max(k for k in _T_95 if k <= dof)
+    return _T_95[key]
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """
+    Linear-interpolated percentile (pct in 0..100).
+
+    Returns 0.0 for an empty sequence.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return float(ordered[0])
+    rank = (pct / 100.0) * (len(ordered) - 1)
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return float(ordered[low])
+    frac = rank - low
+    return ordered[low] + (ordered[high] - ordered[low]) * frac
+
+
+def mean_ci(samples: Sequence[float]) -> tuple[float, float]:
+    """
+    Return (mean, half-width of the 95% confidence interval).
+
+    With fewer than two samples the half-width is 0.0.
+    """
+    if not samples:
+        return 0.0, 0.0
+    mean = statistics.fmean(samples)
+    if len(samples) < 2:
+        return mean, 0.0
+    stderr = statistics.stdev(samples) / math.sqrt(len(samples))
+    return mean, _t_critical(len(samples) - 1) * stderr
+
+
+def summarize(samples: Sequence[float]) -> dict[str, float]:
+    """Summary used by benchmark JSON output."""
+    mean, half = mean_ci(samples)
+    return {
+        "n": len(samples),
+        "mean": mean,
+        "ci95": half,
+        "min": min(samples) if samples else 0.0,
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "max": max(samples) if samples else 0.0,
+    }
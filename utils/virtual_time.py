@@ -0,0 +1,77 @@
+"""
+DevTools virtual time: pause page timers or fast-forward them.
+
+Once virtual time is enabled for a page, ``setTimeout``/``setInterval``,
+``Date.now()`` and ``performance.now()`` follow a virtual clock that only
+moves when a budget is granted. Timers due inside the budget fire in
+order, as fast as the page can run them, so a 60 s countdown or a 500 ms
+debounce elapses in milliseconds of wall time.
+
+Virtual time cannot be switched back to the real clock for the same
+page; a driver that used it should not be reused by other tests (the
+session browser is recycled, see conftest._SessionBrowser).
+"""
+
+import time
+import weakref
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# Drivers whose current target runs on virtual time.
+_enabled: "weakref.WeakSet[WebDriver]" = weakref.WeakSet()
+
+POLL = 0.02
+
+
+def is_enabled(driver: WebDriver) -> bool:
+    return driver in _enabled
+
+
+def forget(driver: WebDriver) -> None:
+    """The virtual-time page is gone (e.g. its browser context closed)."""
+    _enabled.discard(driver)
+
+
+def _page_now_ms(driver: WebDriver) -> float:
+    return float(driver.execute_script("return performance.now();"))
+
+
+def pause(driver: WebDriver) -> None:
+    """Stop the page clock; pending timers wait for ``advance``."""
+    driver.execute_cdp_cmd("Emulation.setVirtualTimePolicy", {"policy": "pause"})
+    _enabled.add(driver)
+
+
+def advance(
+    driver: WebDriver,
+    seconds: float,
+    wait_for_network: bool = False,
+    timeout: float = 10.0,
+) -> None:
+    """
+    Move the page clock forward by ``seconds`` and return once the page
+    has reached that virtual time (the clock is paused again afterwards).
+
+    With ``wait_for_network`` the clock does not move while requests are
+    in flight, so responses land at the same virtual time on every run.
+
+    Raises TimeoutException if the budget is not consumed within
+    ``timeout`` seconds of wall time.
+    """
+    budget_ms = seconds * 1000
+    target = _page_now_ms(driver) + budget_ms
+    policy = "pauseIfNetworkFetchesPending" if wait_for_network else "advance"
+    driver.execute_cdp_cmd(
+        "Emulation.setVirtualTimePolicy", {"policy": policy, "budget": budget_ms}
+    )
+    _enabled.add(driver)
+
+    deadline = time.monotonic() + timeout
+    # Allow for clock granularity: performance.now() is coarsened.
+    while _page_now_ms(driver) < target - 1:
+        if time.monotonic() > deadline:
+            raise TimeoutException(
+                f"Virtual time did not advance {seconds}s within {timeout}s"
+            )
+        time.sleep(POLL)
@@ -0,0 +1,51 @@
+"""Counting of WebDriver wire commands issued through a driver."""
+
+import contextlib
+import time
+from collections import Counter
+from typing import Iterator
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class CommandCounter:
+    """Per-command counts and time spent in ``driver.execute``."""
+
+    def __init__(self) -> None:
+        self.counts: Counter[str] = Counter()
+        self.seconds = 0.0
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+@contextlib.contextmanager
+def count_commands(driver: WebDriver) -> Iterator[CommandCounter]:
+    """
+    Count every command sent through ``driver`` inside the block.
+
+    ``WebDriver.execute`` is the single choke point for all commands
+    (find, click, script, navigation, ...), so it is wrapped on the
+    instance and restored on exit.
+    """
+    counter = CommandCounter()
+    original = driver.execute
+    wrapped_already = "execute" in vars(driver)
+
+    def _execute(driver_command: str, params: dict | None = None):
+        counter.counts[driver_command] += 1
+        started = time.perf_counter()
+        try:
+            return original(driver_command, params)
+        finally:
+            counter.seconds += time.perf_counter() - started
+
+    driver.execute = _execute  # type: ignore[method-assign]
+    try:
+        yield counter
+    finally:
+        if wrapped_already:
+            driver.execute = original  # type: ignore[method-assign]
+        else:
+            del driver.execute